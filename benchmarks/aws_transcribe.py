@@ -0,0 +1,131 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of `AWSTranscribeSource` against the `reformat_aws_asr` notebook.
+
+Both parse the JSON file the same way, so the parsing time is reported apart from
+the conversion time. The notebook reopens its output file for every speaker turn,
+the source object merges the items in memory:
+
+    python benchmarks/aws_transcribe.py --sizes 50000 100000 200000 400000
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from wordcab.core_objects.utils import _get_aws_transcribe_utterances
+from wordcab.serialization import loads
+
+
+def _aws_json(size: int) -> Dict[str, Any]:
+    """Build an AWS Transcribe json object with random speaker turns."""
+    rng = random.Random(size)
+    items: List[Dict[str, Any]] = []
+    speaker = "spk_0"
+    for i in range(size):
+        if rng.random() < 0.05:
+            speaker = f"spk_{rng.randint(0, 3)}"
+        items.append(
+            {
+                "start_time": f"{i * 0.4:.2f}",
+                "end_time": f"{i * 0.4 + 0.3:.2f}",
+                "alternatives": [{"confidence": "0.99", "content": f"word{i}"}],
+                "type": "pronunciation",
+                "speaker_label": speaker,
+            }
+        )
+    segments = [{"speaker_label": f"spk_{i}"} for i in range(4)]
+    return {"speaker_labels": {"speakers": 4, "segments": segments}, "items": items}
+
+
+def _notebook(data: Dict[str, Any], output: Path) -> None:
+    """Convert the json object like the `reformat_aws_asr` notebook."""
+    speaker_labels = list(
+        set([label["speaker_label"] for label in data["speaker_labels"]["segments"]])
+    )
+    speaker_map = {
+        speaker: chr(ord("A") + i) for i, speaker in enumerate(speaker_labels)
+    }
+
+    utterance = None
+    speaker = None
+    for item in data["items"]:
+        if not speaker:
+            speaker = item["speaker_label"]
+            utterance = item["alternatives"][0]["content"]
+        elif speaker == item["speaker_label"]:
+            utterance += " " + item["alternatives"][0]["content"]
+        else:
+            with open(output, "a") as f:
+                f.write(f"SPEAKER {speaker_map[speaker]}: {utterance}\n")
+            speaker = item["speaker_label"]
+            utterance = item["alternatives"][0]["content"]
+
+
+def _source(data: Dict[str, Any]) -> None:
+    """Convert the json object like `AWSTranscribeSource`."""
+    [
+        f"SPEAKER {speaker}: {text}"
+        for _, _, speaker, text in _get_aws_transcribe_utterances(data)
+    ]
+
+
+def main() -> None:
+    """Print the parsing and conversion times for each number of items."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[50_000, 100_000, 200_000, 400_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'items':>10}{'parsing':>12}{'notebook':>12}{'source':>12}{'per item':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "results.txt"
+        for size in args.sizes:
+            content = json.dumps(_aws_json(size)).encode("utf-8")
+            timings: Dict[str, List[float]] = {
+                "parsing": [],
+                "notebook": [],
+                "source": [],
+            }
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                data = loads(content)
+                timings["parsing"].append(time.perf_counter() - start)
+
+                output.unlink(missing_ok=True)
+                start = time.perf_counter()
+                _notebook(data, output)
+                timings["notebook"].append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                _source(data)
+                timings["source"].append(time.perf_counter() - start)
+
+            parsing, notebook, source = (min(t) for t in timings.values())
+            print(
+                f"{size:>10}{parsing * 1e3:>10.1f}ms{notebook * 1e3:>10.1f}ms"
+                f"{source * 1e3:>10.1f}ms{source / size * 1e9:>10.0f}ns"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of `format_deepgram_source` on synthetic Deepgram transcripts.
+
+The time per utterance stays constant when the number of utterances grows:
+
+    python benchmarks/format_deepgram.py --sizes 25000 50000 100000 200000
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List
+
+from wordcab.utils import format_deepgram_source
+
+
+def _deepgram_json(size: int) -> Dict[str, Any]:
+    """Build a Deepgram json object with random speakers."""
+    rng = random.Random(size)
+    utterances: List[Dict[str, Any]] = [
+        {"speaker": rng.randint(0, 3), "transcript": f"Utterance number {i}."}
+        for i in range(size)
+    ]
+    return {"results": {"utterances": utterances}}
+
+
+def main() -> None:
+    """Print the formatting time for each number of utterances."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[25_000, 50_000, 100_000, 200_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'utterances':>12}{'lines':>10}{'time':>12}{'per utterance':>16}")
+    for size in args.sizes:
+        timings = []
+        for _ in range(args.repeat):
+            deepgram_json = _deepgram_json(size)
+            start = time.perf_counter()
+            lines = format_deepgram_source(deepgram_json)
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        print(
+            f"{size:>12}{len(lines):>10}{best * 1e3:>10.1f}ms"
+            f"{best / size * 1e9:>14.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark of the JSON serialization backends on the test samples.
+
+Run from the root of the repository, with and without `orjson` installed:
+
+    python benchmarks/serialization.py
+"""
+
+import argparse
+import json
+import timeit
+from pathlib import Path
+
+from wordcab import serialization
+
+SAMPLES = [
+    "tests/assembly_sample.json",
+    "tests/deepgram_sample.json",
+    "tests/rev_sample.json",
+    "tests/sample_1.json",
+]
+
+
+def _best(stmt, number: int, repeat: int) -> float:
+    """Get the best time of a statement, in microseconds per call."""
+    return min(timeit.repeat(stmt, number=number, repeat=repeat)) / number * 1e6
+
+
+def main() -> None:
+    """Print the loads and dumps time of the stdlib and of the SDK backend."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Backend: {serialization.BACKEND}")
+    print(
+        f"{'sample':<24}{'size':>10}{'json.loads':>14}{'loads':>10}"
+        f"{'json.dumps':>14}{'dumps':>10}"
+    )
+    for sample in SAMPLES:
+        content = Path(sample).read_bytes()
+        obj = json.loads(content)
+        timings = [
+            _best(lambda c=content: json.loads(c), args.number, args.repeat),
+            _best(lambda c=content: serialization.loads(c), args.number, args.repeat),
+            _best(lambda o=obj: json.dumps(o), args.number, args.repeat),
+            _best(lambda o=obj: serialization.dumps(o), args.number, args.repeat),
+        ]
+        print(
+            f"{Path(sample).name:<24}{len(content):>10}"
+            f"{timings[0]:>12.1f}us{timings[1]:>8.1f}us"
+            f"{timings[2]:>12.1f}us{timings[3]:>8.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
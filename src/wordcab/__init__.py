@@ -16,6 +16,7 @@
 
 from .api import (
     change_speaker_labels,
+    close_default_clients,
     delete_job,
     get_stats,
     list_jobs,
@@ -28,6 +29,8 @@ from .api import (
     start_extract,
     start_summary,
     start_transcription,
+    wait_for_job,
+    wait_for_jobs,
 )
 from .client import Client
 from .login import get_token, login
@@ -35,6 +38,7 @@ from .login import get_token, login
 __all__ = [
     "Client",
     "change_speaker_labels",
+    "close_default_clients",
     "delete_job",
     "get_stats",
     "get_token",
@@ -49,6 +53,8 @@ __all__ = [
     "start_extract",
     "start_summary",
     "start_transcription",
+    "wait_for_job",
+    "wait_for_jobs",
 ]
 
 __version__ = "0.7.2"
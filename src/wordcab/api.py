@@ -14,11 +14,14 @@
 
 """Wordcab API mapping functions."""
 
-from typing import Dict, List, Optional, Union, no_type_check
+import atexit
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Union, no_type_check
 
 from .client import Client
 from .core_objects import (
     AudioSource,
+    BaseJob,
     BaseSource,
     BaseSummary,
     BaseTranscript,
@@ -33,6 +36,45 @@ from .core_objects import (
     WordcabTranscriptSource,
     YoutubeSource,
 )
+from .polling import PollingPolicy
+
+_default_clients: Dict[Optional[str], Client] = {}
+_default_clients_lock = threading.Lock()
+
+
+def _get_default_client(api_key: Optional[str] = None) -> Client:
+    """
+    Get the process-wide client for an API key, creating it on first use.
+
+    The client is shared by all threads, so its pooled connections and the
+    credentials resolved at creation time are reused by every call.
+    """
+    client = _default_clients.get(api_key)
+    if client is None:
+        with _default_clients_lock:
+            client = _default_clients.get(api_key)
+            if client is None:
+                client = Client(api_key=api_key)
+                _default_clients[api_key] = client
+
+    return client
+
+
+@atexit.register
+def close_default_clients() -> None:
+    """
+    Close the shared clients used by the module-level functions.
+
+    The next call to any of the functions will create a new client, which
+    is useful after a `wordcab login` or a change of the WORDCAB_API_KEY
+    environment variable.
+    """
+    with _default_clients_lock:
+        clients = list(_default_clients.values())
+        _default_clients.clear()
+
+    for client in clients:
+        client.close()
 
 
 @no_type_check
@@ -52,9 +94,8 @@ def request(
     SummarizeJob,
     Union[ExtractJob, SummarizeJob],
 ]:
-    """Make a request to the Wordcab API."""
-    with Client(api_key=api_key) as client:
-        return client.request(method=method, **kwargs)
+    """Make a request to the Wordcab API using the shared client of the API key."""
+    return _get_default_client(api_key).request(method=method, **kwargs)
 
 
 @no_type_check
@@ -110,6 +151,7 @@ def start_extract(
     ],
     split_long_utterances: bool = False,
     tags: Optional[Union[str, List[str]]] = None,
+    idempotency_key: Optional[str] = None,
     api_key: Optional[str] = None,
 ) -> ExtractJob:
     """
@@ -134,6 +176,10 @@ def start_extract(
         Whether to split long utterances into multiple shorter utterances. The default is False.
     tags : str or list of str, optional
         The tags to add to the job. The default is None. If None, no tags will be added.
+    idempotency_key : str, optional
+        A key identifying the job creation, sent in the `Idempotency-Key` header. The
+        default is None. A job creation with a key is retried after a timeout, and
+        starting a job again with the same key returns the job already created.
     api_key : str, optional
         The API key to use. The default is None. If None, the API key will be
         automatically retrieved from the environment variable WORDCAB_API_KEY.
@@ -152,6 +198,7 @@ def start_extract(
         pipelines=pipelines,
         split_long_utterances=split_long_utterances,
         tags=tags,
+        idempotency_key=idempotency_key,
         api_key=api_key,
     )
 
@@ -170,6 +217,7 @@ def start_summary(
     summary_lens: Optional[Union[int, List[int]]] = None,
     target_lang: Optional[str] = None,
     tags: Optional[Union[str, List[str]]] = None,
+    idempotency_key: Optional[str] = None,
     api_key: Optional[str] = None,
 ) -> SummarizeJob:
     """
@@ -207,6 +255,10 @@ def start_summary(
         The language of the resulting summary. If None, the language will be `en` (English) by default.
     tags : str or list of str, optional
         The tags to add to the job. The default is None. If None, no tags will be added.
+    idempotency_key : str, optional
+        A key identifying the job creation, sent in the `Idempotency-Key` header. The
+        default is None. A job creation with a key is retried after a timeout, and
+        starting a job again with the same key returns the job already created.
     api_key : str, optional
         The API key to use. The default is None. If None, the API key will be
         automatically retrieved from the environment variable WORDCAB_API_KEY.
@@ -230,6 +282,7 @@ def start_summary(
         summary_lens=summary_lens,
         target_lang=target_lang,
         tags=tags,
+        idempotency_key=idempotency_key,
         api_key=api_key,
     )
 
@@ -243,6 +296,7 @@ def start_transcription(
     ephemeral_data: bool = False,
     only_api: bool = True,
     tags: Union[str, List[str], None] = None,
+    idempotency_key: Optional[str] = None,
     api_key: Union[str, None] = None,
 ) -> TranscribeJob:
     """
@@ -266,6 +320,10 @@ def start_transcription(
         Whether to only use the API to transcribe the audio. The default is True.
     tags : str or list of str, optional
         The tags to add to the job. The default is None. If None, no tags will be added.
+    idempotency_key : str, optional
+        A key identifying the job creation, sent in the `Idempotency-Key` header. The
+        default is None. A job creation with a key is retried after a timeout, and
+        starting a job again with the same key returns the job already created.
     api_key : str, optional
         The API key to use. The default is None. If None, the API key will be
         automatically retrieved from the environment variable WORDCAB_API_KEY.
@@ -284,6 +342,7 @@ def start_transcription(
         ephemeral_data=ephemeral_data,
         only_api=only_api,
         tags=tags,
+        idempotency_key=idempotency_key,
         api_key=api_key,
     )
 
@@ -348,6 +407,80 @@ def retrieve_job(
     return request(method="retrieve_job", job_name=job_name, api_key=api_key)
 
 
+@no_type_check
+def wait_for_job(
+    job: Union[str, BaseJob],
+    timeout: Optional[float] = None,
+    policy: Optional[PollingPolicy] = None,
+    api_key: Optional[str] = None,
+) -> Union[ExtractJob, SummarizeJob]:
+    """
+    Wait for a job to finish, polling it less often while its status is unchanged.
+
+    Parameters
+    ----------
+    job : str or BaseJob
+        The name of the job, or the job returned by a `start_*` function.
+    timeout : float, optional
+        The maximum time to wait, in seconds. The default is None, meaning no limit.
+    policy : PollingPolicy, optional
+        The polling intervals. The default is None, meaning the default policy.
+    api_key : str, optional
+        The API key to use. The default is None. If None, the API key will be
+        automatically retrieved from the environment variable WORDCAB_API_KEY.
+
+    Returns
+    -------
+    ExtractJob or SummarizeJob
+        The finished job. Check its `job_status`, the job may have failed.
+    """
+    return request(
+        method="wait_for_job", job=job, timeout=timeout, policy=policy, api_key=api_key
+    )
+
+
+@no_type_check
+def wait_for_jobs(
+    jobs: Iterable[Union[str, BaseJob]],
+    timeout: Optional[float] = None,
+    policy: Optional[PollingPolicy] = None,
+    page_size: int = 100,
+    api_key: Optional[str] = None,
+) -> Iterator[Union[ExtractJob, SummarizeJob]]:
+    """
+    Wait for several jobs to finish, yielding each job as soon as it finishes.
+
+    The statuses of the jobs are refreshed in bulk with the pages of `list_jobs`.
+
+    Parameters
+    ----------
+    jobs : Iterable[str or BaseJob]
+        The names of the jobs, or the jobs returned by the `start_*` functions.
+    timeout : float, optional
+        The maximum time to wait, in seconds. The default is None, meaning no limit.
+    policy : PollingPolicy, optional
+        The polling intervals. The default is None, meaning the default policy.
+    page_size : int
+        The number of jobs of the pages of `list_jobs`. The default is 100.
+    api_key : str, optional
+        The API key to use. The default is None. If None, the API key will be
+        automatically retrieved from the environment variable WORDCAB_API_KEY.
+
+    Returns
+    -------
+    Iterator[ExtractJob or SummarizeJob]
+        The finished jobs, in order of completion.
+    """
+    return request(
+        method="wait_for_jobs",
+        jobs=jobs,
+        timeout=timeout,
+        policy=policy,
+        page_size=page_size,
+        api_key=api_key,
+    )
+
+
 @no_type_check
 def delete_job(
     job_name: str, warning: bool = True, api_key: Optional[str] = None
@@ -0,0 +1,666 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API asynchronous Client."""
+
+import asyncio
+import logging
+import time
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+    no_type_check,
+)
+
+import httpx
+
+from .cache import TranscriptCache, hash_source
+from .client import APIRequest, BaseClient
+from .concurrency import AdaptiveConcurrencyLimiter
+from .config import (
+    API_BASE_URL,
+    ASYNC_MAX_CONNECTIONS,
+    ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+    UPLOAD_MAX_WORKERS,
+    UPLOAD_PART_SIZE,
+)
+from .core_objects import (
+    AudioSource,
+    BaseJob,
+    BaseSource,
+    BaseSummary,
+    BaseTranscript,
+    ExtractJob,
+    InMemorySource,
+    ListJobs,
+    ListSummaries,
+    ListTranscripts,
+    Stats,
+    SummarizeJob,
+    TranscribeJob,
+    WordcabTranscriptSource,
+    YoutubeSource,
+)
+from .core_objects.utils import _load_json_stream
+from .polling import JobWaiter, PollingPolicy
+from .rate_limit import RateLimiter
+from .retry import AttemptRecord, RetryPolicy
+from .streaming import UploadStream, spool_async_chunks
+from .upload import ChunkedUpload, UploadPart, read_part
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient(BaseClient):
+    """
+    Wordcab API asynchronous Client.
+
+    All the requests sent by the client share one pooled `httpx.AsyncClient`, so
+    thousands of concurrent coroutines can use the same client on a single event loop.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from wordcab.async_client import AsyncClient
+
+    >>> async def main():
+    ...     async with AsyncClient() as client:
+    ...         return await asyncio.gather(
+    ...             *[client.retrieve_job(job_name) for job_name in job_names]
+    ...         )
+    >>> jobs = asyncio.run(main())  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        max_connections: int = ASYNC_MAX_CONNECTIONS,
+        max_keepalive_connections: int = ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        on_attempt: Optional[Callable[[AttemptRecord], None]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        base_url: str = API_BASE_URL,
+        transcript_cache: Optional[TranscriptCache] = None,
+        gzip_min_size: Optional[int] = None,
+        stream_responses: bool = False,
+        polling_policy: Optional[PollingPolicy] = None,
+        idempotency_keys: bool = False,
+    ):
+        """
+        Initialize the client.
+
+        Parameters
+        ----------
+        api_key : str, optional
+            The API key to use. The default is None. If None, the API key will be
+            automatically retrieved from the environment variable WORDCAB_API_KEY.
+        max_connections : int
+            The maximum number of concurrent connections. Requests above this limit
+            wait for a free connection. The default is 100.
+        max_keepalive_connections : int
+            The maximum number of idle connections kept alive. The default is 20.
+        transport : httpx.AsyncBaseTransport, optional
+            A custom httpx transport, e.g. `httpx.MockTransport` for testing.
+            The default is None.
+        retry_policy : RetryPolicy, optional
+            The policy used to retry transient failures. The default is None. If None,
+            idempotent requests are retried up to 3 times on 429, 502, 503 and 504
+            responses and on connection errors.
+        on_attempt : Callable[[AttemptRecord], None], optional
+            A callback receiving the timing and outcome of every attempt of every
+            request, useful to tune the retry policy. The default is None.
+        rate_limiter : RateLimiter, optional
+            A client-side rate limiter delaying the requests, including the retries,
+            to stay under the API limits. It can be shared by several clients.
+            The default is None.
+        concurrency_limiter : AdaptiveConcurrencyLimiter, optional
+            An adaptive limit of the concurrent job submissions (`start_extract`,
+            `start_summary` and `start_transcription`), adjusted to the API load.
+            The default is None.
+        base_url : str
+            The base URL of the API. The default is `https://wordcab.com/api/v1`.
+        transcript_cache : TranscriptCache, optional
+            A local cache of the transcripts of the submitted sources. The summary
+            and extraction jobs of a source already transcribed reuse its transcript
+            instead of uploading it again. The default is None.
+        gzip_min_size : int, optional
+            The size, in bytes, from which the JSON bodies of `start_extract` and
+            `start_summary` are sent compressed with gzip. Transcripts compress 5 to
+            10 times, which speeds up the uploads on a slow uplink. The default is
+            None, meaning no compression. The compression runs in the default
+            executor, so it doesn't block the event loop.
+        stream_responses : bool
+            Whether to decode the transcripts, summaries and pages of jobs,
+            transcripts and summaries one item at a time while they are downloaded,
+            instead of decoding the whole response at once. The default is False.
+            Use it for the largest transcripts: the raw body, the decoded JSON and
+            the core objects then don't coexist in memory. The
+            body is spooled to a temporary file, on disk above 8 MiB, and decoded in
+            the default executor.
+        polling_policy : PollingPolicy, optional
+            The default polling intervals of `wait_for_job` and `wait_for_jobs`. The
+            default is None. If None, a job is polled after 2 seconds, then less and
+            less often while its status doesn't change, up to every 60 seconds.
+        idempotency_keys : bool
+            Whether to send the job creations without an `idempotency_key` with a
+            key derived from the content of the source and the job parameters. The
+            default is False. The job creations with a key are retried like the
+            idempotent requests, and the jobs they create are remembered: starting
+            a job again with the same key returns the job already created.
+        """
+        super().__init__(
+            api_key=api_key,
+            retry_policy=retry_policy,
+            on_attempt=on_attempt,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            base_url=base_url,
+            transcript_cache=transcript_cache,
+            gzip_min_size=gzip_min_size,
+            stream_responses=stream_responses,
+            polling_policy=polling_policy,
+            idempotency_keys=idempotency_keys,
+        )
+        if max_connections < 1 or max_keepalive_connections < 0:
+            raise ValueError(
+                "`max_connections` must be a positive integer and"
+                " `max_keepalive_connections` can't be negative."
+            )
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=self.timeout,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: Optional[Union[ValueError, TypeError, AssertionError]],
+        exception_value: Optional[Exception],
+        traceback: Optional[Exception],
+    ) -> None:
+        """Exit the client context."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and release the pooled connections."""
+        await self.http_client.aclose()
+
+    async def _send(self, request: APIRequest) -> httpx.Response:
+        """Send a single attempt of a request with the HTTP client."""
+        kwargs: Dict[str, Any] = {}
+        if request.params is not None:
+            kwargs["params"] = {
+                key: value for key, value in request.params.items() if value is not None
+            }
+        if request.files is not None:
+            kwargs["files"] = request.files
+        elif isinstance(request.data, UploadStream):
+            kwargs["content"] = request.data.aiter_chunks()
+        elif request.data is not None:
+            kwargs["content"] = request.data
+        if request.json is not None:
+            kwargs["json"] = request.json
+
+        limiter = self._get_concurrency_limiter(request)
+        if limiter is not None:
+            await limiter.acquire_async()
+        start = time.monotonic()
+        r, timed_out = None, False
+        try:
+            r = await self.http_client.send(
+                self.http_client.build_request(
+                    request.method, request.url, headers=request.headers, **kwargs
+                ),
+                stream=self._streams(request),
+            )
+        except httpx.TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            self._release_concurrency(limiter, start, r, timed_out)
+
+        return r
+
+    @staticmethod
+    async def _decode_stream(request: APIRequest, body: BinaryIO) -> Any:
+        """Decode a spooled response body in the default executor."""
+        loop = asyncio.get_running_loop()
+        with body:
+            return await loop.run_in_executor(
+                None, _load_json_stream, body, request.member_parsers
+            )
+
+    async def _execute(self, request: APIRequest) -> Any:
+        """Send a request, retry it per the retry policy and parse the response."""
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                if self.rate_limiter is not None:
+                    await self.rate_limiter.acquire_async(request.endpoint)
+                start = time.monotonic()
+                try:
+                    r = await self._send(request)
+                except httpx.TransportError as e:
+                    delay = self.retry_policy.next_delay(
+                        request.method,
+                        attempt,
+                        connection_error=True,
+                        idempotent=request.idempotency_key is not None,
+                    )
+                    self._record_attempt(request, attempt, start, error=e, delay=delay)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+
+                if r.status_code in request.expected_status:
+                    self._record_attempt(
+                        request, attempt, start, status_code=r.status_code
+                    )
+                    if not self._streams(request):
+                        return request.parser(self._decode(request, r.content))
+                    try:
+                        body = await spool_async_chunks(r.aiter_bytes())
+                    finally:
+                        await r.aclose()
+                    return request.parser(await self._decode_stream(request, body))
+
+                delay = self.retry_policy.next_delay(
+                    request.method,
+                    attempt,
+                    status_code=r.status_code,
+                    retry_after=r.headers.get("Retry-After"),
+                    idempotent=request.idempotency_key is not None,
+                )
+                self._record_attempt(
+                    request, attempt, start, status_code=r.status_code, delay=delay
+                )
+                await r.aread()
+                if delay is None:
+                    raise ValueError(r.text)
+                await asyncio.sleep(delay)
+        finally:
+            if isinstance(request.data, UploadStream):
+                request.data.close()
+
+    @no_type_check
+    async def request(
+        self,
+        method: str,
+        **kwargs: Union[bool, int, str, Dict[str, str], List[int], List[str]],
+    ) -> Union[
+        BaseSource,
+        BaseSummary,
+        BaseTranscript,
+        ExtractJob,
+        ListJobs,
+        ListSummaries,
+        ListTranscripts,
+        Stats,
+        SummarizeJob,
+        Union[ExtractJob, SummarizeJob],
+    ]:
+        """Make a request to the Wordcab API."""
+        if not method:
+            raise ValueError("You must specify a method.")
+        return await getattr(self, method)(**kwargs)
+
+    async def get_stats(
+        self,
+        min_created: Optional[str] = None,
+        max_created: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Stats:
+        """Get the stats of the account."""
+        return await self._execute(
+            self._prepare_get_stats(
+                min_created=min_created, max_created=max_created, tags=tags
+            )
+        )
+
+    async def start_extract(
+        self,
+        source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
+        display_name: str,
+        ephemeral_data: Optional[bool] = False,
+        only_api: Optional[bool] = True,
+        pipelines: Union[str, List[str]] = [  # noqa: B006
+            "questions_answers",
+            "topic_segments",
+            "emotions",
+            "speaker_talk_ratios",
+        ],
+        split_long_utterances: Optional[bool] = False,
+        tags: Optional[Union[str, List[str]]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ExtractJob:
+        """Start an Extraction job."""
+        loop = asyncio.get_running_loop()
+        source_object, content_hash = await loop.run_in_executor(
+            None, self._deduplicate_source, source_object
+        )
+        source_id = None
+        if self.idempotency_keys and idempotency_key is None:
+            source_id = await loop.run_in_executor(
+                None, self._identify_source, source_object, None, content_hash
+            )
+        job_params = {
+            "display_name": display_name,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "pipelines": pipelines,
+            "split_long_utterances": split_long_utterances,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_extract", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = await loop.run_in_executor(
+            None,
+            partial(
+                self._prepare_start_extract, source_object=source_object, **job_params
+            ),
+        )
+        self._set_idempotency_key(request, idempotency_key)
+
+        request = await loop.run_in_executor(None, self._compress_request, request)
+        job = await self._execute(request)
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    async def start_summary(
+        self,
+        source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
+        display_name: str,
+        summary_type: str,
+        context: Optional[Union[str, List[str]]] = None,
+        ephemeral_data: Optional[bool] = False,
+        only_api: Optional[bool] = True,
+        pipelines: Union[str, List[str]] = ["transcribe", "summarize"],  # noqa: B006
+        source_lang: Optional[str] = None,
+        split_long_utterances: Optional[bool] = False,
+        summary_lens: Optional[Union[int, List[int]]] = None,
+        target_lang: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> SummarizeJob:
+        """Start a Summary job."""
+        loop = asyncio.get_running_loop()
+        source_object, content_hash = await loop.run_in_executor(
+            None, self._deduplicate_source, source_object
+        )
+        source_id = None
+        if self.idempotency_keys and idempotency_key is None:
+            source_id = await loop.run_in_executor(
+                None, self._identify_source, source_object, None, content_hash
+            )
+        job_params = {
+            "display_name": display_name,
+            "summary_type": summary_type,
+            "context": context,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "pipelines": pipelines,
+            "source_lang": source_lang,
+            "split_long_utterances": split_long_utterances,
+            "summary_lens": summary_lens,
+            "target_lang": target_lang,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_summary", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = await loop.run_in_executor(
+            None,
+            partial(
+                self._prepare_start_summary, source_object=source_object, **job_params
+            ),
+        )
+        self._set_idempotency_key(request, idempotency_key)
+
+        request = await loop.run_in_executor(None, self._compress_request, request)
+        job = await self._execute(request)
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    async def start_transcription(
+        self,
+        source_object: Union[AudioSource, YoutubeSource],
+        display_name: str,
+        source_lang: str,
+        diarization: bool = False,
+        ephemeral_data: bool = False,
+        only_api: Optional[bool] = True,
+        tags: Union[str, List[str], None] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> TranscribeJob:
+        """Start a transcription job."""
+        loop = asyncio.get_running_loop()
+        content_hash = None
+        if self.transcript_cache is not None:
+            content_hash = await loop.run_in_executor(None, hash_source, source_object)
+        source_id = None
+        if self.idempotency_keys and idempotency_key is None:
+            source_id = await loop.run_in_executor(
+                None, self._identify_source, source_object, None, content_hash
+            )
+        job_params = {
+            "display_name": display_name,
+            "source_lang": source_lang,
+            "diarization": diarization,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_transcription", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = await loop.run_in_executor(
+            None,
+            partial(
+                self._prepare_start_transcription,
+                source_object=source_object,
+                **job_params,
+            ),
+        )
+        self._set_idempotency_key(request, idempotency_key)
+        if isinstance(source_object, AudioSource) and source_object.chunked:
+            upload = await self.upload_audio(source_object)
+            request.params["url"] = upload.url
+
+        job = await self._execute(request)
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    async def upload_audio(
+        self,
+        source_object: AudioSource,
+        part_size: int = UPLOAD_PART_SIZE,
+        max_workers: int = UPLOAD_MAX_WORKERS,
+    ) -> ChunkedUpload:
+        """Upload a local audio file in parts sent concurrently."""
+        parts = self._plan_upload(source_object, part_size, max_workers)
+        path = source_object.filepath
+
+        if source_object.upload_id is None:
+            received: Dict[int, str] = {}
+            source_object.upload_id = await self._execute(
+                self._prepare_create_upload(
+                    path.name, sum(part.size for part in parts), part_size
+                )
+            )
+        else:
+            received = await self._execute(
+                self._prepare_retrieve_upload(source_object.upload_id)
+            )
+        upload_id = source_object.upload_id
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def send(part: UploadPart) -> bool:
+            async with semaphore:
+                data = await loop.run_in_executor(None, read_part, path, part)
+                if received.get(part.number) == part.checksum:
+                    return False
+                await self._execute(self._prepare_upload_part(upload_id, part, data))
+                return True
+
+        results = await asyncio.gather(
+            *[send(part) for part in parts], return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise ValueError(
+                    f"The chunked upload {upload_id} failed: {result}. Upload the same"
+                    " source again to resume it."
+                ) from result
+
+        upload = await self._execute(self._prepare_complete_upload(upload_id, parts))
+        upload.uploaded_parts = sum(results)
+        return upload
+
+    async def list_jobs(
+        self,
+        page_size: Optional[int] = 100,
+        page_number: Optional[int] = None,
+        order_by: Optional[str] = "-time_started",
+    ) -> ListJobs:
+        """List all jobs."""
+        jobs = await self._execute(
+            self._prepare_list_jobs(
+                page_size=page_size, page_number=page_number, order_by=order_by
+            )
+        )
+        self._remember_transcripts(jobs)
+        return jobs
+
+    async def retrieve_job(self, job_name: str) -> Union[ExtractJob, SummarizeJob]:
+        """Retrieve a job."""
+        job = await self._execute(self._prepare_retrieve_job(job_name=job_name))
+        self._remember_transcripts(job)
+        return job
+
+    async def wait_for_job(
+        self,
+        job: Union[str, BaseJob],
+        timeout: Optional[float] = None,
+        policy: Optional[PollingPolicy] = None,
+    ) -> Union[ExtractJob, SummarizeJob]:
+        """Wait for a job to finish."""
+        jobs = self.wait_for_jobs([job], timeout=timeout, policy=policy)
+        (finished,) = [polled async for polled in jobs]
+        return finished
+
+    async def wait_for_jobs(
+        self,
+        jobs: Iterable[Union[str, BaseJob]],
+        timeout: Optional[float] = None,
+        policy: Optional[PollingPolicy] = None,
+        page_size: int = 100,
+    ) -> AsyncIterator[Union[ExtractJob, SummarizeJob]]:
+        """Wait for several jobs to finish, yielding each job as soon as it finishes."""
+        waiter = JobWaiter(jobs, policy or self.polling_policy, timeout)
+        while waiter.pending:
+            await asyncio.sleep(waiter.delay())
+            steps = self._poll_due_jobs_steps(waiter, page_size)
+            result = None
+            while True:
+                try:
+                    step = steps.send(result)
+                except StopIteration:
+                    break
+                if isinstance(step, tuple):
+                    method, kwargs = step
+                    result = await getattr(self, method)(**kwargs)
+                else:
+                    result = None
+                    yield step
+
+    @no_type_check
+    async def delete_job(self, job_name: str, warning: bool = True) -> Dict[str, str]:
+        """Delete a job."""
+        return await self._execute(
+            self._prepare_delete_job(job_name=job_name, warning=warning)
+        )
+
+    async def list_transcripts(
+        self, page_size: Optional[int] = 100, page_number: Optional[int] = None
+    ) -> ListTranscripts:
+        """List all transcripts."""
+        return await self._execute(
+            self._prepare_list_transcripts(page_size=page_size, page_number=page_number)
+        )
+
+    async def retrieve_transcript(self, transcript_id: str) -> BaseTranscript:
+        """Retrieve a transcript."""
+        return await self._execute(
+            self._prepare_retrieve_transcript(transcript_id=transcript_id)
+        )
+
+    async def change_speaker_labels(
+        self, transcript_id: str, speaker_map: Dict[str, str]
+    ) -> BaseTranscript:
+        """Change the speaker labels of a transcript."""
+        return await self._execute(
+            self._prepare_change_speaker_labels(
+                transcript_id=transcript_id, speaker_map=speaker_map
+            )
+        )
+
+    async def list_summaries(
+        self, page_size: Optional[int] = 100, page_number: Optional[int] = None
+    ) -> ListSummaries:
+        """List all summaries."""
+        return await self._execute(
+            self._prepare_list_summaries(page_size=page_size, page_number=page_number)
+        )
+
+    async def retrieve_summary(self, summary_id: str) -> BaseSummary:
+        """Retrieve a summary."""
+        return await self._execute(
+            self._prepare_retrieve_summary(summary_id=summary_id)
+        )
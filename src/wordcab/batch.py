@@ -0,0 +1,312 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API bulk submission."""
+
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from .config import BATCH_MAX_IN_FLIGHT
+from .core_objects import BaseJob, BaseSource
+from .futures import JobFuture
+from .journal import JobJournal, hash_item
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of an item of a batch.
+
+    Parameters
+    ----------
+    index : int
+        The position of the item in the input of the batch.
+    params : Dict[str, Any]
+        The parameters of the item, without its source.
+    job : BaseJob, optional
+        The started job, None if the job couldn't be started.
+    result : Any, optional
+        The summary or transcript of the job, None if the item failed.
+    error : BaseException, optional
+        The error of the item, None if it succeeded.
+    elapsed : float
+        The time from the submission of the item to its completion, in seconds.
+    """
+
+    index: int
+    params: Dict[str, Any]
+    job: Optional[BaseJob] = field(default=None)
+    result: Optional[Any] = field(default=None)
+    error: Optional[BaseException] = field(default=None)
+    elapsed: float = field(default=0.0)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item succeeded."""
+        return self.error is None
+
+
+@dataclass
+class BatchProgress:
+    """
+    Counters of a batch.
+
+    Parameters
+    ----------
+    submitted : int
+        The number of items submitted so far, including the jobs resumed from a
+        journal.
+    succeeded : int
+        The number of items completed with a result.
+    failed : int
+        The number of items completed with an error.
+    skipped : int
+        The number of items skipped, completed according to the journal.
+    elapsed : float
+        The time since the start of the batch, or its duration once it's over, in
+        seconds.
+    """
+
+    submitted: int = field(default=0)
+    succeeded: int = field(default=0)
+    failed: int = field(default=0)
+    skipped: int = field(default=0)
+    elapsed: float = field(default=0.0)
+
+    @property
+    def completed(self) -> int:
+        """The number of items completed, successfully or not."""
+        return self.succeeded + self.failed
+
+    @property
+    def in_flight(self) -> int:
+        """The number of items submitted and not completed yet."""
+        return self.submitted - self.completed
+
+    @property
+    def throughput(self) -> float:
+        """The number of items completed per second since the start of the batch."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class Batch:
+    """
+    Bulk submission of sources, yielding the results in order of completion.
+
+    The input is consumed lazily: a new item is read only when fewer than
+    `max_in_flight` items are submitted and not completed yet, so the sources are
+    never all held in memory. The failure of an item is recorded in its
+    `BatchResult`, without stopping the batch. A batch can be iterated only once,
+    and stopping the iteration cancels the items still in flight.
+
+    With a journal, the items already completed by a previous run are skipped, and
+    the jobs it started are resumed instead of being submitted again.
+
+    Parameters
+    ----------
+    submit : Callable[..., Future]
+        The function submitting a job and returning the future of its result,
+        e.g. `Client.submit_summary`.
+    items : Iterable[Tuple[BaseSource, Dict[str, Any]]]
+        The sources to submit, with the other arguments of `submit`.
+    max_in_flight : int
+        The maximum number of items submitted and not completed yet, by default 100.
+    params : Dict[str, Any], optional
+        The arguments of `submit` shared by all the items. The arguments of an item
+        take precedence.
+    journal : JobJournal, optional
+        The journal recording the state of the items, to resume the batch.
+    resume : Callable[[str], Future], optional
+        The function returning the future of the result of a job already started,
+        given its name, e.g. `Client.resume_job`. Required with a journal.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+
+    >>> items = ((GenericSource(filepath=p), {"display_name": p.stem}) for p in paths)
+    >>> with Client() as client:  # doctest: +SKIP
+    ...     batch = client.submit_batch(items, summary_type="narrative")
+    ...     for result in batch:
+    ...         if not result.ok:
+    ...             print(result.params["display_name"], result.error)
+    ...     print(batch.progress.throughput)
+    """
+
+    def __init__(
+        self,
+        submit: Callable[..., Future],
+        items: Iterable[Tuple[BaseSource, Dict[str, Any]]],
+        max_in_flight: int = BATCH_MAX_IN_FLIGHT,
+        params: Optional[Dict[str, Any]] = None,
+        journal: Optional[JobJournal] = None,
+        resume: Optional[Callable[[str], Future]] = None,
+    ) -> None:
+        """Initialize the batch, nothing is submitted before the iteration starts."""
+        if max_in_flight < 1:
+            raise ValueError("`max_in_flight` must be a positive integer.")
+        if journal is not None and resume is None:
+            raise ValueError("A batch with a journal needs a `resume` function.")
+        self.submit = submit
+        self.items = items
+        self.max_in_flight = max_in_flight
+        self.params = params or {}
+        self.journal = journal
+        self.resume = resume
+        self._lock = threading.Lock()
+        self._progress = BatchProgress()
+        self._start: Optional[float] = None
+        self._end: Optional[float] = None
+        self._iterated = False
+
+    @property
+    def progress(self) -> BatchProgress:
+        """A snapshot of the counters of the batch, safe to read from any thread."""
+        with self._lock:
+            if self._start is None:
+                elapsed = 0.0
+            else:
+                elapsed = (self._end or time.monotonic()) - self._start
+            return BatchProgress(
+                submitted=self._progress.submitted,
+                succeeded=self._progress.succeeded,
+                failed=self._progress.failed,
+                skipped=self._progress.skipped,
+                elapsed=elapsed,
+            )
+
+    def __iter__(self) -> Iterator[BatchResult]:
+        """Submit the items and yield their results in order of completion."""
+        if self._iterated:
+            raise ValueError("A batch can be iterated only once.")
+        self._iterated = True
+        self._start = time.monotonic()
+
+        items = enumerate(self.items)
+        in_flight: Dict[Future, Tuple[int, Dict[str, Any], float, Optional[str]]] = {}
+        exhausted = False
+        flush_interval = self.journal.flush_interval if self.journal else None
+        try:
+            while in_flight or not exhausted:
+                while not exhausted and len(in_flight) < self.max_in_flight:
+                    item = next(items, None)
+                    if item is None:
+                        exhausted = True
+                        break
+                    index, (source, params) = item
+                    submitted = self._submit(source, {**self.params, **params})
+                    if submitted is not None:
+                        future, item_key = submitted
+                        in_flight[future] = (index, params, time.monotonic(), item_key)
+                    # Don't keep the last source alive while waiting
+                    del item, source
+
+                if not in_flight:
+                    break
+                done, _ = wait(
+                    in_flight, timeout=flush_interval, return_when=FIRST_COMPLETED
+                )
+                if not done:  # Write the started jobs while waiting
+                    self.journal.flush()  # type: ignore
+                for future in done:
+                    yield self._complete(future, *in_flight.pop(future))
+        finally:
+            self._end = time.monotonic()
+            for future in in_flight:
+                future.cancel()
+            if self.journal is not None:
+                self.journal.flush()
+
+    def _submit(
+        self, source: BaseSource, params: Dict[str, Any]
+    ) -> Optional[Tuple[Future, Optional[str]]]:
+        """
+        Submit an item, or resume its job, turning an immediate error into a failed
+        future. None if the item is already completed according to the journal.
+        """
+        item_key = None
+        with self._lock:
+            self._progress.submitted += 1
+        try:
+            if self.journal is not None:
+                item_key = hash_item(
+                    source,
+                    {"submit": getattr(self.submit, "__name__", None), **params},
+                )
+            entry = self.journal.lookup(item_key) if item_key else None  # type: ignore
+            if entry is not None and entry[0] == "completed":
+                with self._lock:
+                    self._progress.submitted -= 1
+                    self._progress.skipped += 1
+                return None
+
+            if entry is not None and entry[0] == "started" and entry[1]:
+                logger.info(f"Resuming the job {entry[1]} of the journal.")
+                future = self.resume(entry[1])  # type: ignore
+            else:
+                future = self.submit(source_object=source, **params)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            return future, item_key
+
+        if item_key is not None and isinstance(future, JobFuture):
+            future.add_job_callback(
+                lambda job: self.journal.record(  # type: ignore
+                    item_key, "started", job.job_name
+                )
+            )
+        return future, item_key
+
+    def _complete(
+        self,
+        future: Future,
+        index: int,
+        params: Dict[str, Any],
+        submitted: float,
+        item_key: Optional[str],
+    ) -> BatchResult:
+        """Build the result of a completed item and update the counters."""
+        result = BatchResult(
+            index=index,
+            params=params,
+            job=getattr(future, "job", None),
+            elapsed=time.monotonic() - submitted,
+        )
+        if future.cancelled():
+            result.error = ValueError("The item was cancelled.")
+        else:
+            result.error = future.exception()
+        if result.error is None:
+            result.result = future.result()
+        else:
+            logger.warning(f"Item {index} of the batch failed: {result.error}")
+
+        with self._lock:
+            if result.ok:
+                self._progress.succeeded += 1
+            else:
+                self._progress.failed += 1
+        if item_key is not None:
+            self.journal.record(  # type: ignore
+                item_key, "completed" if result.ok else "failed"
+            )
+
+        return result
@@ -0,0 +1,216 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API local transcript cache."""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from .config import TRANSCRIPT_CACHE_PATH, UPLOAD_CHUNK_SIZE
+from .core_objects import AudioSource, BaseSource, InMemorySource
+
+logger = logging.getLogger(__name__)
+
+_FAILED_JOB_STATUS = ("Deleted", "Error")
+
+
+class TranscriptCache:
+    """
+    Local cache of the transcripts of the sources already submitted.
+
+    The cache maps a SHA-256 hash of the content of a source to the `transcript_id`
+    of the finished job that used it. A client created with a cache submits the
+    later jobs of an identical source as a `WordcabTranscriptSource`, which skips
+    the upload and the transcription of the content.
+
+    A submitted job is only added to the cache once it is retrieved with a
+    `transcript_id`, by `retrieve_job` or `list_jobs`.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        The path of the SQLite database, or `:memory:` for a cache that is not
+        persisted. The default is `~/.wordcab/transcript_cache.sqlite`.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.cache import TranscriptCache
+
+    >>> client = Client(transcript_cache=TranscriptCache())  # doctest: +SKIP
+    """
+
+    def __init__(self, path: Union[str, Path] = TRANSCRIPT_CACHE_PATH) -> None:
+        """Open or create the cache database."""
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transcripts (content_hash TEXT PRIMARY"
+                " KEY, transcript_id TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pending_jobs (job_name TEXT PRIMARY KEY,"
+                " content_hash TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    def lookup(self, content_hash: str) -> Optional[str]:
+        """Get the transcript ID of a content hash, None if it isn't cached."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT transcript_id FROM transcripts WHERE content_hash = ?",
+                (content_hash,),
+            ).fetchone()
+        return row[0] if row else None
+
+    def store(self, content_hash: str, transcript_id: str) -> None:
+        """Map a content hash to a transcript ID."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                (content_hash, transcript_id, time.time()),
+            )
+
+    def add_pending(self, job_name: str, content_hash: str) -> None:
+        """Remember the content hash of a submitted job until it is finished."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pending_jobs VALUES (?, ?, ?)",
+                (job_name, content_hash, time.time()),
+            )
+
+    def record_job(self, job: Any) -> None:
+        """Cache the transcript of a retrieved job, if it was submitted as pending."""
+        if not getattr(job, "transcript_id", None):
+            return
+
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT content_hash FROM pending_jobs WHERE job_name = ?",
+                (job.job_name,),
+            ).fetchone()
+            if row is None:
+                return
+            self._connection.execute(
+                "DELETE FROM pending_jobs WHERE job_name = ?", (job.job_name,)
+            )
+            if job.job_status in _FAILED_JOB_STATUS:
+                return
+            self._connection.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                (row[0], job.transcript_id, time.time()),
+            )
+        logger.info(f"Transcript {job.transcript_id} of job {job.job_name} cached.")
+
+    def clear(self) -> None:
+        """Remove all the cached transcripts and pending jobs."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM transcripts")
+            self._connection.execute("DELETE FROM pending_jobs")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._connection.close()
+
+
+def hash_source(source_object: Any) -> Optional[str]:
+    """
+    Hash the content of a source.
+
+    Audio sources are hashed from their bytes, read in chunks when the file is
+    streamed or lazy. The other file sources and the in-memory sources are hashed
+    from the JSON or file payload sent to the API.
+
+    Parameters
+    ----------
+    source_object : Any
+        The source object.
+
+    Returns
+    -------
+    Optional[str]
+        The SHA-256 hex digest, prefixed by the source type, or None if the content
+        can't be read again: remote audio files sent as URLs, file objects and
+        Youtube or Wordcab transcript sources.
+    """
+    digest = hashlib.sha256(f"{source_object.source}\0".encode())
+
+    if isinstance(source_object, AudioSource):
+        if source_object.fileobj is not None:
+            return None
+        if source_object.source_type == "remote" and not source_object.download:
+            return None
+        if source_object.file_object is None and source_object.source_type == "local":
+            with open(source_object.filepath, "rb") as f:  # type: ignore
+                for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+        if source_object.stream:  # Remote file, not downloaded twice
+            return None
+        source_object.load()
+        digest.update(source_object.file_object)  # type: ignore
+        source_object.release()
+        return digest.hexdigest()
+
+    if isinstance(source_object, InMemorySource):
+        digest.update(source_object.prepare_payload())
+        return digest.hexdigest()
+
+    if isinstance(source_object, BaseSource):
+        loaded = source_object.file_object is not None
+        source_object.load()
+        try:
+            digest.update(source_object.prepare_payload())  # type: ignore
+        finally:
+            if not loaded:  # Loaded to be hashed, loaded again when submitted
+                source_object.release()
+        return digest.hexdigest()
+
+    return None
+
+
+def identify_source(source_object: Any) -> Optional[str]:
+    """
+    Identify a source by its content, or by its URL or transcript ID.
+
+    Parameters
+    ----------
+    source_object : Any
+        The source object.
+
+    Returns
+    -------
+    Optional[str]
+        The content hash of the source, see `hash_source`, else its type and its URL
+        or transcript ID. None if the source can't be identified, e.g. a file object.
+    """
+    content_hash = hash_source(source_object)
+    if content_hash is not None:
+        return content_hash
+
+    reference = getattr(source_object, "url", None) or getattr(
+        source_object, "transcript_id", None
+    )
+    if reference is None:
+        return None
+    return f"{source_object.source}\0{reference}"
@@ -14,26 +14,65 @@
 
 """Wordcab API Client."""
 
+import gzip
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Union, no_type_check
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    no_type_check,
+)
 
 import requests  # type: ignore
+from requests.adapters import HTTPAdapter  # type: ignore
 
+from .batch import Batch
+from .cache import TranscriptCache, hash_source, identify_source
+from .concurrency import AdaptiveConcurrencyLimiter
 from .config import (
+    API_BASE_URL,
+    BATCH_MAX_IN_FLIGHT,
+    CONCURRENCY_ENDPOINTS,
+    CONCURRENCY_OVERLOAD_STATUS_CODES,
     CONTEXT_ELEMENTS,
     EXTRACT_PIPELINES,
+    GENERIC_SOURCE_OBJECTS,
+    GZIP_COMPRESS_LEVEL,
+    IDEMPOTENCY_RECORD_SIZE,
+    JSON_STREAM_CHUNK_SIZE,
     LIST_JOBS_ORDER_BY,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     REQUEST_TIMEOUT,
     SOURCE_LANG,
     SOURCE_OBJECT_MAPPING,
+    SUBMIT_MAX_WORKERS,
     SUMMARY_LENGTHS_RANGE,
     SUMMARY_PIPELINES,
     SUMMARY_TYPES,
     TARGET_LANG,
     TRANSCRIBE_LANGUAGE_CODES,
+    UPLOAD_MAX_WORKERS,
+    UPLOAD_PART_SIZE,
 )
 from .core_objects import (
     AudioSource,
+    BaseJob,
     BaseSource,
     BaseSummary,
     BaseTranscript,
@@ -51,7 +90,16 @@ from .core_objects import (
     WordcabTranscriptSource,
     YoutubeSource,
 )
+from .core_objects.utils import _load_json_stream
+from .futures import JobFuture, JobScheduler
+from .journal import JobJournal
 from .login import get_token
+from .polling import JobWaiter, PollingPolicy
+from .rate_limit import RateLimiter
+from .retry import AttemptRecord, RetryPolicy
+from .serialization import loads
+from .streaming import ChunkReader, MultipartStream, UploadStream, stream_headers
+from .upload import CHECKSUM_HEADER, ChunkedUpload, UploadPart, plan_parts, read_part
 from .utils import (
     _check_context_elements,
     _check_extract_pipelines,
@@ -67,11 +115,84 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
-
-class Client:
-    """Wordcab API Client."""
-
-    def __init__(self, api_key: Optional[str] = None):
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+@dataclass
+class APIRequest:
+    """
+    A request to the Wordcab API, independent of the HTTP library sending it.
+
+    Parameters
+    ----------
+    endpoint : str
+        The name of the client method building the request, e.g. `start_summary`.
+    method : str
+        The HTTP method.
+    url : str
+        The full URL of the endpoint.
+    headers : Dict[str, str]
+        The request headers, including the authorization header.
+    parser : Callable[[Any], Any]
+        The function turning the decoded JSON response into core objects.
+    params : Dict[str, Any], optional
+        The query parameters, by default None.
+    data : Any, optional
+        The raw request body, by default None.
+    files : Any, optional
+        The multipart files of the request, by default None.
+    json : Dict[str, Any], optional
+        The JSON body of the request, by default None.
+    expected_status : Tuple[int, ...]
+        The status codes of a successful response, by default (200,).
+    member_parsers : Dict[str, Callable[[Any], Any]], optional
+        The functions turning the items of the arrays, or the values of the objects,
+        at these keys of the response into core objects, before `parser` is called,
+        by default None. A streamed response is decoded one item at a time.
+    idempotency_key : str, optional
+        The idempotency key of a job creation, sent in the `Idempotency-Key` header.
+        A request with a key is retried like an idempotent request, by default None.
+    """
+
+    endpoint: str
+    method: str
+    url: str
+    headers: Dict[str, str]
+    parser: Callable[[Any], Any] = field(repr=False)
+    params: Optional[Dict[str, Any]] = field(default=None)
+    data: Optional[Any] = field(default=None, repr=False)
+    files: Optional[Any] = field(default=None, repr=False)
+    json: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    expected_status: Tuple[int, ...] = field(default=(200,))
+    member_parsers: Optional[Dict[str, Callable[[Any], Any]]] = field(
+        default=None, repr=False
+    )
+    idempotency_key: Optional[str] = field(default=None)
+
+
+class BaseClient:
+    """
+    Base class for the Wordcab API clients. It is not meant to be used directly.
+
+    It validates the arguments of every endpoint, builds the matching `APIRequest`
+    and parses the responses into core objects. The subclasses only have to send
+    the requests with their own HTTP transport.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        on_attempt: Optional[Callable[[AttemptRecord], None]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        base_url: str = API_BASE_URL,
+        transcript_cache: Optional[TranscriptCache] = None,
+        gzip_min_size: Optional[int] = None,
+        stream_responses: bool = False,
+        polling_policy: Optional[PollingPolicy] = None,
+        idempotency_keys: bool = False,
+    ):
         """Initialize the client."""
         self.api_key = api_key if api_key else get_token()
         if not self.api_key:
@@ -80,50 +201,269 @@ class Client:
                 "variable. Use `wordcab login` to login to the Wordcab CLI and set "
                 "the environment variable."
             )
+        self.base_url = base_url.rstrip("/")
         self.timeout = REQUEST_TIMEOUT
+        self.retry_policy = retry_policy if retry_policy else RetryPolicy()
+        self.on_attempt = on_attempt
+        self.rate_limiter = rate_limiter
+        self.concurrency_limiter = concurrency_limiter
+        self.transcript_cache = transcript_cache
+        if gzip_min_size is not None and gzip_min_size < 0:
+            raise ValueError("`gzip_min_size` can't be negative.")
+        self.gzip_min_size = gzip_min_size
+        self.stream_responses = stream_responses
+        self.polling_policy = polling_policy if polling_policy else PollingPolicy()
+        self.idempotency_keys = idempotency_keys
+        self._created_jobs: "OrderedDict[str, Any]" = OrderedDict()
+        self._created_jobs_lock = threading.Lock()
+
+    def _streams(self, request: APIRequest) -> bool:
+        """Check if the response of a request is decoded while it's downloaded."""
+        return self.stream_responses and request.member_parsers is not None
+
+    @staticmethod
+    def _decode(request: APIRequest, content: bytes) -> Any:
+        """Decode a buffered response body, converting the members of the request."""
+        data = loads(content)
+        for key, parse in (request.member_parsers or {}).items():
+            value = data.get(key)
+            if isinstance(value, list):
+                data[key] = [parse(item) for item in value]
+            elif isinstance(value, dict):
+                data[key] = {item_key: parse(item) for item_key, item in value.items()}
+        return data
+
+    def _compress_request(self, request: APIRequest) -> APIRequest:
+        """Compress the body of a request with gzip, if it reaches `gzip_min_size`."""
+        if self.gzip_min_size is None or not isinstance(request.data, (str, bytes)):
+            return request
+
+        body = (
+            request.data.encode("utf-8")
+            if isinstance(request.data, str)
+            else request.data
+        )
+        if len(body) < self.gzip_min_size:
+            return request
 
-    def __enter__(self) -> "Client":
-        """Enter the client context."""
-        return self
+        request.data = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL, mtime=0)
+        request.headers = {**request.headers, "Content-Encoding": "gzip"}
+        return request
 
-    def __exit__(
+    def _deduplicate_source(self, source_object: Any) -> Tuple[Any, Optional[str]]:
+        """
+        Replace a source already transcribed by its cached Wordcab transcript.
+
+        Returns the source to submit and the content hash to remember for the job,
+        None if the cache is disabled, the content can't be hashed or is cached.
+        """
+        if self.transcript_cache is None:
+            return source_object, None
+
+        content_hash = hash_source(source_object)
+        if content_hash is None:
+            return source_object, None
+
+        transcript_id = self.transcript_cache.lookup(content_hash)
+        if transcript_id is None:
+            return source_object, content_hash
+
+        logger.info(f"Content already transcribed, using transcript {transcript_id}.")
+        if isinstance(source_object, BaseSource):
+            source_object.release()
+        return WordcabTranscriptSource(transcript_id=transcript_id), None
+
+    def _identify_source(
         self,
-        exception_type: Optional[Union[ValueError, TypeError, AssertionError]],
-        exception_value: Optional[Exception],
-        traceback: Optional[Exception],
+        source_object: Any,
+        idempotency_key: Optional[str],
+        content_hash: Optional[str],
+    ) -> Optional[str]:
+        """
+        Identify the source of a job, to derive the idempotency key of the job from.
+
+        None if the key is given, the client doesn't derive the keys, or the source
+        can't be identified.
+        """
+        if idempotency_key is not None or not self.idempotency_keys:
+            return None
+        return content_hash or identify_source(source_object)
+
+    def _derive_idempotency_key(
+        self,
+        endpoint: str,
+        idempotency_key: Optional[str],
+        source_id: Optional[str],
+        job_params: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Get the idempotency key of a job creation, derived from the source and the
+        parameters of the job if it isn't given.
+
+        None if the key isn't given and the source can't be identified.
+        """
+        if idempotency_key is not None or source_id is None:
+            return idempotency_key
+        digest = hashlib.sha256(f"{endpoint}\0{source_id}\0".encode())
+        digest.update(json.dumps(job_params, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def _lookup_created_job(self, idempotency_key: Optional[str]) -> Optional[Any]:
+        """Get the job already created by the client with an idempotency key."""
+        if idempotency_key is None:
+            return None
+        with self._created_jobs_lock:
+            job = self._created_jobs.get(idempotency_key)
+        if job is not None:
+            logger.info(
+                f"Job {job.job_name} already created with the idempotency key"
+                f" {idempotency_key}, not started again."
+            )
+        return job
+
+    def _set_idempotency_key(
+        self, request: APIRequest, idempotency_key: Optional[str]
+    ) -> APIRequest:
+        """Send a job creation with its idempotency key, if any."""
+        if idempotency_key is not None:
+            request.idempotency_key = idempotency_key
+            request.headers = {
+                **request.headers,
+                IDEMPOTENCY_KEY_HEADER: idempotency_key,
+            }
+        return request
+
+    def _record_created_job(self, request: APIRequest, job: Any) -> None:
+        """Remember the job created by a request with an idempotency key."""
+        if request.idempotency_key is None:
+            return
+        with self._created_jobs_lock:
+            self._created_jobs[request.idempotency_key] = job
+            self._created_jobs.move_to_end(request.idempotency_key)
+            while len(self._created_jobs) > IDEMPOTENCY_RECORD_SIZE:
+                self._created_jobs.popitem(last=False)
+
+    def _remember_submission(self, job: Any, content_hash: Optional[str]) -> None:
+        """Remember the content hash of a submitted job, to cache its transcript."""
+        if self.transcript_cache is not None and content_hash is not None:
+            self.transcript_cache.add_pending(job.job_name, content_hash)
+
+    def _remember_transcripts(self, result: Any) -> None:
+        """Cache the transcripts of the finished jobs of a retrieved job or list."""
+        if self.transcript_cache is None:
+            return
+        jobs = result.results if isinstance(result, ListJobs) else [result]
+        for job in jobs:
+            self.transcript_cache.record_job(job)
+
+    def _poll_due_jobs_steps(
+        self, waiter: JobWaiter, page_size: int
+    ) -> Generator[Union[Tuple[str, Dict[str, Any]], BaseJob], Any, None]:
+        """
+        Plan the requests refreshing the jobs due for a poll, without sending them.
+
+        The generator yields a `(method, kwargs)` tuple for each `list_jobs` or
+        `retrieve_job` call to make, and expects its result back with `send`. In
+        between, it yields the jobs that finished, to be passed on as they are found.
+        """
+        missing = waiter.due_jobs()
+        page_number = 0
+        while len(missing) > max(page_number, 1):
+            page_number += 1
+            page = yield (
+                "list_jobs",
+                {
+                    "page_size": page_size,
+                    "page_number": page_number if page_number > 1 else None,
+                },
+            )
+            yield from waiter.scan(page.results)
+            found = {job.job_name for job in page.results}
+            missing = [name for name in missing if name not in found]
+            if not page.next_page:
+                break
+
+        for name in missing:
+            job = yield ("retrieve_job", {"job_name": name})
+            if waiter.update(job):
+                yield job
+
+    def _get_concurrency_limiter(
+        self, request: APIRequest
+    ) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Get the concurrency limiter applying to a request, if any."""
+        if request.endpoint in CONCURRENCY_ENDPOINTS:
+            return self.concurrency_limiter
+        return None
+
+    @staticmethod
+    def _release_concurrency(
+        limiter: Optional[AdaptiveConcurrencyLimiter],
+        start: float,
+        response: Any,
+        timed_out: bool,
     ) -> None:
-        """Exit the client context."""
-        pass
+        """Release the concurrency slot of an attempt, reporting the API load."""
+        if limiter is None:
+            return
+        if response is None:
+            limiter.release(overloaded=timed_out)
+        else:
+            limiter.release(
+                latency=time.monotonic() - start,
+                overloaded=response.status_code in CONCURRENCY_OVERLOAD_STATUS_CODES,
+            )
 
-    @no_type_check
-    def request(
+    def _record_attempt(
         self,
-        method: str,
-        **kwargs: Union[bool, int, str, Dict[str, str], List[int], List[str]],
-    ) -> Union[
-        BaseSource,
-        BaseSummary,
-        BaseTranscript,
-        ExtractJob,
-        ListJobs,
-        ListSummaries,
-        ListTranscripts,
-        Stats,
-        SummarizeJob,
-        Union[ExtractJob, SummarizeJob],
-    ]:
-        """Make a request to the Wordcab API."""
-        if not method:
-            raise ValueError("You must specify a method.")
-        return getattr(self, method)(**kwargs)
+        request: APIRequest,
+        attempt: int,
+        start: float,
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Report the timing and outcome of an attempt to the `on_attempt` callback."""
+        record = AttemptRecord(
+            endpoint=request.endpoint,
+            method=request.method,
+            url=request.url,
+            attempt=attempt,
+            elapsed=time.monotonic() - start,
+            status_code=status_code,
+            error=repr(error) if error is not None else None,
+            delay=delay,
+        )
+        if delay is not None:
+            logger.warning(
+                f"Attempt {attempt} of {request.endpoint} failed"
+                f" ({status_code or record.error}), retrying in {delay:.2f}s."
+            )
+        if self.on_attempt is not None:
+            self.on_attempt(record)
+
+    @staticmethod
+    def _stream_audio(request: APIRequest, source_object: AudioSource) -> None:
+        """Attach an audio file streamed as a multipart form to a request."""
+        body = MultipartStream(
+            "audio_file",
+            f"{source_object._stem}{source_object._suffix}",
+            source_object.prepare_stream(),
+        )
+        request.data = body
+        request.headers = {
+            **request.headers,
+            "Content-Type": body.content_type,
+            **stream_headers(body),
+        }
 
-    def get_stats(
+    def _prepare_get_stats(
         self,
         min_created: Optional[str] = None,
         max_created: Optional[str] = None,
         tags: Optional[List[str]] = None,
-    ) -> Stats:
-        """Get the stats of the account."""
+    ) -> APIRequest:
+        """Prepare the request to get the stats of the account."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
@@ -136,19 +476,16 @@ class Client:
         if tags:
             params["tags"] = _format_tags(tags)
 
-        r = requests.get(
-            "https://wordcab.com/api/v1/me",
+        return APIRequest(
+            endpoint="get_stats",
+            method="GET",
+            url=f"{self.base_url}/me",
             headers=headers,
             params=params,
-            timeout=self.timeout,
+            parser=lambda data: Stats(**data),
         )
 
-        if r.status_code == 200:
-            return Stats(**r.json())
-        else:
-            raise ValueError(r.text)
-
-    def start_extract(  # noqa: C901
+    def _prepare_start_extract(
         self,
         source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
         display_name: str,
@@ -162,8 +499,8 @@ class Client:
         ],
         split_long_utterances: Optional[bool] = False,
         tags: Optional[Union[str, List[str]]] = None,
-    ) -> ExtractJob:
-        """Start an Extraction job."""
+    ) -> APIRequest:
+        """Prepare the request to start an Extraction job."""
         if _check_extract_pipelines(pipelines) is False:
             raise ValueError(f"""
                 You must specify a valid list of pipelines.
@@ -186,25 +523,22 @@ class Client:
                 f"Invalid source: {source}. Source must be one of"
                 f" {SOURCE_OBJECT_MAPPING.keys()}"
             )
-        if (
-            source_object.__class__.__name__ != SOURCE_OBJECT_MAPPING[source]
-            and source_object.__class__.__name__ != "InMemorySource"
+        if source_object.__class__.__name__ != SOURCE_OBJECT_MAPPING[source] and (
+            source != "generic"
+            or source_object.__class__.__name__ not in GENERIC_SOURCE_OBJECTS
         ):
             raise ValueError(f"""
                 Invalid source object: {source_object}. Source object must be of type {SOURCE_OBJECT_MAPPING[source]},
                 but is of type {type(source_object)}.
             """)
 
-        if hasattr(source_object, "payload"):
-            payload = source_object.payload
-        else:
-            payload = source_object.prepare_payload()
-
-        if hasattr(source_object, "headers"):
-            headers = source_object.headers
-        else:
-            headers = source_object.prepare_headers()
-        headers["Authorization"] = f"Bearer {self.api_key}"
+        if isinstance(source_object, BaseSource):
+            source_object.load()
+        payload = source_object.prepare_payload()
+        headers = {
+            **source_object.prepare_headers(),
+            "Authorization": f"Bearer {self.api_key}",
+        }
 
         pipelines = _format_pipelines(pipelines)
         params: Dict[str, Union[str, None]] = {
@@ -223,40 +557,39 @@ class Client:
         if source == "signed_url" and hasattr(source_object, "signed_url"):
             params["signed_url"] = source_object.signed_url
 
-        if source == "audio" or source == "vtt":
-            r = requests.post(
-                "https://wordcab.com/api/v1/extract",
-                headers=headers,
-                params=params,
-                files=payload,
-                timeout=self.timeout,
-            )
+        parser = partial(
+            self._parse_extract_job,
+            display_name=display_name,
+            source=source,
+            settings=JobSettings(
+                ephemeral_data=ephemeral_data,
+                only_api=only_api,
+                pipeline=pipelines,
+                split_long_utterances=split_long_utterances,
+            ),
+        )
+        request = APIRequest(
+            endpoint="start_extract",
+            method="POST",
+            url=f"{self.base_url}/extract",
+            headers=headers,
+            params=params,
+            parser=parser,
+            expected_status=(201,),
+        )
+        if source == "audio" and source_object.stream:
+            self._stream_audio(request, source_object)
+        elif source == "audio" or source == "vtt":
+            request.files = payload
         else:
-            r = requests.post(
-                "https://wordcab.com/api/v1/extract",
-                headers=headers,
-                params=params,
-                data=payload,
-                timeout=self.timeout,
-            )
+            request.data = payload
 
-        if r.status_code == 201:
-            logger.info("Extract job started.")
-            return ExtractJob(
-                display_name=display_name,
-                job_name=r.json()["job_name"],
-                source=source,
-                settings=JobSettings(
-                    ephemeral_data=ephemeral_data,
-                    only_api=only_api,
-                    pipeline=pipelines,
-                    split_long_utterances=split_long_utterances,
-                ),
-            )
-        else:
-            raise ValueError(r.text)
+        if isinstance(source_object, BaseSource):
+            source_object.release()
+
+        return request
 
-    def start_summary(  # noqa: C901
+    def _prepare_start_summary(
         self,
         source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
         display_name: str,
@@ -270,8 +603,8 @@ class Client:
         summary_lens: Optional[Union[int, List[int]]] = None,
         target_lang: Optional[str] = None,
         tags: Optional[Union[str, List[str]]] = None,
-    ) -> SummarizeJob:
-        """Start a Summary job."""
+    ) -> APIRequest:
+        """Prepare the request to start a Summary job."""
         if summary_type not in SUMMARY_TYPES:
             raise ValueError(
                 f"Invalid summary type. Available types are: {', '.join(SUMMARY_TYPES)}"
@@ -345,25 +678,22 @@ class Client:
                 f"Invalid source: {source}. Source must be one of"
                 f" {SOURCE_OBJECT_MAPPING.keys()}"
             )
-        if (
-            source_object.__class__.__name__ != SOURCE_OBJECT_MAPPING[source]
-            and source_object.__class__.__name__ != "InMemorySource"
+        if source_object.__class__.__name__ != SOURCE_OBJECT_MAPPING[source] and (
+            source != "generic"
+            or source_object.__class__.__name__ not in GENERIC_SOURCE_OBJECTS
         ):
             raise ValueError(f"""
                 Invalid source object: {source_object}. Source object must be of type {SOURCE_OBJECT_MAPPING[source]},
                 but is of type {type(source_object)}.
             """)
 
-        if hasattr(source_object, "payload"):
-            payload = source_object.payload
-        else:
-            payload = source_object.prepare_payload()
-
-        if hasattr(source_object, "headers"):
-            headers = source_object.headers
-        else:
-            headers = source_object.prepare_headers()
-        headers["Authorization"] = f"Bearer {self.api_key}"
+        if isinstance(source_object, BaseSource):
+            source_object.load()
+        payload = source_object.prepare_payload()
+        headers = {
+            **source_object.prepare_headers(),
+            "Authorization": f"Bearer {self.api_key}",
+        }
 
         pipelines = _format_pipelines(pipelines)
         params: Dict[str, Union[str, None]] = {
@@ -389,40 +719,39 @@ class Client:
         if source == "signed_url" and hasattr(source_object, "signed_url"):
             params["signed_url"] = source_object.signed_url
 
-        if source == "audio":
-            r = requests.post(
-                "https://wordcab.com/api/v1/summarize",
-                headers=headers,
-                params=params,
-                files=payload,
-                timeout=self.timeout,
-            )
+        parser = partial(
+            self._parse_summarize_job,
+            display_name=display_name,
+            source=source,
+            settings=JobSettings(
+                ephemeral_data=ephemeral_data,
+                pipeline=pipelines,
+                split_long_utterances=split_long_utterances,
+                only_api=only_api,
+            ),
+        )
+        request = APIRequest(
+            endpoint="start_summary",
+            method="POST",
+            url=f"{self.base_url}/summarize",
+            headers=headers,
+            params=params,
+            parser=parser,
+            expected_status=(201,),
+        )
+        if source == "audio" and source_object.stream:
+            self._stream_audio(request, source_object)
+        elif source == "audio":
+            request.files = payload
         else:
-            r = requests.post(
-                "https://wordcab.com/api/v1/summarize",
-                headers=headers,
-                params=params,
-                data=payload,
-                timeout=self.timeout,
-            )
+            request.data = payload
 
-        if r.status_code == 201:
-            logger.info("Summary job started.")
-            return SummarizeJob(
-                display_name=display_name,
-                job_name=r.json()["job_name"],
-                source=source,
-                settings=JobSettings(
-                    ephemeral_data=ephemeral_data,
-                    pipeline=pipelines,
-                    split_long_utterances=split_long_utterances,
-                    only_api=only_api,
-                ),
-            )
-        else:
-            raise ValueError(r.text)
+        if isinstance(source_object, BaseSource):
+            source_object.release()
 
-    def start_transcription(
+        return request
+
+    def _prepare_start_transcription(
         self,
         source_object: Union[AudioSource, YoutubeSource],
         display_name: str,
@@ -431,9 +760,8 @@ class Client:
         ephemeral_data: bool = False,
         only_api: Optional[bool] = True,
         tags: Union[str, List[str], None] = None,
-        api_key: Union[str, None] = None,
-    ) -> TranscribeJob:
-        """Start a transcription job."""
+    ) -> APIRequest:
+        """Prepare the request to start a transcription job."""
         if source_lang not in TRANSCRIBE_LANGUAGE_CODES:
             raise ValueError(f"""
                 Invalid source language: {source_lang}. Source language must be one of {TRANSCRIBE_LANGUAGE_CODES}.
@@ -453,9 +781,17 @@ class Client:
             params["tags"] = _format_tags(tags)
 
         if isinstance(source_object, AudioSource):
-            _data = source_object.file_object
+            if source_object.chunked:  # Uploaded in chunks, then sent as a URL
+                _data = None
+            elif source_object.stream:  # Streamed file source
+                _data = source_object.prepare_stream()
+                headers.update(stream_headers(_data))
+            else:
+                source_object.load()
+                _data = source_object.file_object
+                source_object.release()
 
-            if source_object.file_object is None:  # URL source
+            if _data is None:  # URL source
                 params["url_type"] = "audio_url"
                 params["url"] = source_object.url
             else:  # File object source
@@ -469,38 +805,36 @@ class Client:
             params["url"] = source_object.url
             _data = None
 
-        r = requests.post(
-            "https://wordcab.com/api/v1/transcribe",
+        parser = partial(
+            self._parse_transcribe_job,
+            display_name=display_name,
+            source=source_object.source,
+            source_lang=source_lang,
+            settings=JobSettings(
+                pipeline="transcribe",
+                ephemeral_data=ephemeral_data,
+                only_api=only_api,
+                split_long_utterances=False,
+            ),
+        )
+        return APIRequest(
+            endpoint="start_transcription",
+            method="POST",
+            url=f"{self.base_url}/transcribe",
             headers=headers,
             params=params,
             data=_data,
-            timeout=self.timeout,
-        )
-
-        if r.status_code == 200 or r.status_code == 201:
-            logger.info("Transcription job started.")
-            return TranscribeJob(
-                display_name=display_name,
-                job_name=r.json()["job_name"],
-                source=source_object.source,
-                source_lang=source_lang,
-                settings=JobSettings(
-                    pipeline="transcribe",
-                    ephemeral_data=ephemeral_data,
-                    only_api=only_api,
-                    split_long_utterances=False,
-                ),
-            )
-        else:
-            raise ValueError(r.text)
+            parser=parser,
+            expected_status=(200, 201),
+        )
 
-    def list_jobs(
+    def _prepare_list_jobs(
         self,
         page_size: Optional[int] = 100,
         page_number: Optional[int] = None,
         order_by: Optional[str] = "-time_started",
-    ) -> ListJobs:
-        """List all jobs."""
+    ) -> APIRequest:
+        """Prepare the request to list all jobs."""
         if order_by not in LIST_JOBS_ORDER_BY:
             raise ValueError(f"""
                 Invalid `order_by` parameter. Must be one of {LIST_JOBS_ORDER_BY}.
@@ -516,76 +850,50 @@ class Client:
         if page_number is not None:
             params["page"] = page_number
 
-        r = requests.get(
-            "https://wordcab.com/api/v1/jobs",
+        return APIRequest(
+            endpoint="list_jobs",
+            method="GET",
+            url=f"{self.base_url}/jobs",
             headers=headers,
             params=params,
-            timeout=self.timeout,
-        )
-
-        if r.status_code == 200:
-            data = r.json()
-            list_jobs: List[Union[ExtractJob, SummarizeJob]] = []
-            for job in data["results"]:
-                if "summary_details" in job:
-                    list_jobs.append(SummarizeJob(**job))
-                else:
-                    list_jobs.append(ExtractJob(**job))
-            return ListJobs(
-                page_count=int(data["page_count"]),
-                next_page=data.get("next"),
-                results=list_jobs,
-            )
-        else:
-            raise ValueError(r.text)
+            parser=self._parse_list_jobs,
+            member_parsers={"results": self._parse_job},
+        )
 
-    def retrieve_job(self, job_name: str) -> Union[ExtractJob, SummarizeJob]:
-        """Retrieve a job."""
+    def _prepare_retrieve_job(self, job_name: str) -> APIRequest:
+        """Prepare the request to retrieve a job."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         }
 
-        r = requests.get(
-            f"https://wordcab.com/api/v1/jobs/{job_name}",
+        return APIRequest(
+            endpoint="retrieve_job",
+            method="GET",
+            url=f"{self.base_url}/jobs/{job_name}",
             headers=headers,
-            timeout=self.timeout,
+            parser=self._parse_job,
         )
 
-        if r.status_code == 200:
-            data = r.json()
-            if "summary_details" in data:
-                return SummarizeJob(**data)
-            else:
-                return ExtractJob(**data)
-        else:
-            raise ValueError(r.text)
-
-    @no_type_check
-    def delete_job(self, job_name: str, warning: bool = True) -> Dict[str, str]:
-        """Delete a job."""
+    def _prepare_delete_job(self, job_name: str, warning: bool = True) -> APIRequest:
+        """Prepare the request to delete a job."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         }
 
-        r = requests.delete(
-            f"https://wordcab.com/api/v1/jobs/{job_name}",
+        return APIRequest(
+            endpoint="delete_job",
+            method="DELETE",
+            url=f"{self.base_url}/jobs/{job_name}",
             headers=headers,
-            timeout=self.timeout,
+            parser=partial(self._parse_deleted_job, job_name=job_name, warning=warning),
         )
 
-        if r.status_code == 200:
-            if warning:
-                logger.warning(f"Job {job_name} deleted.")
-            return r.json()
-        else:
-            raise ValueError(r.text)
-
-    def list_transcripts(
+    def _prepare_list_transcripts(
         self, page_size: Optional[int] = 100, page_number: Optional[int] = None
-    ) -> ListTranscripts:
-        """List all transcripts."""
+    ) -> APIRequest:
+        """Prepare the request to list all transcripts."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
@@ -595,74 +903,54 @@ class Client:
         if page_number is not None:
             params["page"] = page_number
 
-        r = requests.get(
-            "https://wordcab.com/api/v1/transcripts",
+        return APIRequest(
+            endpoint="list_transcripts",
+            method="GET",
+            url=f"{self.base_url}/transcripts",
             headers=headers,
             params=params,
-            timeout=self.timeout,
+            parser=self._parse_list_transcripts,
+            member_parsers={"results": self._parse_transcript_item},
         )
 
-        if r.status_code == 200:
-            data = r.json()
-            return ListTranscripts(
-                page_count=int(data["page_count"]),
-                next_page=data.get("next"),
-                results=[
-                    BaseTranscript(**transcript) for transcript in data["results"]
-                ],
-            )
-        else:
-            raise ValueError(r.text)
-
-    def retrieve_transcript(self, transcript_id: str) -> BaseTranscript:
-        """Retrieve a transcript."""
+    def _prepare_retrieve_transcript(self, transcript_id: str) -> APIRequest:
+        """Prepare the request to retrieve a transcript."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         }
 
-        r = requests.get(
-            f"https://wordcab.com/api/v1/transcripts/{transcript_id}",
+        return APIRequest(
+            endpoint="retrieve_transcript",
+            method="GET",
+            url=f"{self.base_url}/transcripts/{transcript_id}",
             headers=headers,
-            timeout=self.timeout,
+            parser=self._parse_transcript,
+            member_parsers={"transcript": self._parse_utterance},
         )
 
-        if r.status_code == 200:
-            data = r.json()
-            utterances = data.pop("transcript")
-            transcript = BaseTranscript(**data)
-            for utterance in utterances:
-                transcript.transcript.append(TranscriptUtterance(**utterance))
-            return transcript
-        else:
-            raise ValueError(r.text)
-
-    def change_speaker_labels(
+    def _prepare_change_speaker_labels(
         self, transcript_id: str, speaker_map: Dict[str, str]
-    ) -> BaseTranscript:
-        """Change the speaker labels of a transcript."""
+    ) -> APIRequest:
+        """Prepare the request to change the speaker labels of a transcript."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
         }
 
-        r = requests.patch(
-            f"https://wordcab.com/api/v1/transcripts/{transcript_id}",
+        return APIRequest(
+            endpoint="change_speaker_labels",
+            method="PATCH",
+            url=f"{self.base_url}/transcripts/{transcript_id}",
             headers=headers,
             json={"speaker_map": speaker_map},
-            timeout=self.timeout,
+            parser=self._parse_changed_speaker_labels,
         )
 
-        if r.status_code == 200:
-            logger.info("Speaker labels changed.")
-            return BaseTranscript(**r.json())
-        else:
-            raise ValueError(r.text)
-
-    def list_summaries(
+    def _prepare_list_summaries(
         self, page_size: Optional[int] = 100, page_number: Optional[int] = None
-    ) -> ListSummaries:
-        """List all summaries."""
+    ) -> APIRequest:
+        """Prepare the request to list all summaries."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
@@ -672,52 +960,1061 @@ class Client:
         if page_number is not None:
             params["page"] = page_number
 
-        r = requests.get(
-            "https://wordcab.com/api/v1/summaries",
+        return APIRequest(
+            endpoint="list_summaries",
+            method="GET",
+            url=f"{self.base_url}/summaries",
             headers=headers,
             params=params,
-            timeout=self.timeout,
+            parser=self._parse_list_summaries,
+            member_parsers={"results": self._parse_summary_item},
         )
 
-        if r.status_code == 200:
-            data = r.json()
-            return ListSummaries(
-                page_count=int(data["page_count"]),
-                next_page=data.get("next"),
-                results=[BaseSummary(**summary) for summary in data["results"]],
+    def _prepare_retrieve_summary(self, summary_id: str) -> APIRequest:
+        """Prepare the request to retrieve a summary."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+        return APIRequest(
+            endpoint="retrieve_summary",
+            method="GET",
+            url=f"{self.base_url}/summaries/{summary_id}",
+            headers=headers,
+            parser=self._parse_summary,
+            member_parsers={"summary": self._parse_structured_summaries},
+        )
+
+    @staticmethod
+    def _plan_upload(
+        source_object: AudioSource, part_size: int, max_workers: int
+    ) -> List[UploadPart]:
+        """Check an audio source can be uploaded in chunks and split it into parts."""
+        if not isinstance(source_object, AudioSource) or not source_object.chunked:
+            raise ValueError(
+                "Only an AudioSource created with `chunked=True` can be uploaded in"
+                " chunks."
             )
-        else:
-            raise ValueError(r.text)
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer.")
 
-    def retrieve_summary(self, summary_id: str) -> BaseSummary:
-        """Retrieve a summary."""
+        return plan_parts(source_object.filepath.stat().st_size, part_size)  # type: ignore
+
+    def _prepare_create_upload(
+        self, filename: str, size: int, part_size: int
+    ) -> APIRequest:
+        """Prepare the request to create a chunked upload."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+        return APIRequest(
+            endpoint="create_upload",
+            method="POST",
+            url=f"{self.base_url}/uploads",
+            headers=headers,
+            json={"filename": filename, "size": size, "part_size": part_size},
+            parser=self._parse_upload_id,
+            expected_status=(200, 201),
+        )
+
+    def _prepare_retrieve_upload(self, upload_id: str) -> APIRequest:
+        """Prepare the request to retrieve the parts received of a chunked upload."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+        return APIRequest(
+            endpoint="retrieve_upload",
+            method="GET",
+            url=f"{self.base_url}/uploads/{upload_id}",
+            headers=headers,
+            parser=self._parse_received_parts,
+        )
+
+    def _prepare_upload_part(
+        self, upload_id: str, part: UploadPart, data: bytes
+    ) -> APIRequest:
+        """Prepare the request to send a part of a chunked upload."""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "application/json",
+            "Content-Type": "application/octet-stream",
+            CHECKSUM_HEADER: str(part.checksum),
         }
 
-        r = requests.get(
-            f"https://wordcab.com/api/v1/summaries/{summary_id}",
+        return APIRequest(
+            endpoint="upload_part",
+            method="PUT",
+            url=f"{self.base_url}/uploads/{upload_id}/parts/{part.number}",
             headers=headers,
-            timeout=self.timeout,
-        )
-
-        if r.status_code == 200:
-            data = r.json()
-            structured_summaries = data.pop("summary")
-            summary = BaseSummary(**data)
-            summaries: Dict[
-                str,
-                Dict[str, List[StructuredSummary]],
-            ] = {}
-            for key, value in structured_summaries.items():
-                summaries[key] = {
-                    "structured_summary": [
-                        StructuredSummary(**items)
-                        for items in value["structured_summary"]
-                    ]
-                }
-            summary.summary = summaries
-            return summary
+            data=data,
+            parser=dict,
+        )
+
+    def _prepare_complete_upload(
+        self, upload_id: str, parts: List[UploadPart]
+    ) -> APIRequest:
+        """Prepare the request to assemble the parts of a chunked upload."""
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Accept": "application/json",
+        }
+
+        return APIRequest(
+            endpoint="complete_upload",
+            method="POST",
+            url=f"{self.base_url}/uploads/{upload_id}/complete",
+            headers=headers,
+            json={
+                "parts": [
+                    {"number": part.number, "checksum": part.checksum} for part in parts
+                ]
+            },
+            parser=partial(self._parse_chunked_upload, parts=parts),
+        )
+
+    @staticmethod
+    def _parse_upload_id(data: Dict[str, str]) -> str:
+        """Parse the ID of a created chunked upload."""
+        return data["upload_id"]
+
+    @staticmethod
+    def _parse_received_parts(data: Dict[str, Any]) -> Dict[int, str]:
+        """Parse the checksums of the parts received, keyed by part number."""
+        return {int(part["number"]): part["checksum"] for part in data["parts"]}
+
+    @staticmethod
+    def _parse_chunked_upload(
+        data: Dict[str, Any], parts: List[UploadPart]
+    ) -> ChunkedUpload:
+        """Parse the response of a completed chunked upload."""
+        return ChunkedUpload(
+            upload_id=data["upload_id"],
+            url=data["url"],
+            size=sum(part.size for part in parts),
+            parts=parts,
+        )
+
+    @staticmethod
+    def _parse_extract_job(
+        data: Dict[str, Any], display_name: str, source: str, settings: JobSettings
+    ) -> ExtractJob:
+        """Parse the response of a started Extraction job."""
+        logger.info("Extract job started.")
+        return ExtractJob(
+            display_name=display_name,
+            job_name=data["job_name"],
+            source=source,
+            settings=settings,
+        )
+
+    @staticmethod
+    def _parse_summarize_job(
+        data: Dict[str, Any], display_name: str, source: str, settings: JobSettings
+    ) -> SummarizeJob:
+        """Parse the response of a started Summary job."""
+        logger.info("Summary job started.")
+        return SummarizeJob(
+            display_name=display_name,
+            job_name=data["job_name"],
+            source=source,
+            settings=settings,
+        )
+
+    @staticmethod
+    def _parse_transcribe_job(
+        data: Dict[str, Any],
+        display_name: str,
+        source: str,
+        source_lang: str,
+        settings: JobSettings,
+    ) -> TranscribeJob:
+        """Parse the response of a started transcription job."""
+        logger.info("Transcription job started.")
+        return TranscribeJob(
+            display_name=display_name,
+            job_name=data["job_name"],
+            source=source,
+            source_lang=source_lang,
+            settings=settings,
+        )
+
+    @staticmethod
+    def _parse_job(data: Dict[str, Any]) -> Union[ExtractJob, SummarizeJob]:
+        """Parse a job."""
+        if "summary_details" in data:
+            return SummarizeJob(**data)
         else:
-            raise ValueError(r.text)
+            return ExtractJob(**data)
+
+    @staticmethod
+    def _parse_list_jobs(data: Dict[str, Any]) -> ListJobs:
+        """Parse a page of jobs."""
+        return ListJobs(
+            page_count=int(data["page_count"]),
+            next_page=data.get("next"),
+            results=data["results"],
+        )
+
+    @staticmethod
+    @no_type_check
+    def _parse_deleted_job(
+        data: Dict[str, str], job_name: str, warning: bool
+    ) -> Dict[str, str]:
+        """Parse the response of a deleted job."""
+        if warning:
+            logger.warning(f"Job {job_name} deleted.")
+        return data
+
+    @staticmethod
+    def _parse_list_transcripts(data: Dict[str, Any]) -> ListTranscripts:
+        """Parse a page of transcripts."""
+        return ListTranscripts(
+            page_count=int(data["page_count"]),
+            next_page=data.get("next"),
+            results=data["results"],
+        )
+
+    @staticmethod
+    def _parse_transcript_item(data: Dict[str, Any]) -> BaseTranscript:
+        """Parse a transcript of a page of transcripts."""
+        return BaseTranscript(**data)
+
+    @staticmethod
+    def _parse_utterance(data: Dict[str, Any]) -> TranscriptUtterance:
+        """Parse an utterance of a transcript."""
+        return TranscriptUtterance(**data)
+
+    @staticmethod
+    def _parse_transcript(data: Dict[str, Any]) -> BaseTranscript:
+        """Parse a transcript."""
+        return BaseTranscript(**data)
+
+    @staticmethod
+    def _parse_changed_speaker_labels(data: Dict[str, Any]) -> BaseTranscript:
+        """Parse the transcript with the new speaker labels."""
+        logger.info("Speaker labels changed.")
+        return BaseTranscript(**data)
+
+    @staticmethod
+    def _parse_list_summaries(data: Dict[str, Any]) -> ListSummaries:
+        """Parse a page of summaries."""
+        return ListSummaries(
+            page_count=int(data["page_count"]),
+            next_page=data.get("next"),
+            results=data["results"],
+        )
+
+    @staticmethod
+    def _parse_summary_item(data: Dict[str, Any]) -> BaseSummary:
+        """Parse a summary of a page of summaries."""
+        return BaseSummary(**data)
+
+    @staticmethod
+    def _parse_structured_summaries(
+        data: Dict[str, Any],
+    ) -> Dict[str, List[StructuredSummary]]:
+        """Parse the structured summaries of a summary length."""
+        return {
+            "structured_summary": [
+                StructuredSummary(**items) for items in data["structured_summary"]
+            ]
+        }
+
+    @staticmethod
+    def _parse_summary(data: Dict[str, Any]) -> BaseSummary:
+        """Parse a summary."""
+        summaries = data.pop("summary")
+        summary = BaseSummary(**data)
+        summary.summary = summaries
+        return summary
+
+
+class Client(BaseClient):
+    """Wordcab API Client."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        pool_connections: int = POOL_CONNECTIONS,
+        pool_maxsize: int = POOL_MAXSIZE,
+        retry_policy: Optional[RetryPolicy] = None,
+        on_attempt: Optional[Callable[[AttemptRecord], None]] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        base_url: str = API_BASE_URL,
+        transcript_cache: Optional[TranscriptCache] = None,
+        gzip_min_size: Optional[int] = None,
+        stream_responses: bool = False,
+        polling_policy: Optional[PollingPolicy] = None,
+        submit_max_workers: int = SUBMIT_MAX_WORKERS,
+        idempotency_keys: bool = False,
+    ):
+        """
+        Initialize the client.
+
+        Parameters
+        ----------
+        api_key : str, optional
+            The API key to use. The default is None. If None, the API key will be
+            automatically retrieved from the environment variable WORDCAB_API_KEY.
+        pool_connections : int
+            The number of host connection pools to cache. The default is 10.
+        pool_maxsize : int
+            The maximum number of connections kept alive per host. The default is 10.
+            Increase it if the client is shared by more threads than this value.
+        retry_policy : RetryPolicy, optional
+            The policy used to retry transient failures. The default is None. If None,
+            idempotent requests are retried up to 3 times on 429, 502, 503 and 504
+            responses and on connection errors.
+        on_attempt : Callable[[AttemptRecord], None], optional
+            A callback receiving the timing and outcome of every attempt of every
+            request, useful to tune the retry policy. The default is None.
+        rate_limiter : RateLimiter, optional
+            A client-side rate limiter delaying the requests, including the retries,
+            to stay under the API limits. It can be shared by several clients.
+            The default is None.
+        concurrency_limiter : AdaptiveConcurrencyLimiter, optional
+            An adaptive limit of the concurrent job submissions (`start_extract`,
+            `start_summary` and `start_transcription`), adjusted to the API load.
+            The default is None.
+        base_url : str
+            The base URL of the API. The default is `https://wordcab.com/api/v1`.
+        transcript_cache : TranscriptCache, optional
+            A local cache of the transcripts of the submitted sources. The summary
+            and extraction jobs of a source already transcribed reuse its transcript
+            instead of uploading it again. The default is None.
+        gzip_min_size : int, optional
+            The size, in bytes, from which the JSON bodies of `start_extract` and
+            `start_summary` are sent compressed with gzip. Transcripts compress 5 to
+            10 times, which speeds up the uploads on a slow uplink. The default is
+            None, meaning no compression. The compression runs in the calling thread,
+            not in a worker thread: a blocking call waits for the compressed body
+            anyway. zlib releases the GIL, so the threads starting jobs, e.g. with
+            the `submit_*` methods, compress in parallel.
+        stream_responses : bool
+            Whether to decode the transcripts, summaries and pages of jobs,
+            transcripts and summaries one item at a time while they are downloaded,
+            instead of decoding the whole response at once. The default is False.
+            Use it for the largest transcripts: the raw body, the decoded JSON and
+            the core objects then don't coexist in memory. The
+            body is read in chunks of 1 MiB.
+        polling_policy : PollingPolicy, optional
+            The default polling intervals of `wait_for_job` and `wait_for_jobs`. The
+            default is None. If None, a job is polled after 2 seconds, then less and
+            less often while its status doesn't change, up to every 60 seconds.
+            The jobs of the `submit_*` methods are polled with it as well.
+        submit_max_workers : int
+            The number of jobs of the `submit_*` methods uploaded and started
+            concurrently, in background threads. The default is 8.
+        idempotency_keys : bool
+            Whether to send the job creations without an `idempotency_key` with a
+            key derived from the content of the source and the job parameters. The
+            default is False. The job creations with a key are retried like the
+            idempotent requests, and the jobs they create are remembered: starting
+            a job again with the same key returns the job already created.
+        """
+        super().__init__(
+            api_key=api_key,
+            retry_policy=retry_policy,
+            on_attempt=on_attempt,
+            rate_limiter=rate_limiter,
+            concurrency_limiter=concurrency_limiter,
+            base_url=base_url,
+            transcript_cache=transcript_cache,
+            gzip_min_size=gzip_min_size,
+            stream_responses=stream_responses,
+            polling_policy=polling_policy,
+            idempotency_keys=idempotency_keys,
+        )
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValueError(
+                "`pool_connections` and `pool_maxsize` must be positive integers."
+            )
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.session = self._create_session()
+        self.submit_max_workers = submit_max_workers
+        self._scheduler: Optional[JobScheduler] = None
+        self._scheduler_lock = threading.Lock()
+
+    def __enter__(self) -> "Client":
+        """Enter the client context."""
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Optional[Union[ValueError, TypeError, AssertionError]],
+        exception_value: Optional[Exception],
+        traceback: Optional[Exception],
+    ) -> None:
+        """Exit the client context."""
+        self.close()
+
+    def _create_session(self) -> requests.Session:
+        """Create the keep-alive session shared by all the endpoint methods."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """
+        Close the session and release the pooled connections.
+
+        The futures of the `submit_*` methods not resolved yet are cancelled.
+        """
+        if self._scheduler is not None:
+            self._scheduler.close()
+        self.session.close()
+
+    def _get_scheduler(self) -> JobScheduler:
+        """Get the scheduler of the `submit_*` methods, creating it on first use."""
+        with self._scheduler_lock:
+            if self._scheduler is None:
+                self._scheduler = JobScheduler(
+                    poll_due_jobs=partial(self._poll_due_jobs, page_size=100),
+                    retrieve_result=self._retrieve_result,
+                    policy=self.polling_policy,
+                    max_workers=self.submit_max_workers,
+                )
+        return self._scheduler
+
+    def _retrieve_result(
+        self, started: BaseJob, finished: BaseJob
+    ) -> Union[BaseSummary, BaseTranscript]:
+        """Retrieve the summary or the transcript of a finished job."""
+        if isinstance(started, SummarizeJob):
+            return self.retrieve_summary(finished.summary_details["summary_id"])
+        return self.retrieve_transcript(finished.transcript_id)
+
+    def _send(self, request: APIRequest) -> requests.Response:
+        """Send a single attempt of a request with the session."""
+        limiter = self._get_concurrency_limiter(request)
+        if limiter is not None:
+            limiter.acquire()
+        start = time.monotonic()
+        r, timed_out = None, False
+        try:
+            r = self.session.request(
+                request.method,
+                request.url,
+                headers=request.headers,
+                params=request.params,
+                data=request.data,
+                files=request.files,
+                json=request.json,
+                timeout=self.timeout,
+                stream=self._streams(request),
+            )
+        except requests.Timeout:
+            timed_out = True
+            raise
+        finally:
+            self._release_concurrency(limiter, start, r, timed_out)
+
+        return r
+
+    def _execute(self, request: APIRequest) -> Any:
+        """Send a request, retry it per the retry policy and parse the response."""
+        try:
+            attempt = 0
+            while True:
+                attempt += 1
+                if self.rate_limiter is not None:
+                    self.rate_limiter.acquire(request.endpoint)
+                start = time.monotonic()
+                try:
+                    r = self._send(request)
+                except (requests.ConnectionError, requests.Timeout) as e:
+                    delay = self.retry_policy.next_delay(
+                        request.method,
+                        attempt,
+                        connection_error=True,
+                        idempotent=request.idempotency_key is not None,
+                    )
+                    self._record_attempt(request, attempt, start, error=e, delay=delay)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+
+                if r.status_code in request.expected_status:
+                    self._record_attempt(
+                        request, attempt, start, status_code=r.status_code
+                    )
+                    if not self._streams(request):
+                        return request.parser(self._decode(request, r.content))
+                    with r:
+                        body = ChunkReader(r.iter_content(JSON_STREAM_CHUNK_SIZE))
+                        return request.parser(
+                            _load_json_stream(body, request.member_parsers)  # type: ignore
+                        )
+
+                delay = self.retry_policy.next_delay(
+                    request.method,
+                    attempt,
+                    status_code=r.status_code,
+                    retry_after=r.headers.get("Retry-After"),
+                    idempotent=request.idempotency_key is not None,
+                )
+                self._record_attempt(
+                    request, attempt, start, status_code=r.status_code, delay=delay
+                )
+                if delay is None:
+                    raise ValueError(r.text)
+                r.close()
+                time.sleep(delay)
+        finally:
+            if isinstance(request.data, UploadStream):
+                request.data.close()
+
+    @no_type_check
+    def request(
+        self,
+        method: str,
+        **kwargs: Union[bool, int, str, Dict[str, str], List[int], List[str]],
+    ) -> Union[
+        BaseSource,
+        BaseSummary,
+        BaseTranscript,
+        ExtractJob,
+        ListJobs,
+        ListSummaries,
+        ListTranscripts,
+        Stats,
+        SummarizeJob,
+        Union[ExtractJob, SummarizeJob],
+    ]:
+        """Make a request to the Wordcab API."""
+        if not method:
+            raise ValueError("You must specify a method.")
+        return getattr(self, method)(**kwargs)
+
+    def get_stats(
+        self,
+        min_created: Optional[str] = None,
+        max_created: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Stats:
+        """Get the stats of the account."""
+        return self._execute(
+            self._prepare_get_stats(
+                min_created=min_created, max_created=max_created, tags=tags
+            )
+        )
+
+    def start_extract(
+        self,
+        source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
+        display_name: str,
+        ephemeral_data: Optional[bool] = False,
+        only_api: Optional[bool] = True,
+        pipelines: Union[str, List[str]] = [  # noqa: B006
+            "questions_answers",
+            "topic_segments",
+            "emotions",
+            "speaker_talk_ratios",
+        ],
+        split_long_utterances: Optional[bool] = False,
+        tags: Optional[Union[str, List[str]]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> ExtractJob:
+        """Start an Extraction job."""
+        source_object, content_hash = self._deduplicate_source(source_object)
+        source_id = self._identify_source(source_object, idempotency_key, content_hash)
+        job_params = {
+            "display_name": display_name,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "pipelines": pipelines,
+            "split_long_utterances": split_long_utterances,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_extract", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = self._prepare_start_extract(source_object=source_object, **job_params)
+        self._set_idempotency_key(request, idempotency_key)
+
+        job = self._execute(self._compress_request(request))
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    def start_summary(
+        self,
+        source_object: Union[BaseSource, InMemorySource, WordcabTranscriptSource],
+        display_name: str,
+        summary_type: str,
+        context: Optional[Union[str, List[str]]] = None,
+        ephemeral_data: Optional[bool] = False,
+        only_api: Optional[bool] = True,
+        pipelines: Union[str, List[str]] = ["transcribe", "summarize"],  # noqa: B006
+        source_lang: Optional[str] = None,
+        split_long_utterances: Optional[bool] = False,
+        summary_lens: Optional[Union[int, List[int]]] = None,
+        target_lang: Optional[str] = None,
+        tags: Optional[Union[str, List[str]]] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> SummarizeJob:
+        """Start a Summary job."""
+        source_object, content_hash = self._deduplicate_source(source_object)
+        source_id = self._identify_source(source_object, idempotency_key, content_hash)
+        job_params = {
+            "display_name": display_name,
+            "summary_type": summary_type,
+            "context": context,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "pipelines": pipelines,
+            "source_lang": source_lang,
+            "split_long_utterances": split_long_utterances,
+            "summary_lens": summary_lens,
+            "target_lang": target_lang,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_summary", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = self._prepare_start_summary(source_object=source_object, **job_params)
+        self._set_idempotency_key(request, idempotency_key)
+
+        job = self._execute(self._compress_request(request))
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    def start_transcription(
+        self,
+        source_object: Union[AudioSource, YoutubeSource],
+        display_name: str,
+        source_lang: str,
+        diarization: bool = False,
+        ephemeral_data: bool = False,
+        only_api: Optional[bool] = True,
+        tags: Union[str, List[str], None] = None,
+        api_key: Union[str, None] = None,
+        idempotency_key: Optional[str] = None,
+    ) -> TranscribeJob:
+        """Start a transcription job."""
+        content_hash = (
+            hash_source(source_object) if self.transcript_cache is not None else None
+        )
+        source_id = self._identify_source(source_object, idempotency_key, content_hash)
+        job_params = {
+            "display_name": display_name,
+            "source_lang": source_lang,
+            "diarization": diarization,
+            "ephemeral_data": ephemeral_data,
+            "only_api": only_api,
+            "tags": tags,
+        }
+        idempotency_key = self._derive_idempotency_key(
+            "start_transcription", idempotency_key, source_id, job_params
+        )
+        created_job = self._lookup_created_job(idempotency_key)
+        if created_job is not None:
+            return created_job
+        request = self._prepare_start_transcription(
+            source_object=source_object, **job_params
+        )
+        self._set_idempotency_key(request, idempotency_key)
+        if isinstance(source_object, AudioSource) and source_object.chunked:
+            request.params["url"] = self.upload_audio(source_object).url
+
+        job = self._execute(request)
+        self._record_created_job(request, job)
+        self._remember_submission(job, content_hash)
+        return job
+
+    def submit_extract(self, **kwargs: Any) -> JobFuture:
+        """
+        Start an extraction job in the background.
+
+        The source is uploaded and the job started by a background thread, then the
+        job is polled with the other submitted jobs, and its transcript retrieved.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            The arguments of `start_extract`.
+
+        Returns
+        -------
+        JobFuture
+            The future of the transcript of the job, with the extraction results.
+        """
+        return self._get_scheduler().submit(partial(self.start_extract, **kwargs))
+
+    def submit_summary(self, **kwargs: Any) -> JobFuture:
+        """
+        Start a summary job in the background.
+
+        The source is uploaded and the job started by a background thread, then the
+        job is polled with the other submitted jobs, and its summary retrieved.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            The arguments of `start_summary`.
+
+        Returns
+        -------
+        JobFuture
+            The future of the summary of the job.
+
+        Examples
+        --------
+        >>> from concurrent.futures import as_completed
+        >>> from wordcab import Client
+
+        >>> with Client() as client:  # doctest: +SKIP
+        ...     futures = [
+        ...         client.submit_summary(source_object=source, display_name=name)
+        ...         for name, source in sources.items()
+        ...     ]
+        ...     for future in as_completed(futures, timeout=3600):
+        ...         print(future.result().get_formatted_summaries())
+        """
+        return self._get_scheduler().submit(partial(self.start_summary, **kwargs))
+
+    def submit_transcription(self, **kwargs: Any) -> JobFuture:
+        """
+        Start a transcription job in the background.
+
+        The audio is uploaded and the job started by a background thread, then the
+        job is polled with the other submitted jobs, and its transcript retrieved.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            The arguments of `start_transcription`.
+
+        Returns
+        -------
+        JobFuture
+            The future of the transcript of the job.
+        """
+        return self._get_scheduler().submit(partial(self.start_transcription, **kwargs))
+
+    def submit_batch(
+        self,
+        items: Iterable[Tuple[BaseSource, Dict[str, Any]]],
+        endpoint: str = "summary",
+        max_in_flight: int = BATCH_MAX_IN_FLIGHT,
+        journal: Optional[JobJournal] = None,
+        **params: Any,
+    ) -> Batch:
+        """
+        Submit many sources, yielding their results in order of completion.
+
+        The items are submitted with the `submit_*` method of the endpoint when the
+        returned batch is iterated. The input is read lazily, keeping at most
+        `max_in_flight` items submitted and not completed, and the failure of an item
+        is recorded in its result without stopping the batch.
+
+        Parameters
+        ----------
+        items : Iterable[Tuple[BaseSource, Dict[str, Any]]]
+            The sources, with the arguments of the `start_*` method specific to each
+            source, e.g. `display_name`.
+        endpoint : str
+            The jobs to start, one of `extract`, `summary` or `transcription`.
+            The default is `summary`.
+        max_in_flight : int
+            The maximum number of items submitted and not completed. The default
+            is 100. The uploads are also limited by `submit_max_workers`.
+        journal : JobJournal, optional
+            A local journal of the items. A batch restarted with the same journal
+            skips the items already completed and resumes polling the jobs already
+            started, instead of submitting them again.
+        **params : Any
+            The arguments of the `start_*` method shared by all the items. The
+            arguments of an item take precedence.
+
+        Returns
+        -------
+        Batch
+            The batch, to iterate over the `BatchResult` of the items. Its `progress`
+            gives the counters and the throughput of the batch.
+        """
+        submit_methods = {
+            "extract": self.submit_extract,
+            "summary": self.submit_summary,
+            "transcription": self.submit_transcription,
+        }
+        if endpoint not in submit_methods:
+            raise ValueError(
+                f"Invalid endpoint: {endpoint}. Must be one of {list(submit_methods)}."
+            )
+
+        return Batch(
+            submit_methods[endpoint],
+            items,
+            max_in_flight=max_in_flight,
+            params=params,
+            journal=journal,
+            resume=self.resume_job,
+        )
+
+    def resume_job(self, job_name: str) -> JobFuture:
+        """
+        Follow a job already started, e.g. by a previous run, in the background.
+
+        The job is polled with the submitted jobs, and its summary or transcript
+        retrieved.
+
+        Parameters
+        ----------
+        job_name : str
+            The name of the job.
+
+        Returns
+        -------
+        JobFuture
+            The future of the summary of a summary job, or of the transcript of
+            another job.
+        """
+        return self._get_scheduler().submit(
+            partial(self.retrieve_job, job_name), retrieved=True
+        )
+
+    def upload_audio(
+        self,
+        source_object: AudioSource,
+        part_size: int = UPLOAD_PART_SIZE,
+        max_workers: int = UPLOAD_MAX_WORKERS,
+    ) -> ChunkedUpload:
+        """
+        Upload a local audio file in parts sent concurrently.
+
+        The upload ID is stored in `source_object.upload_id`. If the upload fails,
+        calling this method, or `start_transcription`, with the same source resumes it:
+        only the parts not received yet, or received with another checksum, are sent.
+
+        Parameters
+        ----------
+        source_object : AudioSource
+            The audio source, created with `chunked=True`.
+        part_size : int
+            The size of the parts, in bytes. The default is 8 MiB.
+        max_workers : int
+            The number of parts sent concurrently. The default is 4.
+
+        Returns
+        -------
+        ChunkedUpload
+            The completed upload, with the URL of the assembled file.
+
+        Raises
+        ------
+        ValueError
+            If a part can't be sent. The parts already sent are kept for a resume.
+        """
+        parts = self._plan_upload(source_object, part_size, max_workers)
+        path = source_object.filepath
+
+        if source_object.upload_id is None:
+            received: Dict[int, str] = {}
+            source_object.upload_id = self._execute(
+                self._prepare_create_upload(
+                    path.name, sum(part.size for part in parts), part_size
+                )
+            )
+        else:
+            received = self._execute(
+                self._prepare_retrieve_upload(source_object.upload_id)
+            )
+        upload_id = source_object.upload_id
+
+        def send(part: UploadPart) -> bool:
+            data = read_part(path, part)
+            if received.get(part.number) == part.checksum:
+                return False
+            self._execute(self._prepare_upload_part(upload_id, part, data))
+            return True
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                sent = list(executor.map(send, parts))
+        except (ValueError, requests.RequestException) as e:
+            raise ValueError(
+                f"The chunked upload {upload_id} failed: {e}. Upload the same source"
+                " again to resume it."
+            ) from e
+
+        upload = self._execute(self._prepare_complete_upload(upload_id, parts))
+        upload.uploaded_parts = sum(sent)
+        return upload
+
+    def list_jobs(
+        self,
+        page_size: Optional[int] = 100,
+        page_number: Optional[int] = None,
+        order_by: Optional[str] = "-time_started",
+    ) -> ListJobs:
+        """List all jobs."""
+        jobs = self._execute(
+            self._prepare_list_jobs(
+                page_size=page_size, page_number=page_number, order_by=order_by
+            )
+        )
+        self._remember_transcripts(jobs)
+        return jobs
+
+    def retrieve_job(self, job_name: str) -> Union[ExtractJob, SummarizeJob]:
+        """Retrieve a job."""
+        job = self._execute(self._prepare_retrieve_job(job_name=job_name))
+        self._remember_transcripts(job)
+        return job
+
+    def wait_for_job(
+        self,
+        job: Union[str, BaseJob],
+        timeout: Optional[float] = None,
+        policy: Optional[PollingPolicy] = None,
+    ) -> Union[ExtractJob, SummarizeJob]:
+        """
+        Wait for a job to finish.
+
+        Parameters
+        ----------
+        job : Union[str, BaseJob]
+            The name of the job, or the job returned by a `start_*` method.
+        timeout : float, optional
+            The maximum time to wait, in seconds. The default is None, meaning no limit.
+        policy : PollingPolicy, optional
+            The polling intervals. The default is None. If None, the job is polled
+            after 2 seconds, then less and less often while its status doesn't change,
+            up to every 60 seconds, and never more often than its audio duration
+            requires.
+
+        Returns
+        -------
+        Union[ExtractJob, SummarizeJob]
+            The finished job. Check its `job_status`, the job may have failed.
+
+        Raises
+        ------
+        TimeoutError
+            If the job is still running after `timeout` seconds.
+        """
+        (finished,) = self.wait_for_jobs([job], timeout=timeout, policy=policy)
+        return finished
+
+    def wait_for_jobs(
+        self,
+        jobs: Iterable[Union[str, BaseJob]],
+        timeout: Optional[float] = None,
+        policy: Optional[PollingPolicy] = None,
+        page_size: int = 100,
+    ) -> Iterator[Union[ExtractJob, SummarizeJob]]:
+        """
+        Wait for several jobs to finish, yielding each job as soon as it finishes.
+
+        When several jobs are due for a poll, their statuses are refreshed with the
+        pages of `list_jobs`, most recent first, instead of one request per job. The
+        jobs not found in as many pages as there are jobs left to find are retrieved
+        one by one, so the waiter never sends more requests than individual polls.
+
+        Parameters
+        ----------
+        jobs : Iterable[Union[str, BaseJob]]
+            The names of the jobs, or the jobs returned by the `start_*` methods.
+        timeout : float, optional
+            The maximum time to wait, in seconds. The default is None, meaning no limit.
+        policy : PollingPolicy, optional
+            The polling intervals. The default is None, see `wait_for_job`.
+        page_size : int
+            The number of jobs of the pages of `list_jobs`. The default is 100.
+
+        Yields
+        ------
+        Union[ExtractJob, SummarizeJob]
+            The finished jobs, in order of completion.
+
+        Raises
+        ------
+        TimeoutError
+            If some jobs are still running after `timeout` seconds.
+        """
+        waiter = JobWaiter(jobs, policy or self.polling_policy, timeout)
+        while waiter.pending:
+            time.sleep(waiter.delay())
+            yield from self._poll_due_jobs(waiter, page_size)
+
+    def _poll_due_jobs(
+        self, waiter: JobWaiter, page_size: int
+    ) -> Iterator[Union[ExtractJob, SummarizeJob]]:
+        """Refresh the jobs due for a poll, yielding the jobs that finished."""
+        steps = self._poll_due_jobs_steps(waiter, page_size)
+        result = None
+        while True:
+            try:
+                step = steps.send(result)
+            except StopIteration:
+                return
+            if isinstance(step, tuple):
+                method, kwargs = step
+                result = getattr(self, method)(**kwargs)
+            else:
+                result = None
+                yield step
+
+    @no_type_check
+    def delete_job(self, job_name: str, warning: bool = True) -> Dict[str, str]:
+        """Delete a job."""
+        return self._execute(
+            self._prepare_delete_job(job_name=job_name, warning=warning)
+        )
+
+    def list_transcripts(
+        self, page_size: Optional[int] = 100, page_number: Optional[int] = None
+    ) -> ListTranscripts:
+        """List all transcripts."""
+        return self._execute(
+            self._prepare_list_transcripts(page_size=page_size, page_number=page_number)
+        )
+
+    def retrieve_transcript(self, transcript_id: str) -> BaseTranscript:
+        """Retrieve a transcript."""
+        return self._execute(
+            self._prepare_retrieve_transcript(transcript_id=transcript_id)
+        )
+
+    def change_speaker_labels(
+        self, transcript_id: str, speaker_map: Dict[str, str]
+    ) -> BaseTranscript:
+        """Change the speaker labels of a transcript."""
+        return self._execute(
+            self._prepare_change_speaker_labels(
+                transcript_id=transcript_id, speaker_map=speaker_map
+            )
+        )
+
+    def list_summaries(
+        self, page_size: Optional[int] = 100, page_number: Optional[int] = None
+    ) -> ListSummaries:
+        """List all summaries."""
+        return self._execute(
+            self._prepare_list_summaries(page_size=page_size, page_number=page_number)
+        )
+
+    def retrieve_summary(self, summary_id: str) -> BaseSummary:
+        """Retrieve a summary."""
+        return self._execute(self._prepare_retrieve_summary(summary_id=summary_id))
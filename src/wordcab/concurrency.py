@@ -0,0 +1,179 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API adaptive concurrency limiter."""
+
+import asyncio
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter adjusting its limit to the API load.
+
+    The limit follows an AIMD (additive increase, multiplicative decrease) scheme: it
+    grows by about one every `limit` successful requests, and it is multiplied by
+    `decrease_factor` when the API is overloaded, i.e. on a 429 or 503 response, a
+    timeout, or a latency above `latency_threshold` times the average latency. The
+    limit is cut at most once per average latency, so a burst of rejected requests
+    sent with the same limit only counts once.
+
+    The limiter can be shared by threads and coroutines.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from wordcab import Client
+    >>> from wordcab.concurrency import AdaptiveConcurrencyLimiter
+
+    >>> limiter = AdaptiveConcurrencyLimiter(max_limit=32)
+    >>> with Client(concurrency_limiter=limiter) as client:  # doctest: +SKIP
+    ...     with ThreadPoolExecutor(max_workers=32) as executor:
+    ...         jobs = list(executor.map(submit, sources))
+    >>> limiter.limit, limiter.latency  # doctest: +SKIP
+    (12, 0.84)
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        decrease_factor: float = 0.5,
+        latency_threshold: float = 2.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        """
+        Initialize the limiter.
+
+        Parameters
+        ----------
+        initial_limit : int
+            The number of concurrent requests allowed at first. The default is 4.
+        min_limit : int
+            The lowest limit. The default is 1.
+        max_limit : int
+            The highest limit. The default is 64.
+        decrease_factor : float
+            The factor applied to the limit when the API is overloaded, between 0 and
+            1. The default is 0.5.
+        latency_threshold : float
+            The ratio to the average latency above which a request counts as a latency
+            spike. The default is 2.0.
+        smoothing : float
+            The weight of the last request in the average latency, between 0 and 1.
+            The default is 0.2.
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError(
+                "The limits must verify 1 <= min_limit <= initial_limit <= max_limit."
+            )
+        if not 0 < decrease_factor < 1 or not 0 < smoothing <= 1:
+            raise ValueError(
+                "`decrease_factor` must be in ]0, 1[ and `smoothing` in ]0, 1]."
+            )
+        if latency_threshold <= 1:
+            raise ValueError("`latency_threshold` must be greater than 1.")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_threshold = latency_threshold
+        self.smoothing = smoothing
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._latency: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @property
+    def limit(self) -> int:
+        """The current number of concurrent requests allowed."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently sent."""
+        return self._in_flight
+
+    @property
+    def latency(self) -> Optional[float]:
+        """The exponentially weighted average latency, in seconds."""
+        return self._latency
+
+    def acquire(self) -> None:
+        """Block the current thread until a request can be sent."""
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request can be sent."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(
+        self, latency: Optional[float] = None, overloaded: bool = False
+    ) -> None:
+        """
+        Release a request slot and adjust the limit.
+
+        Parameters
+        ----------
+        latency : float, optional
+            The latency of the request, in seconds. None if no response was received.
+        overloaded : bool
+            Whether the API rejected the request because of its load, or timed out.
+            The default is False.
+        """
+        with self._cond:
+            self._in_flight -= 1
+            now = time.monotonic()
+            window = self._latency or 0
+
+            if latency is not None and not overloaded:
+                if self._latency is None:
+                    self._latency = latency
+                overloaded = latency > self.latency_threshold * self._latency
+                self._latency += self.smoothing * (latency - self._latency)
+                if not overloaded:
+                    self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+
+            if overloaded and now - self._last_decrease >= window:
+                self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                self._last_decrease = now
+
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    """Wake up a coroutine waiting for a request slot."""
+    if not waiter.done():
+        waiter.set_result(None)
@@ -16,10 +16,17 @@
 
 from pathlib import Path
 
+API_BASE_URL = "https://wordcab.com/api/v1"
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
 AVAILABLE_AUDIO_FORMATS = [".flac", ".m4a", ".mp3", ".mpga", ".ogg", ".wav"]
 AVAILABLE_GENERIC_FORMATS = [".json", ".txt"]
 AVAILABLE_PLAN = ["free", "metered", "paid"]
+BATCH_MAX_IN_FLIGHT = 100
+CONCURRENCY_ENDPOINTS = ["start_extract", "start_summary", "start_transcription"]
+CONCURRENCY_OVERLOAD_STATUS_CODES = [429, 503]
 CONTEXT_ELEMENTS = ["discussion_points", "issue", "keywords", "next_steps", "purpose"]
+DOWNLOAD_SPOOL_SIZE = 8 * 1024 * 1024
 EXTRACT_AVAILABLE_STATUS = [
     "Deleted",
     "Error",
@@ -35,13 +42,44 @@ EXTRACT_PIPELINES = [
     "emotions",
     "speaker_talk_ratios",
 ]
+EXTRACT_STATUS_PROGRESSION = [
+    "Pending",
+    "ItemQueued",
+    "PreparingExtraction",
+    "Extracting",
+    "ExtractionComplete",
+]
+GENERIC_SOURCE_OBJECTS = [
+    "AWSTranscribeSource",
+    "InMemorySource",
+    "SRTSource",
+    "VTTSource",
+]
+GZIP_COMPRESS_LEVEL = 6
+IDEMPOTENCY_RECORD_SIZE = 10_000
+JOB_JOURNAL_FLUSH_INTERVAL = 1.0
+JOB_JOURNAL_FLUSH_SIZE = 500
+JOB_JOURNAL_PATH = Path.home() / ".wordcab" / "job_journal.sqlite"
+JOB_POLL_BACKOFF_FACTOR = 1.5
+JOB_POLL_MAX_INTERVAL = 60
+JOB_POLL_MIN_INTERVAL = 2
+JOB_PROCESSING_RATIO = 0.2
+JSON_STREAM_CHUNK_SIZE = 1024 * 1024
 LIST_JOBS_ORDER_BY = [
     "time_started",
     "time_completed",
     "-time_started",
     "-time_completed",
 ]
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 10
 REQUEST_TIMEOUT = 30
+RETRY_BASE_DELAY = 0.5
+RETRY_JITTER = 0.5
+RETRY_MAX_ATTEMPTS = 3
+RETRY_MAX_DELAY = 30
+RETRY_METHODS = ["DELETE", "GET", "HEAD", "OPTIONS", "PUT"]
+RETRY_STATUS_CODES = [429, 502, 503, 504]
 SOURCE_LANG = ["de", "en", "es", "fr", "it", "nl", "pt", "sv"]
 SOURCE_OBJECT_MAPPING = {
     "generic": "GenericSource",
@@ -53,6 +91,7 @@ SOURCE_OBJECT_MAPPING = {
     "vtt": "VTTSource",
     "youtube": "YoutubeSource",
 }
+SUBMIT_MAX_WORKERS = 8
 SUMMARIZE_AVAILABLE_STATUS = [
     "Deleted",
     "Error",
@@ -65,6 +104,16 @@ SUMMARIZE_AVAILABLE_STATUS = [
     "Transcribing",
     "TranscriptComplete",
 ]
+SUMMARIZE_STATUS_PROGRESSION = [
+    "Pending",
+    "ItemQueued",
+    "PreparingTranscript",
+    "Transcribing",
+    "TranscriptComplete",
+    "PreparingSummary",
+    "Summarizing",
+    "SummaryComplete",
+]
 SUMMARY_LENGTHS_RANGE = [1, 5]
 SUMMARY_PIPELINES = ["transcribe", "summarize"]
 SUMMARY_TYPES = ["brief", "conversational", "narrative", "no_speaker"]
@@ -170,6 +219,7 @@ TRANSCRIBE_LANGUAGE_CODES = [
     "yo",
     "zh",
 ]
+TRANSCRIPT_CACHE_PATH = Path.home() / ".wordcab" / "transcript_cache.sqlite"
 TRANSCRIPT_SPEAKER_MAPPING = {
     0: "A",
     1: "B",
@@ -198,4 +248,7 @@ TRANSCRIPT_SPEAKER_MAPPING = {
     24: "Y",
     25: "Z",
 }
+UPLOAD_CHUNK_SIZE = 64 * 1024
+UPLOAD_MAX_WORKERS = 4
+UPLOAD_PART_SIZE = 8 * 1024 * 1024
 WORDCAB_TOKEN_FOLDER = Path.home() / ".wordcab" / "token"  # noqa: S105
@@ -18,11 +18,13 @@ from .job import BaseJob, ExtractJob, JobSettings, ListJobs, SummarizeJob, Trans
 from .source import (
     AssemblyAISource,
     AudioSource,
+    AWSTranscribeSource,
     BaseSource,
     DeepgramSource,
     GenericSource,
     InMemorySource,
     RevSource,
+    SRTSource,
     VTTSource,
     WordcabTranscriptSource,
     YoutubeSource,
@@ -34,6 +36,7 @@ from .transcript import BaseTranscript, ListTranscripts, TranscriptUtterance
 __all__ = [
     "AssemblyAISource",
     "AudioSource",
+    "AWSTranscribeSource",
     "BaseJob",
     "BaseSource",
     "BaseSummary",
@@ -47,6 +50,7 @@ __all__ = [
     "ListSummaries",
     "ListTranscripts",
     "RevSource",
+    "SRTSource",
     "Stats",
     "StructuredSummary",
     "SummarizeJob",
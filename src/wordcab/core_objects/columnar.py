@@ -0,0 +1,351 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wordcab columnar transcript.
+
+It requires NumPy, installed with `pip install wordcab[columnar]`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ..config import TRANSCRIPT_SPEAKER_MAPPING
+from ..serialization import dumps, loads
+from .source import AWSTranscribeSource, BaseSource, InMemorySource, _SubtitleSource
+from .utils import _CUE_SPEAKER, _get_aws_transcribe_utterances, _iter_subtitle_cues
+
+Utterance = Tuple[float, float, Optional[str], str]
+
+
+@dataclass
+class ColumnarTranscript:
+    """
+    Transcript stored as columns, shared by all the transcript formats.
+
+    Each utterance is a row of the `start`, `end`, `speaker`, `text_start` and
+    `text_end` arrays. The texts of the utterances are stored in a single string,
+    joined by a space, so merging consecutive utterances or selecting a time range
+    only computes new arrays of indices, without copying the texts.
+
+    Parameters
+    ----------
+    start : np.ndarray
+        The start times of the utterances, in seconds, NaN if unknown.
+    end : np.ndarray
+        The end times of the utterances, in seconds, NaN if unknown.
+    speaker : np.ndarray
+        The speaker codes of the utterances, indices of `speaker_labels`, or -1 if
+        the speaker is unknown.
+    text_start : np.ndarray
+        The start offsets of the texts of the utterances in `text`.
+    text_end : np.ndarray
+        The end offsets of the texts of the utterances in `text`.
+    text : str
+        The texts of all the utterances, joined by a space.
+    speaker_labels : List[str]
+        The speaker labels, e.g. `["A", "B"]`.
+
+    Examples
+    --------
+    >>> from wordcab.core_objects import DeepgramSource
+    >>> from wordcab.core_objects.columnar import ColumnarTranscript
+
+    >>> source = DeepgramSource(filepath="path/to/deepgram/file.json")  # doctest: +SKIP
+    >>> transcript = ColumnarTranscript.from_source(source)  # doctest: +SKIP
+    >>> transcript.slice_time(60, 120).merge_speakers().to_lines()  # doctest: +SKIP
+    ['SPEAKER A: ...', 'SPEAKER B: ...']
+    """
+
+    start: np.ndarray = field(repr=False)
+    end: np.ndarray = field(repr=False)
+    speaker: np.ndarray = field(repr=False)
+    text_start: np.ndarray = field(repr=False)
+    text_end: np.ndarray = field(repr=False)
+    text: str = field(repr=False)
+    speaker_labels: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        """Get the number of utterances."""
+        return len(self.start)
+
+    @classmethod
+    def from_utterances(cls, utterances: Iterable[Utterance]) -> "ColumnarTranscript":
+        """
+        Build a columnar transcript from utterances.
+
+        Parameters
+        ----------
+        utterances : Iterable[Tuple[float, float, Optional[str], str]]
+            The start time, end time, speaker label and text of the utterances.
+
+        Returns
+        -------
+        ColumnarTranscript
+            The columnar transcript.
+        """
+        starts: List[float] = []
+        ends: List[float] = []
+        codes: List[int] = []
+        texts: List[str] = []
+        labels: Dict[str, int] = {}
+
+        for start, end, label, text in utterances:
+            starts.append(start)
+            ends.append(end)
+            codes.append(-1 if label is None else labels.setdefault(label, len(labels)))
+            texts.append(text)
+
+        lengths = np.fromiter(map(len, texts), dtype=np.int64, count=len(texts))
+        text_start = np.cumsum(lengths + 1) - (lengths + 1)
+        return cls(
+            start=np.asarray(starts, dtype=np.float64),
+            end=np.asarray(ends, dtype=np.float64),
+            speaker=np.asarray(codes, dtype=np.int32),
+            text_start=text_start,
+            text_end=text_start + lengths,
+            text=" ".join(texts),
+            speaker_labels=list(labels),
+        )
+
+    @classmethod
+    def from_assembly_ai(cls, assembly_json: Dict[str, Any]) -> "ColumnarTranscript":
+        """Build a columnar transcript from an AssemblyAI json object."""
+        utterances = _get_key(assembly_json, ("utterances",), "AssemblyAI")
+        return cls.from_utterances(
+            (utt["start"] / 1000, utt["end"] / 1000, str(utt["speaker"]), utt["text"])
+            for utt in utterances
+        )
+
+    @classmethod
+    def from_aws_transcribe(cls, aws_json: Dict[str, Any]) -> "ColumnarTranscript":
+        """Build a columnar transcript from an AWS Transcribe json object."""
+        return cls.from_utterances(_get_aws_transcribe_utterances(aws_json))
+
+    @classmethod
+    def from_deepgram(cls, deepgram_json: Dict[str, Any]) -> "ColumnarTranscript":
+        """Build a columnar transcript from a Deepgram json object."""
+        utterances = _get_key(deepgram_json, ("results", "utterances"), "Deepgram")
+        return cls.from_utterances(
+            (
+                utt["start"],
+                utt["end"],
+                TRANSCRIPT_SPEAKER_MAPPING[int(utt["speaker"])],
+                utt["transcript"],
+            )
+            for utt in utterances
+        )
+
+    @classmethod
+    def from_rev(cls, rev_json: Dict[str, Any]) -> "ColumnarTranscript":
+        """Build a columnar transcript from a Rev.ai json object."""
+        monologues = _get_key(rev_json, ("monologues",), "Rev.ai")
+        return cls.from_utterances(
+            _rev_utterance(monologue) for monologue in monologues
+        )
+
+    @classmethod
+    def from_vtt(cls, content: Union[str, bytes]) -> "ColumnarTranscript":
+        """Build a columnar transcript from the content of a VTT or SRT file."""
+        if isinstance(content, bytes):
+            content = content.decode("utf-8-sig")
+        return cls.from_utterances(_iter_subtitle_cues(content.splitlines()))
+
+    @classmethod
+    def from_srt(cls, content: Union[str, bytes]) -> "ColumnarTranscript":
+        """Build a columnar transcript from the content of an SRT file."""
+        return cls.from_vtt(content)
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str]) -> "ColumnarTranscript":
+        """Build a columnar transcript from `SPEAKER X: text` lines, without times."""
+        return cls.from_utterances(
+            (np.nan, np.nan, *_split_speaker(line)) for line in lines if line.strip()
+        )
+
+    @classmethod
+    def from_source(
+        cls, source_object: Union[BaseSource, InMemorySource]
+    ) -> "ColumnarTranscript":
+        """
+        Build a columnar transcript from a transcript source object.
+
+        Parameters
+        ----------
+        source_object : Union[BaseSource, InMemorySource]
+            An AssemblyAI, AWS Transcribe, Deepgram, Rev.ai, VTT, SRT, generic or
+            in-memory source.
+
+        Returns
+        -------
+        ColumnarTranscript
+            The columnar transcript.
+
+        Raises
+        ------
+        ValueError
+            If the source is not a transcript, e.g. an audio file.
+        """
+        if isinstance(source_object, InMemorySource):
+            return cls.from_lines(source_object.obj["transcript"])  # type: ignore
+        if isinstance(source_object, _SubtitleSource):
+            return cls.from_utterances(source_object.iter_utterances())
+
+        source = source_object.source
+        if source not in ("assembly_ai", "deepgram", "rev_ai", "generic"):
+            raise ValueError(f"Can't build a transcript from a {source} source.")
+
+        if getattr(source_object, "incremental", False):
+            content = source_object._extract_utterances()  # type: ignore
+            for key in reversed(source_object._utterances_path):  # type: ignore
+                content = {key: content}
+        else:
+            source_object.load()
+            if source == "generic" and source_object._suffix == ".txt":
+                content = source_object.file_object.decode("utf-8").splitlines()  # type: ignore
+            else:
+                content = loads(source_object.file_object)  # type: ignore
+            source_object.release()
+
+        if isinstance(source_object, AWSTranscribeSource):
+            return cls.from_aws_transcribe(content)
+        elif source == "assembly_ai":
+            return cls.from_assembly_ai(content)
+        elif source == "deepgram":
+            return cls.from_deepgram(content)
+        elif source == "rev_ai":
+            return cls.from_rev(content)
+        return cls.from_lines(content)
+
+    def _take(self, rows: np.ndarray) -> "ColumnarTranscript":
+        """Select rows, sharing the text buffer and the speaker labels."""
+        return ColumnarTranscript(
+            start=self.start[rows],
+            end=self.end[rows],
+            speaker=self.speaker[rows],
+            text_start=self.text_start[rows],
+            text_end=self.text_end[rows],
+            text=self.text,
+            speaker_labels=self.speaker_labels,
+        )
+
+    def merge_speakers(self) -> "ColumnarTranscript":
+        """
+        Merge the consecutive utterances of each speaker.
+
+        Returns
+        -------
+        ColumnarTranscript
+            The transcript with one utterance per speaker turn, spanning the times
+            and the texts of the merged utterances.
+        """
+        if len(self) == 0:
+            return self
+
+        continued = (self.speaker[1:] == self.speaker[:-1]) & (
+            self.text_start[1:] == self.text_end[:-1] + 1
+        )
+        first = np.flatnonzero(np.concatenate(([True], ~continued)))
+        last = np.concatenate((first[1:] - 1, [len(self) - 1]))
+
+        return ColumnarTranscript(
+            start=self.start[first],
+            end=self.end[last],
+            speaker=self.speaker[first],
+            text_start=self.text_start[first],
+            text_end=self.text_end[last],
+            text=self.text,
+            speaker_labels=self.speaker_labels,
+        )
+
+    def slice_time(
+        self, start: Optional[float] = None, end: Optional[float] = None
+    ) -> "ColumnarTranscript":
+        """
+        Select the utterances overlapping a time range.
+
+        Parameters
+        ----------
+        start : float, optional
+            The start of the range, in seconds, by default the start of the transcript.
+        end : float, optional
+            The end of the range, in seconds, by default the end of the transcript.
+
+        Returns
+        -------
+        ColumnarTranscript
+            The transcript of the range. The utterances without times are excluded.
+        """
+        mask = ~(np.isnan(self.start) | np.isnan(self.end))
+        if start is not None:
+            mask &= self.end > start
+        if end is not None:
+            mask &= self.start < end
+        return self._take(np.flatnonzero(mask))
+
+    def texts(self) -> List[str]:
+        """Get the texts of the utterances."""
+        text = self.text
+        return [
+            text[i:j] for i, j in zip(self.text_start.tolist(), self.text_end.tolist())
+        ]
+
+    def to_lines(self) -> List[str]:
+        """Get the utterances as `SPEAKER X: text` lines."""
+        prefixes = [f"SPEAKER {label}: " for label in self.speaker_labels] + [""]
+        return [
+            prefixes[code] + text
+            for code, text in zip(self.speaker.tolist(), self.texts())
+        ]
+
+    def to_payload(self) -> bytes:
+        """Prepare the payload of the transcript, as sent for an in-memory source."""
+        return dumps({"transcript": self.to_lines()})
+
+    def to_source(self) -> InMemorySource:
+        """Convert the transcript to an in-memory source, to start a job with it."""
+        return InMemorySource(obj=self.to_lines())
+
+
+def _get_key(content: Dict[str, Any], path: Tuple[str, ...], provider: str) -> Any:
+    """Get the utterances of a json object, without modifying it."""
+    for key in path:
+        if not isinstance(content, dict) or key not in content:
+            raise ValueError(
+                f"No {key} key found. Verify the {provider} json file you are using."
+            )
+        content = content[key]
+    return content
+
+
+def _rev_utterance(monologue: Dict[str, Any]) -> Utterance:
+    """Get the times, speaker and text of a Rev.ai monologue."""
+    elements = monologue["elements"]
+    timed = [element for element in elements if "ts" in element]
+    return (
+        timed[0]["ts"] if timed else np.nan,
+        timed[-1]["end_ts"] if timed else np.nan,
+        TRANSCRIPT_SPEAKER_MAPPING[int(monologue["speaker"])],
+        "".join(element["value"] for element in elements).strip(),
+    )
+
+
+def _split_speaker(line: str) -> Tuple[Optional[str], str]:
+    """Split a line in its speaker, from a `SPEAKER X:` or `<v X>` prefix, and text."""
+    match = _CUE_SPEAKER.match(line)
+    if match is None:
+        return None, line.strip()
+    return (match.group(1) or match.group(2)).strip(), line[match.end() :].strip()
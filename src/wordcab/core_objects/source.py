@@ -14,22 +14,40 @@
 
 """Wordcab API Source object."""
 
-import json
+import io
 import logging
 import urllib.parse
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Union, no_type_check
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+    no_type_check,
+)
 
-import requests  # type: ignore
 import validators  # type: ignore
 
-from ..config import AVAILABLE_AUDIO_FORMATS, AVAILABLE_GENERIC_FORMATS, REQUEST_TIMEOUT
+from ..config import AVAILABLE_AUDIO_FORMATS, AVAILABLE_GENERIC_FORMATS
+from ..serialization import dumps, loads
+from ..streaming import UploadStream, download_to_spooled_file
 from ..utils import _is_youtube_link
 from .utils import (
+    _extract_json_subtree,
     _get_assembly_utterances,
+    _get_aws_transcribe_utterances,
     _get_deepgram_utterances,
     _get_rev_monologues,
+    _iter_subtitle_cues,
 )
 
 logger = logging.getLogger(__name__)
@@ -48,6 +66,17 @@ class BaseSource:
     url_headers : Optional[Dict[str, str]], optional
         Headers to retrieve the file from the URL, by default None.
         Useful if the file requires authentication to be retrieved.
+    max_download_size : Optional[int], optional
+        Maximum size of the remote file, in bytes, by default None, meaning no limit.
+    download_progress : Optional[Callable[[int, Optional[int]], None]], optional
+        Callback receiving the number of bytes downloaded and the total size of the
+        remote file, None if unknown, after each downloaded chunk, by default None.
+    lazy : bool, optional
+        Whether to defer reading or downloading the file until the client prepares
+        the request, by default False. A lazy source releases the content once the
+        request is prepared, so many sources can be queued without holding their
+        content in memory. Its payload is released with the content, and serialized
+        again by the next request.
 
     Raises
     ------
@@ -80,8 +109,17 @@ class BaseSource:
     filepath: Optional[Union[str, Path]] = field(default=None, repr=False)
     url: Optional[str] = field(default=None, repr=False)
     url_headers: Optional[Dict[str, str]] = field(default=None, repr=False)
+    max_download_size: Optional[int] = field(default=None, repr=False)
+    download_progress: Optional[Callable[[int, Optional[int]], None]] = field(
+        default=None, repr=False
+    )
+    lazy: bool = field(default=False, repr=False)
     source: str = field(init=False)
     source_type: str = field(init=False)
+    file_object: Optional[bytes] = field(default=None, init=False, repr=False)
+    _payload_content: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     _stem: str = field(init=False, repr=False)
     _suffix: str = field(init=False, repr=False)
 
@@ -133,16 +171,40 @@ class BaseSource:
         with open(self.filepath, "rb") as f:
             return f.read()
 
-    def _load_file_from_url(self) -> requests.Response.content:
+    def _load_file_from_url(self) -> bytes:
         """Load file from URL."""
-        if self.url_headers:
-            file = requests.get(
-                self.url, headers=self.url_headers, timeout=REQUEST_TIMEOUT
-            )
-        else:
-            file = requests.get(self.url, timeout=REQUEST_TIMEOUT)
+        with self._download_file() as f:
+            return f.read()
+
+    @no_type_check
+    def _download_file(self) -> BinaryIO:
+        """Download the remote file in chunks to a spooled temporary file."""
+        return download_to_spooled_file(
+            self.url,
+            headers=self.url_headers,
+            max_size=self.max_download_size,
+            progress=self.download_progress,
+        )
+
+    def _load_file(self) -> Optional[bytes]:
+        """Load file from the local path or the URL."""
+        if self.source_type == "local":
+            return self._load_file_from_path()
+        elif self.source_type == "remote":
+            return self._load_file_from_url()
+        return None
+
+    def load(self) -> None:
+        """Load the content of the file in `file_object`, if not loaded yet."""
+        if self.file_object is None:
+            self.file_object = self._load_file()
 
-        return file.content
+    def release(self) -> None:
+        """Release the content of a lazy source, it is loaded again when needed."""
+        if self.lazy:
+            self.file_object = None
+            self._payload_content = None
+            self.__dict__.pop("payload", None)
 
     def _check_if_url_is_valid(self) -> bool:
         """Check if URL is valid."""
@@ -151,8 +213,26 @@ class BaseSource:
 
         return True
 
-    def prepare_payload(self) -> Union[str, bytes, Dict[str, bytes]]:
-        """Prepare payload."""
+    def prepare_payload(self) -> Union[bytes, Dict[str, bytes]]:
+        """
+        Prepare payload for API request.
+
+        The payload is built once per loaded content and reused by the following
+        requests, e.g. a summary and an extraction job of the same source. It is
+        built again if `file_object` is replaced. The memo only covers the eager
+        sources: a lazy source releases its payload with its content once the request
+        is prepared, so its payload is built again for every request.
+        """
+        if (
+            "payload" not in self.__dict__
+            or self._payload_content is not self.file_object
+        ):
+            self.payload = self._build_payload()
+            self._payload_content = self.file_object
+        return self.payload
+
+    def _build_payload(self) -> Union[bytes, Dict[str, bytes]]:
+        """Build the payload from the content of the file."""
         raise NotImplementedError("Payload preparation is not implemented yet.")
 
     def prepare_headers(self) -> Dict[str, str]:
@@ -226,9 +306,9 @@ class InMemorySource:
                 "Please provide a valid in-memory object. It must be a list or a dict."
             )
 
-    def prepare_payload(self) -> str:
+    def prepare_payload(self) -> bytes:
         """Prepare payload for API request."""
-        self.payload = json.dumps(self.obj)
+        self.payload = dumps(self.obj)
         return self.payload
 
     def prepare_headers(self) -> Dict[str, str]:
@@ -287,8 +367,6 @@ class GenericSource(BaseSource):
         The generic source object.
     """
 
-    file_object: bytes = field(init=False, repr=False)
-
     def __post_init__(self) -> None:
         """Post-init method."""
         super().__post_init__()
@@ -298,20 +376,14 @@ class GenericSource(BaseSource):
             raise ValueError(
                 f"Please provide a valid file format. {self._suffix} is not valid."
             )
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote":
-            self.file_object = self._load_file_from_url()
+        if not self.lazy:
+            self.load()
 
-    def prepare_payload(self) -> str:
-        """Prepare payload for API request."""
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content of the file."""
         if self._suffix == ".json":
-            self.payload = json.dumps({"transcript": json.loads(self.file_object)})
-        elif self._suffix == ".txt":
-            self.payload = json.dumps(
-                {"transcript": self.file_object.decode("utf-8").splitlines()}
-            )
-        return self.payload
+            return dumps({"transcript": loads(self.file_object)})
+        return dumps({"transcript": self.file_object.decode("utf-8").splitlines()})
 
     def prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API request."""
@@ -333,6 +405,25 @@ class AudioSource(BaseSource):
         The path to the local file.
     url : str
         The URL to the remote file.
+    download : bool
+        Whether to download the remote file and upload it to the API, by default
+        False.
+    stream : bool
+        Whether to stream the file in chunks when sending the request instead of
+        loading it in memory, by default False. A remote file is streamed to a spooled
+        temporary file first, it requires `download=True`.
+    fileobj : Union[BinaryIO, Iterable[bytes]], optional
+        An open binary file object or an iterator of bytes to stream, instead of
+        `filepath` or `url`, by default None.
+    filename : str, optional
+        The name of the file streamed from `fileobj`, used to get its format, by
+        default the `name` attribute of the file object.
+    chunked : bool
+        Whether `start_transcription` uploads the local file in parts sent
+        concurrently, which can be resumed after a failure, by default False.
+    upload_id : str, optional
+        The ID of the chunked upload of the file, set by the client to resume it,
+        by default None.
 
     Raises
     ------
@@ -340,6 +431,8 @@ class AudioSource(BaseSource):
         If the file format is not supported.
     ValueError
         If both `filepath` and `url` are provided.
+    ValueError
+        If `fileobj` is provided with `filepath` or `url`, or without filename.
     TypeError
         If the path is not a string or a Path object.
     FileNotFoundError
@@ -353,34 +446,98 @@ class AudioSource(BaseSource):
     >>> audio_source  # doctest: +SKIP
     AudioSource(...)
 
+    >>> audio_source = AudioSource(filepath="path/to/audio/file.wav", stream=True)  # doctest: +SKIP
+    >>> with open("path/to/audio/file.wav", "rb") as f:  # doctest: +SKIP
+    ...     audio_source = AudioSource(fileobj=f)
+
     Returns
     -------
     AudioSource
         The audio source object.
     """
 
-    file_object: bytes = field(init=False, repr=False)
     download: bool = field(default=False, repr=False)
+    stream: bool = field(default=False, repr=False)
+    fileobj: Optional[Union[BinaryIO, Iterable[bytes]]] = field(
+        default=None, repr=False
+    )
+    filename: Optional[str] = field(default=None, repr=False)
+    chunked: bool = field(default=False, repr=False)
+    upload_id: Optional[str] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         """Post-init method."""
+        if self.chunked and (self.fileobj is not None or self.url):
+            raise ValueError("Only a local `filepath` can be uploaded in chunks.")
+        if self.chunked:
+            self.stream = True
+
+        if self.fileobj is not None:
+            self._init_from_fileobj()
+            return
+
         super().__post_init__()
         self.source = "audio"
         if self._suffix not in AVAILABLE_AUDIO_FORMATS:
             raise ValueError(
                 f"Please provide a valid file format. {self._suffix} is not valid."
             )
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote" and self.download is True:
-            self.file_object = self._load_file_from_url()
-        else:
-            self.file_object = None
+        if self.stream and self.source_type == "remote" and self.download is False:
+            raise ValueError(
+                "A remote file can only be streamed when it is downloaded, use"
+                " `download=True`."
+            )
 
-    def prepare_payload(self) -> Dict[str, bytes]:
-        """Prepare payload for API request."""
-        self.payload = {"audio_file": self.file_object}
-        return self.payload
+        if not self.lazy:
+            self.load()
+
+    def _init_from_fileobj(self) -> None:
+        """Initialize a source streamed from a file object or an iterator."""
+        if self.filepath or self.url:
+            raise ValueError(
+                "Please provide either `fileobj`, `filepath` or `url`, not several."
+            )
+        name = self.filename if self.filename else getattr(self.fileobj, "name", None)
+        if not isinstance(name, str):
+            raise ValueError(
+                "Please provide the `filename` of the file object to stream."
+            )
+
+        self.source = "audio"
+        self.source_type = "local"
+        self._stem = Path(name).stem
+        self._suffix = Path(name).suffix
+        if self._suffix not in AVAILABLE_AUDIO_FORMATS:
+            raise ValueError(
+                f"Please provide a valid file format. {self._suffix} is not valid."
+            )
+        self.stream = True
+
+    def _load_file(self) -> Optional[bytes]:
+        """Load the file, unless it is streamed or sent to the API as a URL."""
+        if self.stream or (self.source_type == "remote" and self.download is False):
+            return None
+        return super()._load_file()
+
+    def prepare_stream(self) -> UploadStream:
+        """
+        Prepare a request body streaming the audio file in chunks.
+
+        A remote file is first downloaded in chunks to a spooled temporary file, which
+        is then uploaded without loading it in memory a second time. The temporary
+        file is closed with the stream.
+        """
+        if not self.stream:
+            raise ValueError("The source is not streamed, use `stream=True`.")
+        if self.fileobj is not None:
+            return UploadStream(self.fileobj)
+        if self.source_type == "remote":
+            return UploadStream(self._download_file(), close_source=True)
+        return UploadStream(self.filepath)  # type: ignore
+
+    def _build_payload(self) -> Dict[str, bytes]:
+        """Build the payload from the content of the file."""
+        return {"audio_file": self.file_object}
 
     @no_type_check
     def prepare_headers(self) -> dict:
@@ -490,7 +647,50 @@ class WordcabTranscriptSource:
 
 
 @dataclass
-class AssemblyAISource(BaseSource):
+class _TranscriptExportSource(BaseSource):
+    """
+    Base class for the JSON transcripts exported from another provider.
+
+    It is not meant to be used directly.
+
+    Parameters
+    ----------
+    incremental : bool, optional
+        Whether to read only the utterances of the JSON file, in chunks, when the
+        client prepares the request, instead of loading and parsing the whole file,
+        by default False. The memory used then depends on the size of the
+        utterances, not of the file, which also holds the words and the metadata.
+    """
+
+    incremental: bool = field(default=False, repr=False)
+    _provider: ClassVar[str]
+    _utterances_path: ClassVar[Tuple[str, ...]]
+
+    def _load_file(self) -> Optional[bytes]:
+        """Load the file, unless only its utterances are read incrementally."""
+        if self.incremental:
+            return None
+        return super()._load_file()
+
+    def _extract_utterances(self) -> Any:
+        """Parse the utterances of the JSON file, without parsing the rest."""
+        if self.source_type == "local":
+            with open(self.filepath, "rb") as f:  # type: ignore
+                utterances = _extract_json_subtree(f, self._utterances_path)
+        else:
+            with self._download_file() as f:
+                utterances = _extract_json_subtree(f, self._utterances_path)
+
+        if utterances is None:
+            raise ValueError(
+                f"No {self._utterances_path[-1]} key found. Verify the"
+                f" {self._provider} json file you are using."
+            )
+        return loads(utterances)
+
+
+@dataclass
+class AssemblyAISource(_TranscriptExportSource):
     """
     AssemblyAI source object using a local or remote AssemblyAI JSON file.
 
@@ -500,6 +700,10 @@ class AssemblyAISource(BaseSource):
         The path to the local file.
     url : str
         The URL to the remote file.
+    incremental : bool
+        Whether to read only the utterances of the JSON file, in chunks, instead of
+        loading and parsing the whole file, by default False. Use it for the exports
+        of long recordings.
 
     Raises
     ------
@@ -522,6 +726,9 @@ class AssemblyAISource(BaseSource):
         The AssemblyAI source object.
     """
 
+    _provider: ClassVar[str] = "AssemblyAI"
+    _utterances_path: ClassVar[Tuple[str, ...]] = ("utterances",)
+
     def __post_init__(self) -> None:
         """Post-init method."""
         super().__post_init__()
@@ -533,17 +740,14 @@ class AssemblyAISource(BaseSource):
                 " valid, it should be .json."
             )
 
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote":
-            self.file_object = self._load_file_from_url()
+        if not self.lazy and not self.incremental:
+            self.load()
 
-    def prepare_payload(self) -> str:
-        """Prepare payload for API request."""
-        self.payload = json.dumps(
-            _get_assembly_utterances(json.loads(self.file_object))
-        )
-        return self.payload
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content of the file."""
+        if self.incremental:
+            return dumps(self._extract_utterances())
+        return dumps(_get_assembly_utterances(loads(self.file_object)))
 
     def prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API request."""
@@ -555,7 +759,7 @@ class AssemblyAISource(BaseSource):
 
 
 @dataclass
-class DeepgramSource(BaseSource):
+class DeepgramSource(_TranscriptExportSource):
     """
     Deepgram source object using a local or remote Deepgram JSON file.
 
@@ -565,6 +769,10 @@ class DeepgramSource(BaseSource):
         The path to the local file.
     url : str
         The URL to the remote file.
+    incremental : bool
+        Whether to read only the utterances of the JSON file, in chunks, instead of
+        loading and parsing the whole file, by default False. Use it for the exports
+        of long recordings.
 
     Raises
     ------
@@ -587,6 +795,9 @@ class DeepgramSource(BaseSource):
         The Deepgram source object.
     """
 
+    _provider: ClassVar[str] = "Deepgram"
+    _utterances_path: ClassVar[Tuple[str, ...]] = ("results", "utterances")
+
     def __post_init__(self) -> None:
         """Post-init method."""
         super().__post_init__()
@@ -598,17 +809,14 @@ class DeepgramSource(BaseSource):
                 " valid, it should be .json."
             )
 
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote":
-            self.file_object = self._load_file_from_url()
+        if not self.lazy and not self.incremental:
+            self.load()
 
-    def prepare_payload(self) -> str:
-        """Prepare payload for API request."""
-        self.payload = json.dumps(
-            _get_deepgram_utterances(json.loads(self.file_object))
-        )
-        return self.payload
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content of the file."""
+        if self.incremental:
+            return dumps(self._extract_utterances())
+        return dumps(_get_deepgram_utterances(loads(self.file_object)))
 
     def prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API request."""
@@ -620,7 +828,7 @@ class DeepgramSource(BaseSource):
 
 
 @dataclass
-class RevSource(BaseSource):
+class RevSource(_TranscriptExportSource):
     """
     Rev.ai source object using a local or remote Rev.ai JSON file.
 
@@ -630,6 +838,10 @@ class RevSource(BaseSource):
         The path to the local file.
     url : str
         The URL to the remote file.
+    incremental : bool
+        Whether to read only the utterances of the JSON file, in chunks, instead of
+        loading and parsing the whole file, by default False. Use it for the exports
+        of long recordings.
 
     Raises
     ------
@@ -652,6 +864,9 @@ class RevSource(BaseSource):
         The Rev.ai source object.
     """
 
+    _provider: ClassVar[str] = "Rev.ai"
+    _utterances_path: ClassVar[Tuple[str, ...]] = ("monologues",)
+
     def __post_init__(self) -> None:
         """Post-init method."""
         super().__post_init__()
@@ -663,15 +878,79 @@ class RevSource(BaseSource):
                 " valid, it should be .json."
             )
 
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote":
-            self.file_object = self._load_file_from_url()
+        if not self.lazy and not self.incremental:
+            self.load()
 
-    def prepare_payload(self) -> str:
-        """Prepare payload for API request."""
-        self.payload = json.dumps(_get_rev_monologues(json.loads(self.file_object)))
-        return self.payload
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content of the file."""
+        if self.incremental:
+            return dumps(self._extract_utterances())
+        return dumps(_get_rev_monologues(loads(self.file_object)))
+
+    def prepare_headers(self) -> Dict[str, str]:
+        """Prepare headers for API request."""
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        return self.headers
+
+
+@dataclass
+class AWSTranscribeSource(BaseSource):
+    """
+    AWS Transcribe source object using a local or remote AWS Transcribe JSON file.
+
+    The items of the file are merged in speaker turns and sent as a generic
+    transcript, one `SPEAKER A: ...` line per turn.
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        The path to the local file.
+    url : str
+        The URL to the remote file.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not valid.
+
+    Examples
+    --------
+    >>> from wordcab.core_objects import AWSTranscribeSource
+
+    >>> aws_source = AWSTranscribeSource(filepath="path/to/aws/file.json")  # doctest: +SKIP
+    >>> aws_source  # doctest: +SKIP
+    AWSTranscribeSource(...)
+    >>> aws_source.source  # doctest: +SKIP
+    'generic'
+
+    Returns
+    -------
+    AWSTranscribeSource
+        The AWS Transcribe source object.
+    """
+
+    def __post_init__(self) -> None:
+        """Post-init method."""
+        super().__post_init__()
+        self.source = "generic"
+
+        if self._suffix != ".json":
+            raise ValueError(
+                f"Please provide a valid AWS Transcribe file format. {self._suffix} is"
+                " not valid, it should be .json."
+            )
+
+        if not self.lazy:
+            self.load()
+
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content of the file."""
+        return _transcript_payload(
+            _get_aws_transcribe_utterances(loads(self.file_object))
+        )
 
     def prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API request."""
@@ -683,7 +962,106 @@ class RevSource(BaseSource):
 
 
 @dataclass
-class VTTSource(BaseSource):
+class _SubtitleSource(BaseSource):
+    """
+    Base class for the subtitle files, parsed in timestamped cues.
+
+    It is not meant to be used directly. The cues are parsed when the client prepares
+    the request, reading the file line by line, and sent as a generic transcript, one
+    `SPEAKER X: ...` line per cue.
+    """
+
+    def _load_file(self) -> Optional[bytes]:
+        """Skip loading the file, its cues are read line by line."""
+        return None
+
+    def _open_cues(self) -> TextIO:
+        """Open the loaded content, the local file or the remote file as text."""
+        if self.file_object is not None:
+            raw: BinaryIO = io.BytesIO(self.file_object)
+        elif self.source_type == "local":
+            raw = open(self.filepath, "rb")  # type: ignore
+        else:
+            raw = self._download_file()
+        return io.TextIOWrapper(raw, encoding="utf-8-sig")
+
+    def iter_utterances(self) -> Iterator[Tuple[float, float, Optional[str], str]]:
+        """
+        Parse the cues of the file, one at a time.
+
+        Yields
+        ------
+        Tuple[float, float, Optional[str], str]
+            The start and end times in seconds, the speaker, None if unknown, and
+            the text of each cue.
+        """
+        with self._open_cues() as f:
+            yield from _iter_subtitle_cues(f)
+
+    def _build_payload(self) -> bytes:
+        """Build the payload from the cues of the file."""
+        return _transcript_payload(self.iter_utterances())
+
+    def prepare_headers(self) -> Dict[str, str]:
+        """Prepare headers for API request."""
+        self.headers = {
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+        }
+        return self.headers
+
+
+@dataclass
+class SRTSource(_SubtitleSource):
+    """
+    SRT source object using a local or remote SRT file.
+
+    The cues are parsed locally and sent as a generic transcript.
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        The path to the local file.
+    url : str
+        The URL to the remote file.
+
+    Raises
+    ------
+    ValueError
+        If the file format is not valid.
+
+    Examples
+    --------
+    >>> from wordcab.core_objects import SRTSource
+
+    >>> srt_source = SRTSource(filepath="path/to/srt/file.srt")  # doctest: +SKIP
+    >>> srt_source  # doctest: +SKIP
+    SRTSource(...)
+    >>> srt_source.source  # doctest: +SKIP
+    'generic'
+    >>> next(srt_source.iter_utterances())  # doctest: +SKIP
+    (0.0, 5.0, 'A', 'Hello.')
+
+    Returns
+    -------
+    SRTSource
+        The SRT source object.
+    """
+
+    def __post_init__(self) -> None:
+        """Post-init method."""
+        super().__post_init__()
+        self.source = "generic"
+
+        if self._suffix != ".srt":
+            raise ValueError(
+                f"Please provide a valid SRT file format. {self._suffix} is not valid,"
+                " it should be .srt."
+            )
+
+
+@dataclass
+class VTTSource(_SubtitleSource):
     """
     VTT source object using a local or remote VTT file.
 
@@ -693,6 +1071,10 @@ class VTTSource(BaseSource):
         The path to the local file.
     url : str
         The URL to the remote file.
+    parse : bool
+        Whether to parse the cues locally and send them as a generic transcript,
+        instead of uploading the file, by default False. The file is then read line
+        by line when the client prepares the request.
 
     Raises
     ------
@@ -708,6 +1090,8 @@ class VTTSource(BaseSource):
     VTTSource(...)
     >>> vtt_source.source  # doctest: +SKIP
     'vtt'
+    >>> VTTSource(filepath="path/to/vtt/file.vtt", parse=True).source  # doctest: +SKIP
+    'generic'
 
     Returns
     -------
@@ -715,12 +1099,13 @@ class VTTSource(BaseSource):
         The VTT source object.
     """
 
+    parse: bool = field(default=False, repr=False)
     filename: str = field(init=False)
 
     def __post_init__(self) -> None:
         """Post-init method."""
         super().__post_init__()
-        self.source = "vtt"
+        self.source = "generic" if self.parse else "vtt"
 
         if self._suffix != ".vtt":
             raise ValueError(
@@ -728,21 +1113,50 @@ class VTTSource(BaseSource):
                 " it should be .vtt."
             )
 
-        if self.source_type == "local":
-            self.file_object = self._load_file_from_path()
-        elif self.source_type == "remote":
-            self.file_object = self._load_file_from_url()
+        if not self.lazy:
+            self.load()
 
-        self.filename = self.filepath.name  # type: ignore
+        self.filename = f"{self._stem}{self._suffix}"
 
-    def prepare_payload(self) -> bytes:
-        """Prepare payload for API request."""
-        self.payload: bytes = self.file_object
-        return self.payload
+    def _load_file(self) -> Optional[bytes]:
+        """Load the file, unless its cues are parsed."""
+        if self.parse:
+            return None
+        return BaseSource._load_file(self)
+
+    def _build_payload(self) -> bytes:
+        """Build the payload from the content or the cues of the file."""
+        if self.parse:
+            return super()._build_payload()
+        return self.file_object  # type: ignore
 
     def prepare_headers(self) -> Dict[str, str]:
         """Prepare headers for API request."""
+        if self.parse:
+            return super().prepare_headers()
         self.headers = {
             "Content-Disposition": f"attachment; filename={self.filename}",
         }
         return self.headers
+
+
+def _transcript_payload(
+    utterances: Iterable[Tuple[float, float, Optional[str], str]],
+) -> bytes:
+    """
+    Build the payload of a generic transcript, one `SPEAKER X: ...` line per utterance.
+
+    The utterances are converted to a `ColumnarTranscript` when NumPy is installed,
+    with `pip install wordcab[columnar]`, and formatted one by one otherwise. Both
+    produce the same payload.
+    """
+    try:
+        from .columnar import ColumnarTranscript
+    except ImportError:  # pragma: no cover
+        transcript = [
+            f"SPEAKER {speaker}: {text}" if speaker else text
+            for _, _, speaker, text in utterances
+        ]
+        return dumps({"transcript": transcript})
+
+    return ColumnarTranscript.from_utterances(utterances).to_payload()
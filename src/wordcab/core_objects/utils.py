@@ -14,8 +14,41 @@
 
 """Wordcab core objects utils functions."""
 
+import re
 import textwrap
-from typing import Any, Dict
+from itertools import accumulate
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..config import JSON_STREAM_CHUNK_SIZE, TRANSCRIPT_SPEAKER_MAPPING
+from ..serialization import loads
+
+_ANY_BYTE = re.compile(rb".", re.DOTALL)
+_BRACKET_DEPTH = {ord("{"): 1, ord("["): 1, ord("}"): -1, ord("]"): -1}
+_COMPLETE_STRINGS = re.compile(rb'(?:[^"]+|"[^"\\]*(?:\\.[^"\\]*)*")*')
+_CUE_SPEAKER = re.compile(r"^(?:<v(?:\.[^\s>]*)*\s+([^>]+)>|SPEAKER\s+([^:]+):)\s*")
+_CUE_TAG = re.compile(r"</?[\w.][^>]*>")
+_CUE_TIMING = re.compile(
+    r"((?:\d+:)?\d+:\d+[.,]\d+)[ \t]+-->[ \t]+((?:\d+:)?\d+:\d+[.,]\d+)"
+)
+_NON_BRACKETS = bytes(byte for byte in range(256) if byte not in _BRACKET_DEPTH)
+_NON_MARKS = _NON_BRACKETS.replace(b'"', b"")
+_NON_WHITESPACE = re.compile(rb"[^ \t\n\r]")
+_SCALAR_END = re.compile(rb"[ \t\n\r,\]}]")
+_SKIP_WINDOW = 64 * 1024
+_SKIP_WINDOW_MIN = 512
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+_STRING_END = re.compile(rb'["\\]')
+_STRING_OR_BRACKET = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[{}\[\]]')
 
 
 def _get_context_items(
@@ -54,6 +87,135 @@ def _get_assembly_utterances(assembly_json: Dict[str, Any]) -> Any:
     return utterances
 
 
+def _get_aws_transcribe_utterances(
+    aws_json: Dict[str, Any],
+) -> Iterator[Tuple[float, float, str, str]]:
+    """
+    Merge the items of an AWS Transcribe json object in speaker turns.
+
+    The items are read once: the words of a turn are buffered in a list and joined
+    when the speaker changes, the punctuation being attached to the previous word.
+    The speakers are named A, B, ... in their order of appearance.
+
+    Parameters
+    ----------
+    aws_json : Dict[str, Any]
+        The AWS Transcribe json object, or its `results` object.
+
+    Yields
+    ------
+    Tuple[float, float, str, str]
+        The start time, end time, speaker and text of each speaker turn.
+    """
+    results = aws_json.get("results", aws_json)
+    items = results.get("items")
+
+    if items is None:
+        raise ValueError(
+            "No items key found. Verify the AWS Transcribe json file you are using."
+        )
+
+    # Older outputs only label the speakers in the segments, by item start time
+    segment_speakers = {
+        item["start_time"]: item["speaker_label"]
+        for segment in results.get("speaker_labels", {}).get("segments", [])
+        for item in segment.get("items", [])
+    }
+    speakers: Dict[Optional[str], str] = {}
+
+    speaker = ""
+    words: list = []
+    start = end = 0.0
+    for item in items:
+        content = item["alternatives"][0]["content"]
+        if item.get("type") == "punctuation":
+            if words:
+                words[-1] += content
+            continue
+
+        label = item.get("speaker_label", segment_speakers.get(item.get("start_time")))
+        name = speakers.setdefault(label, TRANSCRIPT_SPEAKER_MAPPING[len(speakers)])
+        if words and name != speaker:
+            yield start, end, speaker, " ".join(words)
+            words = []
+        if not words:
+            speaker, start = name, float(item["start_time"])
+        words.append(content)
+        end = float(item["end_time"])
+
+    if words:
+        yield start, end, speaker, " ".join(words)
+
+
+def _iter_subtitle_cues(
+    lines: Iterable[str],
+) -> Iterator[Tuple[float, float, Optional[str], str]]:
+    """
+    Parse the cues of a VTT or SRT file, one at a time.
+
+    The lines are read once and only the lines of the current cue are held in
+    memory, so a file object can be parsed whatever its size. The blocks without
+    timing, like the header, the notes and the styles, are skipped.
+
+    Parameters
+    ----------
+    lines : Iterable[str]
+        The lines of the file.
+
+    Yields
+    ------
+    Tuple[float, float, Optional[str], str]
+        The start and end times in seconds, the speaker from a `<v X>` or
+        `SPEAKER X:` prefix, None if there is none, and the text of each cue.
+    """
+    timing: Optional[Tuple[str, str]] = None
+    text: List[str] = []
+    for line in lines:
+        line = line.strip()
+        if timing is None:
+            match = _CUE_TIMING.match(line) if "-->" in line else None
+            if match is not None:
+                timing = match.group(1, 2)
+        elif line:
+            text.append(line)
+        else:
+            yield _make_cue(timing, text)
+            timing, text = None, []
+
+    if timing is not None:
+        yield _make_cue(timing, text)
+
+
+def _make_cue(
+    timing: Tuple[str, str], text: List[str]
+) -> Tuple[float, float, Optional[str], str]:
+    """Build a cue from its timing line timestamps and its text lines."""
+    content = " ".join(text)
+    speaker = None
+    match = _CUE_SPEAKER.match(content)
+    if match is not None:
+        speaker = (match.group(1) or match.group(2)).strip()
+        content = content[match.end() :]
+    if "<" in content:
+        content = _CUE_TAG.sub("", content).strip()
+    return (
+        _parse_cue_timestamp(timing[0]),
+        _parse_cue_timestamp(timing[1]),
+        speaker,
+        content,
+    )
+
+
+def _parse_cue_timestamp(timestamp: str) -> float:
+    """Parse a VTT or SRT timestamp, e.g. `01:02:03.500` or `01:02:03,500`, in seconds."""
+    *hours, minutes, seconds = timestamp.split(":")
+    return (
+        int(hours[0] if hours else 0) * 3600
+        + int(minutes) * 60
+        + float(seconds.replace(",", "."))
+    )
+
+
 def _get_deepgram_utterances(deepgram_json: Dict[str, Any]) -> Any:
     """Get the Deepgram utterances."""
     results = deepgram_json.pop("results", None)
@@ -85,6 +247,264 @@ def _get_rev_monologues(rev_json: Dict[str, Any]) -> Any:
     return monologues
 
 
+class _JSONScanner:
+    """
+    Scanner of a JSON document read in chunks from a binary file.
+
+    It only tokenizes the structure of the document: the values are skipped, or
+    captured as raw bytes, without being parsed. The objects and arrays are skipped
+    by windows: the strings are removed and the brackets counted by the regex and
+    bytes methods, instead of looping over every token in Python.
+    """
+
+    def __init__(self, f: BinaryIO, chunk_size: int) -> None:
+        """Initialize the scanner."""
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = b""
+        self.pos = 0
+        self.capture: Optional[bytearray] = None
+
+    def consume(self, end: int) -> None:
+        """Move to a position of the buffer, capturing the bytes passed if needed."""
+        if self.capture is not None:
+            self.capture += self.buffer[self.pos : end]
+        self.pos = end
+
+    def refill(self) -> None:
+        """Read the next chunk, after the bytes of the buffer not consumed yet."""
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            raise ValueError("Unexpected end of the JSON document.")
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+
+    def search(self, pattern: "re.Pattern[bytes]", consume: bool = True) -> bytes:
+        """Move to the next byte matching a pattern, reading new chunks as needed."""
+        while True:
+            match = pattern.search(self.buffer, self.pos)
+            if match is not None:
+                self.consume(match.end() if consume else match.start())
+                return match.group()
+            self.consume(len(self.buffer))
+            self.refill()
+
+    def skip_string(self) -> None:
+        """Skip the end of a string, after its opening quote."""
+        while self.search(_STRING_END) == b"\\":
+            self.search(_ANY_BYTE)
+
+    def read_string(self) -> str:
+        """Read the end of a string, after its opening quote."""
+        capture, self.capture = self.capture, bytearray(b'"')
+        self.skip_string()
+        string, self.capture = bytes(self.capture), capture
+        return loads(string)  # type: ignore
+
+    def skip_container(self) -> None:
+        """Skip the end of an object or an array, after its opening bracket."""
+        depth = 1
+        size = _SKIP_WINDOW_MIN  # Grows, so the small containers are cheap to skip
+        while True:
+            if self.pos == len(self.buffer):
+                self.refill()
+
+            window_end = min(len(self.buffer), self.pos + size)
+            size = min(size * 2, _SKIP_WINDOW)
+            window = self.buffer[self.pos : window_end]
+            if b'\\"' in window:  # Escaped quotes, the strings are matched by regex
+                end = self.pos + _COMPLETE_STRINGS.match(window).end()
+                outside_strings = _STRING.sub(b"", self.buffer[self.pos : end])
+                brackets = outside_strings.translate(None, _NON_BRACKETS)
+            else:  # Every quote starts or ends a string
+                parts = window.translate(None, _NON_MARKS).split(b'"')
+                end = window_end if len(parts) % 2 else self.pos + window.rfind(b'"')
+                brackets = b"".join(parts[0::2])
+
+            if end == self.pos:  # A string overlaps the end of the window
+                self.search(_ANY_BYTE)
+                self.skip_string()
+                continue
+
+            depths = list(
+                accumulate(map(_BRACKET_DEPTH.__getitem__, brackets), initial=depth)
+            )
+            if 0 not in depths:
+                depth = depths[-1]
+                self.consume(end)
+                continue
+
+            closing = depths.index(0)
+            for match in _STRING_OR_BRACKET.finditer(self.buffer, self.pos, end):
+                if len(match.group()) == 1:  # Bracket, not string
+                    closing -= 1
+                    if closing == 0:
+                        self.consume(match.end())
+                        return
+
+    def skip_flat_container(self, closing: bytes) -> bool:
+        """Skip the end of a container without nested containers, if it's buffered."""
+        end = self.buffer.find(closing, self.pos)
+        if end == -1:
+            return False
+        inner = self.buffer[self.pos : end]
+        if b"{" in inner or b"[" in inner or b'\\"' in inner or inner.count(b'"') % 2:
+            return False  # The closing bracket may be in a string or a nested container
+        self.consume(end + 1)
+        return True
+
+    def skip_value(self, first: bytes) -> None:
+        """Skip the end of a value, after its first byte."""
+        if first == b'"':
+            self.skip_string()
+        elif first == b"{":
+            if not self.skip_flat_container(b"}"):
+                self.skip_container()
+        elif first == b"[":
+            if not self.skip_flat_container(b"]"):
+                self.skip_container()
+        else:
+            self.search(_SCALAR_END, consume=False)
+
+    def capture_value(self, first: bytes) -> bytes:
+        """Capture the raw bytes of a value, after its first byte."""
+        self.capture = bytearray(first)
+        self.skip_value(first)
+        value, self.capture = bytes(self.capture), None
+        return value
+
+    def iter_members(self, opening: bytes) -> Iterator[Tuple[Optional[str], bytes]]:
+        """
+        Iterate over the members of an object or an array, after its opening bracket.
+
+        Yields the key of each member, None in an array, and the first byte of its
+        value. The value must be skipped or captured before the next iteration.
+        """
+        closing = b"}" if opening == b"{" else b"]"
+        while True:
+            byte = self.search(_NON_WHITESPACE)
+            if byte == closing:
+                return
+            if byte == b",":
+                continue
+            if opening == b"[":
+                yield None, byte
+                continue
+            if byte != b'"':
+                raise ValueError(f"Invalid JSON document, unexpected {byte!r}.")
+
+            key = self.read_string()
+            if self.search(_NON_WHITESPACE) != b":":
+                raise ValueError("Invalid JSON document, expected ':'.")
+            yield key, self.search(_NON_WHITESPACE)
+
+    def find(self, path: Tuple[str, ...]) -> Optional[bytes]:
+        """Capture the raw value at a path of keys in the current object."""
+        for key, first in self.iter_members(b"{"):
+            if key != path[0]:
+                self.skip_value(first)
+            elif len(path) == 1:
+                return self.capture_value(first)
+            elif first == b"{":
+                value = self.find(path[1:])
+                if value is not None:
+                    return value
+            else:
+                self.skip_value(first)
+        return None
+
+
+def _extract_json_subtree(
+    f: BinaryIO, path: Tuple[str, ...], chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Optional[bytes]:
+    """
+    Extract a subtree of a JSON document without parsing the rest of the document.
+
+    The document is read in chunks and only the value found at the path is kept in
+    memory, so the memory used depends on the size of the value, not of the file.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        The binary file of the JSON document, whose root is an object.
+    path : Tuple[str, ...]
+        The keys leading to the value, e.g. `("results", "utterances")`.
+    chunk_size : int
+        The size of the chunks read from the file, by default 1 MiB.
+
+    Returns
+    -------
+    Optional[bytes]
+        The raw JSON of the value, or None if the path is not in the document.
+
+    Raises
+    ------
+    ValueError
+        If the document is not a valid JSON object.
+    """
+    scanner = _JSONScanner(f, chunk_size)
+    if scanner.search(_NON_WHITESPACE) != b"{":
+        raise ValueError("Invalid JSON document, the root must be an object.")
+
+    return scanner.find(path)
+
+
+def _load_json_stream(
+    f: BinaryIO,
+    member_parsers: Dict[str, Callable[[Any], Any]],
+    chunk_size: int = JSON_STREAM_CHUNK_SIZE,
+) -> Dict[str, Any]:
+    """
+    Decode a JSON object read in chunks, converting its largest values item by item.
+
+    The items of the arrays, or the values of the objects, found at the keys of
+    `member_parsers` are decoded and converted one at a time, so the raw document,
+    its decoded values and the converted objects don't have to coexist in memory.
+
+    Parameters
+    ----------
+    f : BinaryIO
+        The binary file of the JSON document, whose root is an object.
+    member_parsers : Dict[str, Callable[[Any], Any]]
+        The functions converting the decoded items, by key of the root object.
+    chunk_size : int
+        The size of the chunks read from the file, by default 1 MiB.
+
+    Returns
+    -------
+    Dict[str, Any]
+        The decoded object, with the converted items at the keys of `member_parsers`.
+
+    Raises
+    ------
+    ValueError
+        If the document is not a valid JSON object.
+    """
+    scanner = _JSONScanner(f, chunk_size)
+    if scanner.search(_NON_WHITESPACE) != b"{":
+        raise ValueError("Invalid JSON document, the root must be an object.")
+
+    data: Dict[str, Any] = {}
+    for key, first in scanner.iter_members(b"{"):
+        parse = member_parsers.get(key)  # type: ignore
+        if parse is None or first not in (b"[", b"{"):
+            data[key] = loads(scanner.capture_value(first))  # type: ignore
+            continue
+
+        members = scanner.iter_members(first)
+        if first == b"{":
+            data[key] = {
+                item_key: parse(loads(scanner.capture_value(item_first)))
+                for item_key, item_first in members
+            }
+        else:
+            data[key] = [
+                parse(loads(scanner.capture_value(item_first)))
+                for _, item_first in members
+            ]
+    return data
+
+
 def _textwrap(text_to_wrap: str, width: int = 80) -> str:
     """
     Return a formatted string with the text wrapped to the specified width using textwrap.
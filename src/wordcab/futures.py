@@ -0,0 +1,276 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API job futures."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Set, Tuple
+
+from .core_objects import BaseJob
+from .polling import FAILED_STATUS, JobWaiter, PollingPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class JobFuture(Future):
+    """
+    Future of the result of a job started in the background.
+
+    Returned by the `submit_*` methods of `Client`, it is resolved with the summary
+    of a summary job, or the transcript of a transcription or extraction job, once
+    the job is uploaded, started, finished and its result retrieved. It supports all
+    the `concurrent.futures` functions, e.g. `as_completed` and `wait`, and can be
+    awaited in a coroutine.
+
+    Attributes
+    ----------
+    job : BaseJob, optional
+        The started job, None until the job is started.
+
+    Examples
+    --------
+    >>> from concurrent.futures import as_completed
+    >>> from wordcab import Client
+
+    >>> with Client() as client:  # doctest: +SKIP
+    ...     futures = [client.submit_summary(source_object=s, ...) for s in sources]
+    ...     for future in as_completed(futures):
+    ...         summary = future.result()
+    """
+
+    def __init__(self) -> None:
+        """Initialize the future, pending until the job result is retrieved."""
+        super().__init__()
+        self.job: Optional[BaseJob] = None
+        self._job_lock = threading.Lock()
+        self._job_callbacks: List[Callable[[BaseJob], Any]] = []
+
+    def add_job_callback(self, fn: Callable[[BaseJob], Any]) -> None:
+        """
+        Call a function with the job once it is started.
+
+        The function is called at once if the job is already started, and never if
+        the job can't be started.
+
+        Parameters
+        ----------
+        fn : Callable[[BaseJob], Any]
+            The function, called with the started job by a background thread.
+        """
+        with self._job_lock:
+            if self.job is None:
+                self._job_callbacks.append(fn)
+                return
+        self._call_job_callback(fn)
+
+    def set_job(self, job: BaseJob) -> None:
+        """Set the started job and call the job callbacks, used by the scheduler."""
+        with self._job_lock:
+            self.job = job
+            callbacks, self._job_callbacks = self._job_callbacks, []
+        for fn in callbacks:
+            self._call_job_callback(fn)
+
+    def _call_job_callback(self, fn: Callable[[BaseJob], Any]) -> None:
+        """Call a job callback, logging its errors like the done callbacks."""
+        try:
+            fn(self.job)
+        except Exception:
+            logger.exception(f"Exception calling the job callback of {self}.")
+
+    def __await__(self) -> Generator[Any, None, Any]:
+        """Wait for the result in the running event loop."""
+        return asyncio.wrap_future(self).__await__()
+
+
+class JobScheduler:
+    """
+    Background threads starting the jobs of the `JobFuture` and polling them.
+
+    The jobs are started by a pool of threads, then polled by a single thread, in
+    bulk through the pages of jobs, so thousands of jobs don't need thousands of
+    threads. The results are retrieved by the pool of threads.
+
+    Parameters
+    ----------
+    poll_due_jobs : Callable[[JobWaiter], Iterator[BaseJob]]
+        The function refreshing the jobs due for a poll, yielding the finished jobs.
+    retrieve_result : Callable[[BaseJob, BaseJob], Any]
+        The function retrieving the result of a finished job, given the job as
+        started and as finished.
+    policy : PollingPolicy
+        The polling intervals of the jobs.
+    max_workers : int
+        The number of threads starting the jobs and retrieving their results.
+    """
+
+    def __init__(
+        self,
+        poll_due_jobs: Callable[[JobWaiter], Iterator[BaseJob]],
+        retrieve_result: Callable[[BaseJob, BaseJob], Any],
+        policy: PollingPolicy,
+        max_workers: int,
+    ) -> None:
+        """Initialize the scheduler, the poller thread is started with the first job."""
+        if max_workers < 1:
+            raise ValueError("`max_workers` must be a positive integer.")
+        self.poll_due_jobs = poll_due_jobs
+        self.retrieve_result = retrieve_result
+        self.waiter = JobWaiter([], policy)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="wordcab-jobs"
+        )
+        self._cond = threading.Condition()
+        self._started: List[Tuple[BaseJob, JobFuture, bool]] = []
+        self._polled: Dict[str, List[JobFuture]] = {}
+        self._futures: Set[JobFuture] = set()
+        self._poller: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(
+        self, start: Callable[[], BaseJob], retrieved: bool = False
+    ) -> JobFuture:
+        """
+        Start a job in the background.
+
+        Parameters
+        ----------
+        start : Callable[[], BaseJob]
+            The function uploading the source and starting the job.
+        retrieved : bool
+            Whether `start` retrieves a job already started, instead of starting it.
+            The API returns the transcription jobs as extraction jobs, so the
+            retrieved jobs are polled by name, like `wait_for_job` does.
+
+        Returns
+        -------
+        JobFuture
+            The future of the result of the job.
+        """
+        future = JobFuture()
+        with self._cond:
+            if self._closed:
+                raise ValueError("The client is closed, no job can be submitted.")
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        self.executor.submit(self._start, start, future, retrieved)
+
+        return future
+
+    def close(self) -> None:
+        """Stop the background threads and cancel the futures not resolved yet."""
+        with self._cond:
+            self._closed = True
+            futures = list(self._futures)
+            self._cond.notify_all()
+
+        for future in futures:
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+    def _forget(self, future: Future) -> None:
+        """Stop tracking a resolved future."""
+        with self._cond:
+            self._futures.discard(future)  # type: ignore
+
+    def _start(
+        self, start: Callable[[], BaseJob], future: JobFuture, retrieved: bool
+    ) -> None:
+        """Start a job and hand it over to the poller thread."""
+        if future.done():
+            return
+        try:
+            job = start()
+        except BaseException as e:
+            _resolve(future, exception=e)
+            return
+
+        future.set_job(job)
+        with self._cond:
+            if self._closed:
+                return
+            self._started.append((job, future, retrieved))
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._poll, name="wordcab-jobs-poller", daemon=True
+                )
+                self._poller.start()
+            self._cond.notify_all()
+
+    def _poll(self) -> None:
+        """Poll the started jobs until the scheduler is closed."""
+        while True:
+            with self._cond:
+                while not (self._closed or self._started or self.waiter.pending):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                for job, future, retrieved in self._started:
+                    if job.job_name not in self._polled:
+                        self.waiter.add(job.job_name if retrieved else job)
+                    self._polled.setdefault(job.job_name, []).append(future)
+                self._started.clear()
+
+                delay = self.waiter.delay()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+
+            try:
+                for job in self.poll_due_jobs(self.waiter):
+                    if self._closed:
+                        return
+                    for future in self._polled.pop(job.job_name, []):
+                        self.executor.submit(self._finish, job, future)
+            except Exception as e:
+                logger.warning(f"Polling the jobs failed, polling them later: {e}")
+                for name in self.waiter.due_jobs():
+                    self.waiter.backoff(name)
+
+            for name, futures in list(self._polled.items()):
+                futures[:] = [future for future in futures if not future.done()]
+                if not futures:
+                    self.waiter.remove(name)
+                    del self._polled[name]
+
+    def _finish(self, job: BaseJob, future: JobFuture) -> None:
+        """Retrieve the result of a finished job."""
+        if future.done():
+            return
+        try:
+            if job.job_status in FAILED_STATUS:
+                raise ValueError(
+                    f"Job {job.job_name} ended with the status {job.job_status}."
+                )
+            result = self.retrieve_result(future.job, job)  # type: ignore
+        except BaseException as e:
+            _resolve(future, exception=e)
+        else:
+            _resolve(future, result=result)
+
+
+def _resolve(
+    future: Future, result: Any = None, exception: Optional[BaseException] = None
+) -> None:
+    """Resolve a future, unless it was cancelled in the meantime."""
+    try:
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass
@@ -0,0 +1,206 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API local job journal."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .cache import identify_source
+from .config import (
+    JOB_JOURNAL_FLUSH_INTERVAL,
+    JOB_JOURNAL_FLUSH_SIZE,
+    JOB_JOURNAL_PATH,
+)
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_STATES = ("started", "completed", "failed")
+
+
+class JobJournal:
+    """
+    Local journal of the items submitted by the batches, to resume them after a crash.
+
+    The journal maps a hash of the content and the parameters of an item to its state
+    and the `job_name` of its job. A batch created with a journal skips the items
+    already completed, and polls the jobs already started instead of submitting
+    them again. The failed items are submitted again.
+
+    The writes are buffered and committed together, every `flush_size` records or
+    `flush_interval` seconds, in a SQLite database in WAL mode. A crash loses the
+    records not flushed yet: at most `flush_interval` seconds of submissions are
+    started again by the next run.
+
+    Parameters
+    ----------
+    path : Union[str, Path]
+        The path of the SQLite database, or `:memory:` for a journal that is not
+        persisted. The default is `~/.wordcab/job_journal.sqlite`.
+    flush_size : int
+        The number of buffered records triggering a write. The default is 500.
+    flush_interval : float
+        The maximum time the records are buffered, in seconds. The default is 1.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.journal import JobJournal
+
+    >>> with Client() as client, JobJournal("batch.sqlite") as journal:  # doctest: +SKIP
+    ...     for result in client.submit_batch(items, journal=journal):
+    ...         print(result.index, result.ok)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = JOB_JOURNAL_PATH,
+        flush_size: int = JOB_JOURNAL_FLUSH_SIZE,
+        flush_interval: float = JOB_JOURNAL_FLUSH_INTERVAL,
+    ) -> None:
+        """Open or create the journal database."""
+        if flush_size < 1:
+            raise ValueError("`flush_size` must be a positive integer.")
+        if flush_interval <= 0:
+            raise ValueError("`flush_interval` must be a positive number.")
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._buffer: Dict[str, Tuple[str, str, Optional[str], float]] = {}
+        self._last_flush = time.monotonic()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                self._connection.execute(
+                    "CREATE TABLE IF NOT EXISTS items (item_key TEXT PRIMARY KEY,"
+                    " state TEXT NOT NULL, job_name TEXT, updated_at REAL NOT NULL)"
+                )
+
+    def __enter__(self) -> "JobJournal":
+        """Use the journal as a context manager."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Flush and close the journal."""
+        self.close()
+
+    def lookup(self, item_key: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Get the state and the job name of an item, None if it isn't journaled."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state, job_name FROM items WHERE item_key = ?", (item_key,)
+            ).fetchone()
+            if item_key in self._buffer:
+                _, state, job_name, _ = self._buffer[item_key]
+                return state, job_name or (row[1] if row else None)
+        return (row[0], row[1]) if row else None
+
+    def record(self, item_key: str, state: str, job_name: Optional[str] = None) -> None:
+        """
+        Record the state of an item, written with the next flush.
+
+        Parameters
+        ----------
+        item_key : str
+            The hash of the item, from `hash_item`.
+        state : str
+            The state of the item, one of `started`, `completed` or `failed`.
+        job_name : str, optional
+            The name of the job of the item. The job name already recorded is kept
+            if None.
+        """
+        if state not in JOURNAL_STATES:
+            raise ValueError(
+                f"Invalid state: {state}. Must be one of {list(JOURNAL_STATES)}."
+            )
+
+        with self._lock:
+            if job_name is None and item_key in self._buffer:
+                job_name = self._buffer[item_key][2]
+            self._buffer[item_key] = (item_key, state, job_name, time.time())
+            due = (
+                len(self._buffer) >= self.flush_size
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            )
+        if due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records in a single transaction."""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if not self._buffer:
+                return
+            rows: List[Tuple[str, str, Optional[str], float]] = list(
+                self._buffer.values()
+            )
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO items VALUES (?, ?, ?, ?) ON CONFLICT(item_key) DO"
+                    " UPDATE SET state = excluded.state, job_name ="
+                    " COALESCE(excluded.job_name, items.job_name), updated_at ="
+                    " excluded.updated_at",
+                    rows,
+                )
+            self._buffer.clear()
+        logger.debug(f"{len(rows)} records written to the job journal.")
+
+    def clear(self) -> None:
+        """Remove all the journaled items."""
+        with self._lock, self._connection:
+            self._buffer.clear()
+            self._connection.execute("DELETE FROM items")
+
+    def close(self) -> None:
+        """Flush the buffered records and close the journal database."""
+        self.flush()
+        with self._lock:
+            self._connection.close()
+
+
+def hash_item(source_object: Any, params: Dict[str, Any]) -> Optional[str]:
+    """
+    Hash the content and the parameters of an item of a batch.
+
+    Parameters
+    ----------
+    source_object : Any
+        The source object.
+    params : Dict[str, Any]
+        The parameters the source is submitted with.
+
+    Returns
+    -------
+    Optional[str]
+        The SHA-256 hex digest, or None if the content can't be read again and the
+        source has no URL or transcript ID to identify it, e.g. a file object.
+    """
+    content_hash = identify_source(source_object)
+    if content_hash is None:
+        return None
+
+    digest = hashlib.sha256(f"{content_hash}\0".encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
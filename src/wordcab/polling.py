@@ -0,0 +1,334 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API job polling policy."""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+from .config import (
+    EXTRACT_STATUS_PROGRESSION,
+    JOB_POLL_BACKOFF_FACTOR,
+    JOB_POLL_MAX_INTERVAL,
+    JOB_POLL_MIN_INTERVAL,
+    JOB_PROCESSING_RATIO,
+    SUMMARIZE_STATUS_PROGRESSION,
+)
+from .core_objects import BaseJob, ExtractJob
+
+logger = logging.getLogger(__name__)
+
+FAILED_STATUS = ("Deleted", "Error")
+STATUS_PROGRESSIONS: Dict[str, Sequence[str]] = {
+    "ExtractJob": EXTRACT_STATUS_PROGRESSION,
+    "SummarizeJob": SUMMARIZE_STATUS_PROGRESSION,
+    "TranscribeJob": SUMMARIZE_STATUS_PROGRESSION[
+        : SUMMARIZE_STATUS_PROGRESSION.index("TranscriptComplete") + 1
+    ],
+}
+
+
+@dataclass
+class PollingPolicy:
+    """
+    Polling policy of the job waiters of the Wordcab API clients.
+
+    A job is polled after `min_interval` seconds, then the interval grows by
+    `backoff_factor` at every poll that finds the job in the same status, up to
+    `max_interval`. The interval is reset when the job moves to the next status.
+
+    The interval is never shorter than a quarter of the expected remaining processing
+    time, estimated from the `audio_duration` of the job and its position in the
+    status progression, so long recordings are not polled every few seconds.
+
+    Parameters
+    ----------
+    min_interval : float
+        The delay before the first poll of a status, in seconds, by default 2.
+    max_interval : float
+        The maximum delay between two polls, in seconds, by default 60.
+    backoff_factor : float
+        The growth of the delay at every poll without status change, by default 1.5.
+    processing_ratio : float
+        The expected processing time per second of audio, by default 0.2.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.polling import PollingPolicy
+
+    >>> policy = PollingPolicy(max_interval=10)
+    >>> client = Client()  # doctest: +SKIP
+    >>> client.wait_for_job("job_12345", policy=policy)  # doctest: +SKIP
+    """
+
+    min_interval: float = field(default=JOB_POLL_MIN_INTERVAL)
+    max_interval: float = field(default=JOB_POLL_MAX_INTERVAL)
+    backoff_factor: float = field(default=JOB_POLL_BACKOFF_FACTOR)
+    processing_ratio: float = field(default=JOB_PROCESSING_RATIO)
+
+    def __post_init__(self) -> None:
+        """Post-init method."""
+        if self.min_interval < 0 or self.max_interval < self.min_interval:
+            raise ValueError(
+                "`min_interval` can't be negative nor greater than `max_interval`."
+            )
+        if self.backoff_factor < 1:
+            raise ValueError("`backoff_factor` must be at least 1.")
+        if self.processing_ratio < 0:
+            raise ValueError("`processing_ratio` can't be negative.")
+
+    def expected_remaining(self, job: BaseJob, job_type: Optional[str] = None) -> float:
+        """
+        Estimate the remaining processing time of a job, in seconds.
+
+        Parameters
+        ----------
+        job : BaseJob
+            The job, as last retrieved.
+        job_type : str, optional
+            The type of the submitted job, by default the type of `job`.
+
+        Returns
+        -------
+        float
+            The estimated remaining time, 0 if the duration of the audio is unknown.
+        """
+        progression = STATUS_PROGRESSIONS[job_type or job._job_type]
+        if job.job_status in progression:
+            stage = progression.index(job.job_status)
+        else:
+            stage = 0
+        remaining = (len(progression) - 1 - stage) / (len(progression) - 1)
+
+        return (job.audio_duration or 0) * self.processing_ratio * remaining
+
+    def next_delay(
+        self, job: BaseJob, polls: int, job_type: Optional[str] = None
+    ) -> float:
+        """
+        Get the delay before the next poll of a running job.
+
+        Parameters
+        ----------
+        job : BaseJob
+            The job, as last retrieved.
+        polls : int
+            The number of polls that already found the job in its current status.
+        job_type : str, optional
+            The type of the submitted job, by default the type of `job`.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        delay = max(
+            self.backoff_delay(polls), self.expected_remaining(job, job_type) / 4
+        )
+        return min(delay, self.max_interval)
+
+    def backoff_delay(self, polls: int) -> float:
+        """
+        Get the delay before the next poll, from the number of polls only.
+
+        Parameters
+        ----------
+        polls : int
+            The number of polls that already found the job in its current status, or
+            that failed.
+
+        Returns
+        -------
+        float
+            The delay in seconds.
+        """
+        return min(self.min_interval * self.backoff_factor**polls, self.max_interval)
+
+
+def is_finished(job: BaseJob, job_type: Optional[str] = None) -> bool:
+    """
+    Check whether a job reached its last status, or failed.
+
+    Parameters
+    ----------
+    job : BaseJob
+        The job, as last retrieved.
+    job_type : str, optional
+        The type of the submitted job. If None, the type of `job` is used, and an
+        `ExtractJob`, which is also how the API returns the transcription jobs, is
+        finished once transcribed.
+
+    Returns
+    -------
+    bool
+        Whether the job is finished.
+    """
+    if job.job_status in FAILED_STATUS:
+        return True
+    if job_type is None and isinstance(job, ExtractJob):
+        return job.job_status in ("ExtractionComplete", "TranscriptComplete")
+
+    return job.job_status == STATUS_PROGRESSIONS[job_type or job._job_type][-1]
+
+
+class JobWaiter:
+    """
+    Polling state of a set of jobs, shared by the sync and async job waiters.
+
+    Parameters
+    ----------
+    jobs : Iterable[Union[str, BaseJob]]
+        The names of the jobs, or the jobs returned by the `start_*` methods.
+    policy : PollingPolicy
+        The polling policy.
+    timeout : float, optional
+        The maximum time to wait, in seconds. None to wait without limit.
+    """
+
+    def __init__(
+        self,
+        jobs: Iterable[Union[str, BaseJob]],
+        policy: PollingPolicy,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """Initialize the waiter, with the first polls due immediately."""
+        self.policy = policy
+        self.timeout = timeout
+        self.deadline = None if timeout is None else time.monotonic() + timeout
+        self.job_types: Dict[str, Optional[str]] = {}
+        self.statuses: Dict[str, Optional[str]] = {}
+        self.polls: Dict[str, int] = {}
+        self.due: Dict[str, float] = {}
+
+        for job in jobs:
+            self.add(job)
+
+    def add(self, job: Union[str, BaseJob]) -> None:
+        """
+        Start tracking a job, with a first poll due immediately.
+
+        Parameters
+        ----------
+        job : Union[str, BaseJob]
+            The name of the job, or the job returned by a `start_*` method.
+        """
+        if isinstance(job, BaseJob):
+            name, job_type = job.job_name, job._job_type
+        else:
+            name, job_type = job, None
+        self.job_types[name] = job_type
+        self.statuses[name] = None
+        self.polls[name] = 0
+        self.due[name] = time.monotonic()
+
+    def remove(self, name: str) -> None:
+        """Stop tracking a pending job."""
+        self.due.pop(name, None)
+
+    @property
+    def pending(self) -> List[str]:
+        """The names of the jobs not finished yet."""
+        return list(self.due)
+
+    def due_jobs(self) -> List[str]:
+        """The names of the pending jobs whose next poll is due."""
+        now = time.monotonic()
+        return [name for name, due in self.due.items() if due <= now]
+
+    def delay(self) -> float:
+        """
+        Get the delay before the next poll.
+
+        Raises
+        ------
+        TimeoutError
+            If the jobs are still running at the deadline.
+        """
+        now = time.monotonic()
+        delay = max(min(self.due.values()) - now, 0.0)
+        if self.deadline is not None:
+            if now >= self.deadline:
+                raise TimeoutError(
+                    f"{len(self.due)} jobs still running after {self.timeout}s:"
+                    f" {', '.join(self.due)}."
+                )
+            delay = min(delay, self.deadline - now)
+
+        return delay
+
+    def update(self, job: BaseJob) -> bool:
+        """
+        Record the last retrieved state of a pending job.
+
+        Parameters
+        ----------
+        job : BaseJob
+            The job, as retrieved from the API.
+
+        Returns
+        -------
+        bool
+            Whether the job is finished. It is then no longer pending.
+        """
+        name, job_type = job.job_name, self.job_types[job.job_name]
+        if is_finished(job, job_type):
+            logger.info(f"Job {name} finished with status {job.job_status}.")
+            del self.due[name]
+            return True
+
+        if job.job_status != self.statuses[name]:
+            self.statuses[name] = job.job_status
+            self.polls[name] = 0
+        delay = self.policy.next_delay(job, self.polls[name], job_type)
+        self.polls[name] += 1
+        self.due[name] = time.monotonic() + delay
+        logger.debug(f"Job {name} is {job.job_status}, next poll in {delay:.1f}s.")
+
+        return False
+
+    def backoff(self, name: str) -> None:
+        """
+        Delay the next poll of a pending job after a failed poll.
+
+        The failed polls count as polls without status change, so a job whose polls
+        keep failing is polled less and less often, up to `max_interval`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the job.
+        """
+        delay = self.policy.backoff_delay(self.polls[name])
+        self.polls[name] += 1
+        self.due[name] = time.monotonic() + delay
+        logger.debug(f"Polling job {name} failed, next poll in {delay:.1f}s.")
+
+    def scan(self, page: Sequence[BaseJob]) -> List[BaseJob]:
+        """
+        Record the pending jobs found in a page of jobs.
+
+        Parameters
+        ----------
+        page : Sequence[BaseJob]
+            The jobs of a page of `list_jobs`.
+
+        Returns
+        -------
+        List[BaseJob]
+            The jobs of the page that are finished.
+        """
+        return [job for job in page if job.job_name in self.due and self.update(job)]
@@ -0,0 +1,142 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API client-side rate limiting."""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at a constant rate.
+
+    A caller reserves a token and gets back the time to wait before using it. The
+    bucket can go into debt, so concurrent callers are queued one after the other
+    at `1 / rate` seconds of interval instead of waking up at the same time. The
+    lock is only held to update the counters, never while waiting, so the same
+    bucket can be shared by threads and coroutines.
+    """
+
+    def __init__(self, rate: float, burst: float = 1) -> None:
+        """
+        Initialize the bucket.
+
+        Parameters
+        ----------
+        rate : float
+            The number of tokens added per second.
+        burst : float
+            The maximum number of tokens stored, i.e. the number of requests that can
+            be sent at once after an idle period. The default is 1.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("`rate` must be positive and `burst` at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        Reserve tokens.
+
+        Parameters
+        ----------
+        tokens : float
+            The number of tokens to reserve. The default is 1.
+
+        Returns
+        -------
+        float
+            The time to wait before using the reserved tokens, in seconds.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._last) * self.rate
+            )
+            self._last = now
+            self._tokens -= tokens
+
+            return max(-self._tokens / self.rate, 0.0)
+
+
+class RateLimiter:
+    """
+    Client-side rate limiter with a global budget and per-endpoint budgets.
+
+    A single limiter can be shared by several clients, threads and coroutines, so the
+    total request rate stays under the API limits instead of being rejected with 429.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.rate_limit import RateLimiter
+
+    >>> limiter = RateLimiter(rate=10, endpoint_rates={"start_summary": 2})
+    >>> client = Client(rate_limiter=limiter)  # doctest: +SKIP
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: float = 1,
+        endpoint_rates: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Parameters
+        ----------
+        rate : float, optional
+            The maximum number of requests per second, all endpoints included.
+            The default is None, meaning no global budget.
+        burst : float
+            The number of requests of the global budget that can be sent at once after
+            an idle period. The default is 1, which spaces all the requests evenly.
+        endpoint_rates : Dict[str, float], optional
+            The maximum number of requests per second of each endpoint, keyed by client
+            method name, e.g. `{"start_summary": 2}`. The default is None.
+        """
+        self.global_bucket = TokenBucket(rate, burst) if rate is not None else None
+        self.endpoint_buckets = {
+            endpoint: TokenBucket(endpoint_rate)
+            for endpoint, endpoint_rate in (endpoint_rates or {}).items()
+        }
+
+    def reserve(self, endpoint: str) -> float:
+        """Reserve a request and get the time to wait before sending it."""
+        delay = 0.0
+        if self.global_bucket is not None:
+            delay = self.global_bucket.reserve()
+        if endpoint in self.endpoint_buckets:
+            delay = max(delay, self.endpoint_buckets[endpoint].reserve())
+
+        return delay
+
+    def acquire(self, endpoint: str) -> None:
+        """Block the current thread until a request of an endpoint can be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait, without blocking the event loop, until a request can be sent."""
+        delay = self.reserve(endpoint)
+        if delay > 0:
+            await asyncio.sleep(delay)
@@ -0,0 +1,215 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API retry policy."""
+
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple
+
+from .config import (
+    RETRY_BASE_DELAY,
+    RETRY_JITTER,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AttemptRecord:
+    """
+    Timing and outcome of a single attempt of a request.
+
+    Parameters
+    ----------
+    endpoint : str
+        The client method that sent the request, e.g. `retrieve_job`.
+    method : str
+        The HTTP method.
+    url : str
+        The URL of the request.
+    attempt : int
+        The attempt number, starting at 1.
+    elapsed : float
+        The duration of the attempt, in seconds.
+    status_code : int, optional
+        The status code of the response, None if no response was received.
+    error : str, optional
+        The connection error raised by the attempt, if any.
+    delay : float, optional
+        The time waited before the next attempt, in seconds. None if the request
+        is not retried after this attempt.
+    """
+
+    endpoint: str
+    method: str
+    url: str
+    attempt: int
+    elapsed: float
+    status_code: Optional[int] = field(default=None)
+    error: Optional[str] = field(default=None)
+    delay: Optional[float] = field(default=None)
+
+
+@dataclass
+class RetryPolicy:
+    """
+    Retry policy of the Wordcab API clients.
+
+    Failed attempts are retried with an exponential backoff: the n-th retry waits
+    `base_delay * 2 ** (n - 1)` seconds, capped to `max_delay`, then reduced by a
+    random jitter to spread the retries of concurrent callers. A `Retry-After`
+    header sent by the API replaces the computed backoff.
+
+    Only idempotent HTTP methods are retried by default, so a job creation is never
+    sent twice after a timeout, unless it is sent with an idempotency key.
+
+    Parameters
+    ----------
+    max_attempts : int
+        The maximum number of attempts, including the first one, by default 3.
+        Use 1 to disable the retries.
+    base_delay : float
+        The delay before the first retry, in seconds, by default 0.5.
+    max_delay : float
+        The maximum delay between two attempts, in seconds, by default 30.
+    jitter : float
+        The fraction of the delay that is randomized, between 0 and 1, by default 0.5.
+    respect_retry_after : bool
+        Whether to wait for the delay requested in the `Retry-After` header of the
+        response, by default True.
+    retry_status_codes : Tuple[int, ...]
+        The status codes triggering a retry, by default (429, 502, 503, 504).
+    retry_methods : Tuple[str, ...]
+        The HTTP methods that can be retried, by default the idempotent methods.
+    retry_connection_errors : bool
+        Whether to retry connection errors and timeouts, by default True.
+    retry_idempotency_keys : bool
+        Whether to retry the requests sent with an idempotency key whatever their
+        method, e.g. the job creations, by default True. Disable it if the API doesn't
+        deduplicate the requests sent with the same `Idempotency-Key` header.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.retry import RetryPolicy
+
+    >>> client = Client(retry_policy=RetryPolicy(max_attempts=5, base_delay=1))  # doctest: +SKIP
+    """
+
+    max_attempts: int = field(default=RETRY_MAX_ATTEMPTS)
+    base_delay: float = field(default=RETRY_BASE_DELAY)
+    max_delay: float = field(default=RETRY_MAX_DELAY)
+    jitter: float = field(default=RETRY_JITTER)
+    respect_retry_after: bool = field(default=True)
+    retry_status_codes: Tuple[int, ...] = field(
+        default_factory=lambda: tuple(RETRY_STATUS_CODES)
+    )
+    retry_methods: Tuple[str, ...] = field(default_factory=lambda: tuple(RETRY_METHODS))
+    retry_connection_errors: bool = field(default=True)
+    retry_idempotency_keys: bool = field(default=True)
+
+    def __post_init__(self) -> None:
+        """Post-init method."""
+        if self.max_attempts < 1:
+            raise ValueError("`max_attempts` must be at least 1.")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("`base_delay` and `max_delay` can't be negative.")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("`jitter` must be between 0 and 1.")
+        self.retry_methods = tuple(method.upper() for method in self.retry_methods)
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None,
+        connection_error: bool = False,
+        idempotent: bool = False,
+    ) -> Optional[float]:
+        """
+        Get the delay before retrying a failed attempt.
+
+        Parameters
+        ----------
+        method : str
+            The HTTP method of the request.
+        attempt : int
+            The number of the attempt that failed, starting at 1.
+        status_code : int, optional
+            The status code of the response, by default None.
+        retry_after : str, optional
+            The `Retry-After` header of the response, by default None.
+        connection_error : bool
+            Whether the attempt failed without response, by default False.
+        idempotent : bool
+            Whether the request is sent with an idempotency key, by default False.
+            It is then retried whatever its method if `retry_idempotency_keys` is
+            enabled.
+
+        Returns
+        -------
+        Optional[float]
+            The delay in seconds, or None if the request must not be retried.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if method.upper() not in self.retry_methods and not (
+            idempotent and self.retry_idempotency_keys
+        ):
+            return None
+        if connection_error:
+            if not self.retry_connection_errors:
+                return None
+        elif status_code not in self.retry_status_codes:
+            return None
+
+        if self.respect_retry_after and retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_delay)
+
+        return self.backoff(attempt)
+
+    def backoff(self, attempt: int) -> float:
+        """Get the jittered exponential backoff after the given attempt."""
+        delay = min(self.base_delay * 2 ** (attempt - 1), self.max_delay)
+        return delay * (1 - self.jitter * random.random())
+
+
+def _parse_retry_after(retry_after: str) -> Optional[float]:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date."""
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        logger.warning(f"Ignoring invalid Retry-After header: {retry_after}")
+        return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max((date - datetime.now(timezone.utc)).total_seconds(), 0.0)
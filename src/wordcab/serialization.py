@@ -0,0 +1,111 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wordcab JSON serialization.
+
+The payloads and the API responses are serialized with `orjson` when it is
+installed, with `pip install wordcab[fast]`, and with the standard `json` module
+otherwise.
+
+The payloads are compact UTF-8 JSON bytes, the native output of `orjson`: no
+whitespace between the items and the non-ASCII characters left as is, unlike the
+`json.dumps` defaults. Both backends produce the same bytes, NaN and infinite floats
+included, written as `null`, so the payloads don't depend on the installed backend.
+"""
+
+import json
+import math
+from typing import Any, Union
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to serialize.
+
+    Returns
+    -------
+    bytes
+        The UTF-8 encoded JSON, without whitespace between the items, with the
+        non-ASCII characters left as is and the NaN and infinite floats as `null`.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:  # Non-string keys or integers above 64 bits
+            pass
+
+    try:
+        text = _dumps_json(obj)
+    except ValueError as e:
+        if not str(e).startswith("Out of range float values"):
+            raise
+        text = _dumps_json(_replace_non_finite(obj))
+
+    return text.encode("utf-8")
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize an object with the `json` module, in the `orjson` format."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _replace_non_finite(obj: Any) -> Any:
+    """Replace the NaN and infinite floats by None, as `orjson` serializes them."""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_non_finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite(value) for value in obj]
+    return obj
+
+
+def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+    """
+    Deserialize a JSON document.
+
+    Parameters
+    ----------
+    data : Union[str, bytes, bytearray, memoryview]
+        The JSON document, as a string or UTF-8 bytes.
+
+    Returns
+    -------
+    Any
+        The deserialized object.
+
+    Raises
+    ------
+    ValueError
+        If the document is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
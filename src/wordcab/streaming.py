@@ -0,0 +1,362 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wordcab API streaming request bodies."""
+
+import asyncio
+import io
+import tempfile
+import uuid
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Union,
+)
+
+import requests  # type: ignore
+
+from .config import DOWNLOAD_SPOOL_SIZE, REQUEST_TIMEOUT, UPLOAD_CHUNK_SIZE
+
+
+class UploadStream:
+    """
+    Request body read in chunks from a file, a file object or an iterator of bytes.
+
+    Only one chunk is held in memory at a time, whatever the size of the file. A body
+    read from a path or a seekable file object can be iterated several times, so the
+    request can be retried.
+
+    Parameters
+    ----------
+    source : Union[str, Path, BinaryIO, Iterable[bytes]]
+        The path to the file, an open binary file object, or an iterator of bytes.
+    chunk_size : int
+        The size of the chunks read from a file, in bytes. The default is 64 KiB.
+    close_source : bool
+        Whether `close` closes the file object, e.g. a temporary file opened for the
+        stream. The default is False.
+
+    Examples
+    --------
+    >>> from wordcab.streaming import UploadStream
+
+    >>> body = UploadStream("path/to/audio/file.wav")  # doctest: +SKIP
+    >>> body.length  # doctest: +SKIP
+    1234567890
+    """
+
+    def __init__(
+        self,
+        source: Union[str, Path, BinaryIO, Iterable[bytes]],
+        chunk_size: int = UPLOAD_CHUNK_SIZE,
+        close_source: bool = False,
+    ) -> None:
+        """Initialize the stream."""
+        if chunk_size < 1:
+            raise ValueError("`chunk_size` must be a positive integer.")
+        self.source = Path(source) if isinstance(source, str) else source
+        self.chunk_size = chunk_size
+        self.close_source = close_source
+        self.length: Optional[int] = None
+        self._start: Optional[int] = None
+        self._consumed = False
+
+        if isinstance(self.source, Path):
+            self.length = self.source.stat().st_size
+        elif hasattr(self.source, "read"):
+            if _is_seekable(self.source):
+                self._start = self.source.tell()
+                self.length = self.source.seek(0, io.SEEK_END) - self._start
+                self.source.seek(self._start)
+        elif not isinstance(self.source, Iterable) or isinstance(
+            self.source, (bytes, str)
+        ):
+            raise TypeError(
+                "The source must be a path, a binary file object or an iterator of"
+                f" bytes, not {type(self.source)}."
+            )
+
+    @property
+    def len(self) -> int:
+        """Length of the body, used by `requests` to set the Content-Length."""
+        if self.length is None:
+            raise AttributeError("The length of the stream is unknown.")
+        return self.length
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the chunks of the body."""
+        if isinstance(self.source, Path):
+            return self._read_file(self.source)
+
+        if self._start is not None:
+            self.source.seek(self._start)
+            return self._read(self.source)
+
+        if self._consumed:
+            raise ValueError(
+                "The stream can't be replayed: provide a path or a seekable file"
+                " object to retry the request."
+            )
+        self._consumed = True
+        if hasattr(self.source, "read"):
+            return self._read(self.source)
+        return iter(self.source)
+
+    def close(self) -> None:
+        """Close the file object of the stream, if it was opened for the stream."""
+        if self.close_source and hasattr(self.source, "close"):
+            self.source.close()  # type: ignore
+
+    async def aiter_chunks(self) -> AsyncIterator[bytes]:
+        """Iterate over the chunks of the body without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        chunks = iter(self)
+        while True:
+            chunk = await loop.run_in_executor(None, next, chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
+    def _read_file(self, path: Path) -> Iterator[bytes]:
+        """Read a file in chunks."""
+        with open(path, "rb") as f:
+            yield from self._read(f)
+
+    def _read(self, fileobj: BinaryIO) -> Iterator[bytes]:
+        """Read a file object in chunks."""
+        while True:
+            chunk = fileobj.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+class MultipartStream(UploadStream):
+    """
+    Multipart form-data body with a single file field, streamed in chunks.
+
+    `requests` builds multipart bodies in memory, this encoder only holds one chunk of
+    the file at a time.
+
+    Parameters
+    ----------
+    field_name : str
+        The name of the form field.
+    filename : str
+        The name of the file sent in the field.
+    body : UploadStream
+        The content of the file.
+    content_type : str
+        The content type of the file. The default is `application/octet-stream`.
+    boundary : str, optional
+        The multipart boundary. The default is None, meaning a random boundary.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        filename: str,
+        body: UploadStream,
+        content_type: str = "application/octet-stream",
+        boundary: Optional[str] = None,
+    ) -> None:
+        """Initialize the stream."""
+        self.body = body
+        self.chunk_size = body.chunk_size
+        self.boundary = boundary if boundary else uuid.uuid4().hex
+        self._head = (
+            f"--{self.boundary}\r\nContent-Disposition: form-data;"
+            f' name="{field_name}"; filename="{filename}"\r\nContent-Type:'
+            f" {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self.length = (
+            len(self._head) + body.length + len(self._tail)
+            if body.length is not None
+            else None
+        )
+
+    @property
+    def content_type(self) -> str:
+        """The Content-Type header of the body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterate over the chunks of the body."""
+        return self._encode()
+
+    def close(self) -> None:
+        """Close the file object of the streamed file, if opened for the stream."""
+        self.body.close()
+
+    def _encode(self) -> Iterator[bytes]:
+        """Encode the form field around the chunks of the file."""
+        yield self._head
+        yield from self.body
+        yield self._tail
+
+
+def download_to_spooled_file(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    max_size: Optional[int] = None,
+    progress: Optional[Callable[[int, Optional[int]], None]] = None,
+    spool_size: int = DOWNLOAD_SPOOL_SIZE,
+    chunk_size: int = UPLOAD_CHUNK_SIZE,
+) -> BinaryIO:
+    """
+    Download a remote file in chunks to a spooled temporary file.
+
+    The file is kept in memory up to `spool_size` bytes, then written to disk.
+
+    Parameters
+    ----------
+    url : str
+        The URL of the file.
+    headers : Dict[str, str], optional
+        The headers of the request, e.g. for authentication. The default is None.
+    max_size : int, optional
+        The maximum size of the file, in bytes. The default is None, meaning no limit.
+    progress : Callable[[int, Optional[int]], None], optional
+        A callback receiving the number of bytes downloaded and the total size, None
+        if unknown, after each chunk. The default is None.
+    spool_size : int
+        The size above which the file is written to disk. The default is 8 MiB.
+    chunk_size : int
+        The size of the chunks downloaded. The default is 64 KiB.
+
+    Returns
+    -------
+    BinaryIO
+        The spooled file, rewound to its start. It is deleted once closed.
+
+    Raises
+    ------
+    ValueError
+        If the download fails or the file is larger than `max_size`.
+    """
+    with requests.get(
+        url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT
+    ) as response:
+        if not response.ok:
+            raise ValueError(
+                f"Failed to download {url}: {response.status_code} {response.reason}"
+            )
+
+        content_length = response.headers.get("Content-Length")
+        total = int(content_length) if content_length else None
+        if max_size is not None and total is not None and total > max_size:
+            raise ValueError(
+                f"The file at {url} is {total} bytes, above the {max_size} bytes limit."
+            )
+
+        spooled = tempfile.SpooledTemporaryFile(max_size=spool_size)
+        downloaded = 0
+        try:
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                downloaded += len(chunk)
+                if max_size is not None and downloaded > max_size:
+                    raise ValueError(
+                        f"The file at {url} is above the {max_size} bytes limit."
+                    )
+                spooled.write(chunk)
+                if progress is not None:
+                    progress(downloaded, total)
+        except BaseException:
+            spooled.close()
+            raise
+
+    spooled.seek(0)
+    return spooled  # type: ignore
+
+
+async def spool_async_chunks(
+    chunks: AsyncIterator[bytes], spool_size: int = DOWNLOAD_SPOOL_SIZE
+) -> BinaryIO:
+    """
+    Write an asynchronous iterator of bytes to a spooled temporary file.
+
+    Parameters
+    ----------
+    chunks : AsyncIterator[bytes]
+        The chunks, e.g. of a streamed response body.
+    spool_size : int
+        The size above which the file is written to disk. The default is 8 MiB.
+
+    Returns
+    -------
+    BinaryIO
+        The spooled file, rewound to its start. It is deleted once closed.
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=spool_size)
+    try:
+        async for chunk in chunks:
+            spooled.write(chunk)
+    except BaseException:
+        spooled.close()
+        raise
+
+    spooled.seek(0)
+    return spooled  # type: ignore
+
+
+class ChunkReader:
+    """
+    Binary file reading an iterator of bytes, e.g. a streamed response body.
+
+    Each read returns the next non-empty chunk, whatever its size, and empty bytes
+    once the iterator is exhausted.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The chunks to read.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        """Initialize the reader."""
+        self.chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next chunk, `size` is ignored."""
+        for chunk in self.chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+def _is_seekable(fileobj: BinaryIO) -> bool:
+    """Check if a file object can be rewound."""
+    try:
+        seekable = fileobj.seekable()
+    except AttributeError:
+        seekable = hasattr(fileobj, "seek") and hasattr(fileobj, "tell")
+
+    try:
+        return seekable and fileobj.tell() >= 0
+    except (OSError, ValueError):
+        return False
+
+
+def stream_headers(body: UploadStream) -> Dict[str, str]:
+    """Get the headers describing the length of a streamed body."""
+    if body.length is None:
+        return {}
+    return {"Content-Length": str(body.length)}
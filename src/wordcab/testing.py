@@ -0,0 +1,180 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local stand-ins of the Wordcab API, to test the client offline."""
+
+import hashlib
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .upload import CHECKSUM_HEADER
+
+
+class LocalUploadServer:
+    """
+    Local HTTP server receiving chunked uploads.
+
+    It implements the upload endpoints described in `wordcab.upload` and keeps the
+    parts in memory. Use its `base_url` as the `base_url` of a client.
+
+    Parameters
+    ----------
+    fail_parts : Dict[int, int], optional
+        The number of times each part number is rejected with a 503 before being
+        accepted, to simulate failures. The default is None.
+
+    Examples
+    --------
+    >>> from wordcab import Client
+    >>> from wordcab.core_objects import AudioSource
+    >>> from wordcab.testing import LocalUploadServer
+
+    >>> with LocalUploadServer() as server:  # doctest: +SKIP
+    ...     client = Client(api_key="dummy_api_key", base_url=server.base_url)
+    ...     upload = client.upload_audio(AudioSource(filepath="file.wav", chunked=True))
+    ...     assert server.files[upload.upload_id] == open("file.wav", "rb").read()
+    """
+
+    def __init__(self, fail_parts: Optional[Dict[int, int]] = None) -> None:
+        """Initialize the server."""
+        self.fail_parts = dict(fail_parts) if fail_parts else {}
+        self.uploads: Dict[str, Dict[int, Tuple[str, bytes]]] = {}
+        self.files: Dict[str, bytes] = {}
+        self.received: List[Tuple[str, int]] = []
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """The base URL of the server."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalUploadServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            daemon=True,
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "LocalUploadServer":
+        """Start the server."""
+        return self.start()
+
+    def __exit__(self, *args: Any) -> None:
+        """Stop the server."""
+        self.stop()
+
+    def handle(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes
+    ) -> Tuple[int, Union[Dict[str, Any], bytes]]:
+        """Answer a request with a status code and a JSON object or raw bytes."""
+        if not headers.get("Authorization", "").startswith("Bearer "):
+            return 401, {"detail": "Missing API key."}
+
+        match = re.fullmatch(
+            r"/uploads(?:/([^/]+))?(?:/(parts/\d+|complete|file))?", path
+        )
+        if match is None:
+            return 404, {"detail": "Not found."}
+        upload_id, action = match.groups()
+
+        with self._lock:
+            if upload_id is None and method == "POST":
+                upload_id = uuid.uuid4().hex
+                self.uploads[upload_id] = {}
+                return 201, {"upload_id": upload_id}
+            if upload_id not in self.uploads:
+                return 404, {"detail": f"Upload {upload_id} not found."}
+            parts = self.uploads[upload_id]
+
+            if action is None and method == "GET":
+                return 200, {
+                    "upload_id": upload_id,
+                    "parts": [
+                        {"number": number, "checksum": checksum}
+                        for number, (checksum, _) in sorted(parts.items())
+                    ],
+                }
+            if action is not None and action.startswith("parts/") and method == "PUT":
+                number = int(action.split("/")[1])
+                if self.fail_parts.get(number, 0) > 0:
+                    self.fail_parts[number] -= 1
+                    return 503, {"detail": "Service unavailable."}
+                checksum = hashlib.sha256(body).hexdigest()
+                if headers.get(CHECKSUM_HEADER) != checksum:
+                    return 400, {"detail": f"Checksum mismatch for part {number}."}
+                parts[number] = (checksum, body)
+                self.received.append((upload_id, number))
+                return 200, {"number": number, "checksum": checksum}
+            if action == "complete" and method == "POST":
+                expected = json.loads(body)["parts"]
+                for part in expected:
+                    if parts.get(part["number"], ("", b""))[0] != part["checksum"]:
+                        return 400, {"detail": f"Part {part['number']} is missing."}
+                self.files[upload_id] = b"".join(
+                    parts[part["number"]][1] for part in expected
+                )
+                return 200, {
+                    "upload_id": upload_id,
+                    "url": f"{self.base_url}/uploads/{upload_id}/file",
+                }
+            if action == "file" and method == "GET" and upload_id in self.files:
+                return 200, self.files[upload_id]
+
+        return 404, {"detail": "Not found."}
+
+
+def _make_handler(server: LocalUploadServer) -> type:
+    """Build the request handler class of a local server."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            body = self.rfile.read(length) if length else b""
+            status, content = server.handle(
+                self.command, self.path.split("?")[0], dict(self.headers), body
+            )
+            if isinstance(content, bytes):
+                payload, content_type = content, "application/octet-stream"
+            else:
+                payload, content_type = json.dumps(content).encode(), "application/json"
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = _respond
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    return Handler
@@ -0,0 +1,124 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Wordcab API resumable chunked uploads.
+
+A large file is uploaded in parts with the following requests:
+
+- `POST /uploads` with the `filename`, `size` and `part_size` of the file creates an
+  upload and returns its `upload_id`.
+- `GET /uploads/{upload_id}` returns the `parts` already received, with their
+  `number` and `checksum`, to resume an interrupted upload.
+- `PUT /uploads/{upload_id}/parts/{number}` sends a part, with its SHA-256 checksum in
+  the `X-Checksum-SHA256` header. The part is rejected if the checksum doesn't match.
+- `POST /uploads/{upload_id}/complete` with the list of `parts` assembles the file and
+  returns its `url`, used as the audio URL of the transcription job.
+
+`wordcab.testing.LocalUploadServer` implements the receiving side to test offline.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Union
+
+from .config import UPLOAD_PART_SIZE
+
+CHECKSUM_HEADER = "X-Checksum-SHA256"
+
+
+@dataclass
+class UploadPart:
+    """
+    Part of a chunked upload.
+
+    Parameters
+    ----------
+    number : int
+        The part number, starting at 1.
+    offset : int
+        The position of the part in the file, in bytes.
+    size : int
+        The size of the part, in bytes.
+    checksum : str, optional
+        The SHA-256 hex digest of the part, set once the part is read.
+    """
+
+    number: int
+    offset: int
+    size: int
+    checksum: Optional[str] = field(default=None)
+
+
+@dataclass
+class ChunkedUpload:
+    """
+    Completed chunked upload.
+
+    Parameters
+    ----------
+    upload_id : str
+        The upload ID.
+    url : str
+        The URL of the assembled file.
+    size : int
+        The size of the file, in bytes.
+    parts : List[UploadPart]
+        The parts of the file.
+    uploaded_parts : int
+        The number of parts sent by the last call, the others being already received.
+    """
+
+    upload_id: str
+    url: str
+    size: int
+    parts: List[UploadPart] = field(default_factory=list, repr=False)
+    uploaded_parts: int = field(default=0)
+
+
+def plan_parts(size: int, part_size: int = UPLOAD_PART_SIZE) -> List[UploadPart]:
+    """
+    Split a file into parts.
+
+    Parameters
+    ----------
+    size : int
+        The size of the file, in bytes.
+    part_size : int
+        The size of the parts, in bytes. The default is 8 MiB.
+
+    Returns
+    -------
+    List[UploadPart]
+        The parts, at least one even for an empty file.
+    """
+    if part_size < 1:
+        raise ValueError("`part_size` must be a positive integer.")
+
+    parts = [
+        UploadPart(number=number, offset=offset, size=min(part_size, size - offset))
+        for number, offset in enumerate(range(0, size, part_size), start=1)
+    ]
+    return parts if parts else [UploadPart(number=1, offset=0, size=0)]
+
+
+def read_part(path: Union[str, Path], part: UploadPart) -> bytes:
+    """Read a part of a file and set its checksum."""
+    with open(path, "rb") as f:
+        f.seek(part.offset)
+        data = f.read(part.size)
+
+    part.checksum = hashlib.sha256(data).hexdigest()
+    return data
@@ -15,7 +15,7 @@
 """Wordcab API Utils functions."""
 
 import re
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from .config import (
     CONTEXT_ELEMENTS,
@@ -29,6 +29,44 @@ from .config import (
 from .core_objects.utils import _get_deepgram_utterances
 
 
+def iter_deepgram_source(deepgram_json: Dict[str, Any]) -> Iterator[str]:
+    """
+    Format the Deepgram json object to strings, yielded one by one.
+
+    The consecutive utterances of a speaker are merged in a single string, in one
+    pass over the utterances.
+
+    Parameters
+    ----------
+    deepgram_json : Dict[str, Any]
+        The Deepgram json object.
+
+    Yields
+    ------
+    str
+        The merged utterances of a speaker, e.g. `SPEAKER A: Hello world.`.
+    """
+    utterances = _get_deepgram_utterances(deepgram_json)
+
+    speaker = None
+    transcripts: List[str] = []
+    for utt in utterances:
+        if transcripts and utt["speaker"] == speaker:
+            transcripts.append(utt["transcript"])
+            continue
+
+        if transcripts:
+            yield " ".join(transcripts)
+        speaker = utt["speaker"]
+        transcripts = [
+            f"SPEAKER {TRANSCRIPT_SPEAKER_MAPPING[int(speaker)]}:",
+            utt["transcript"],
+        ]
+
+    if transcripts:
+        yield " ".join(transcripts)
+
+
 def format_deepgram_source(deepgram_json: Dict[str, Any]) -> List[str]:
     """
     Format the Deepgram json object to a list of strings.
@@ -43,31 +81,7 @@ def format_deepgram_source(deepgram_json: Dict[str, Any]) -> List[str]:
     List[str]
         The formatted list of strings.
     """
-    utterances = _get_deepgram_utterances(deepgram_json)
-
-    final_utterances: List[str] = []
-    utt_to_add: str = ""
-
-    for utt in utterances:
-        if not utt_to_add:
-            utt_to_add = (
-                f"SPEAKER {TRANSCRIPT_SPEAKER_MAPPING[int(utt['speaker'])]}:"
-                f" {utt['transcript']}"
-            )
-        else:
-            if utt["speaker"] == utterances[utterances.index(utt) - 1]["speaker"]:
-                utt_to_add = f"{utt_to_add} {utt['transcript']}"
-            else:
-                final_utterances.append(utt_to_add)
-                utt_to_add = (
-                    f"SPEAKER {TRANSCRIPT_SPEAKER_MAPPING[int(utt['speaker'])]}:"
-                    f" {utt['transcript']}"
-                )
-
-    if utt_to_add:
-        final_utterances.append(utt_to_add)
-
-    return final_utterances
+    return list(iter_deepgram_source(deepgram_json))
 
 
 def _check_context_elements(elements: Optional[Union[str, List[str]]]) -> bool:
@@ -0,0 +1,343 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the Wordcab AsyncClient."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+from wordcab.async_client import AsyncClient
+from wordcab.core_objects import (
+    AudioSource,
+    BaseSummary,
+    BaseTranscript,
+    ExtractJob,
+    InMemorySource,
+    JobSettings,
+    ListJobs,
+    Stats,
+    SummarizeJob,
+    TranscribeJob,
+    WordcabTranscriptSource,
+    YoutubeSource,
+)
+from wordcab.retry import RetryPolicy
+
+
+def _mock_transport(routes, seen=None) -> httpx.MockTransport:
+    """Build a transport answering `(method, path)` routes with `(status, json)`."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if seen is not None:
+            seen.append(request)
+        status, body = routes[(request.method, request.url.path)]
+        return httpx.Response(status, json=body)
+
+    return httpx.MockTransport(handler)
+
+
+class TestAsyncClient:
+    """Test suite for the Wordcab AsyncClient."""
+
+    def test_async_client_init(self) -> None:
+        """Test the client initialization."""
+        client = AsyncClient(api_key="dummy_api_key", max_connections=50)
+        assert client.api_key == "dummy_api_key"
+        assert isinstance(client.http_client, httpx.AsyncClient)
+        assert client.max_connections == 50
+
+        with pytest.raises(ValueError):
+            AsyncClient(api_key="dummy_api_key", max_connections=0)
+
+    @pytest.mark.asyncio
+    async def test_async_client_request(self) -> None:
+        """Test the request dispatch method."""
+        async with AsyncClient(api_key="dummy_api_key") as client:
+            with pytest.raises(ValueError):
+                await client.request(method=None)
+
+    @pytest.mark.asyncio
+    async def test_async_get_stats(self) -> None:
+        """Test the get_stats method."""
+        seen = []
+        transport = _mock_transport(
+            {
+                ("GET", "/api/v1/me"): (
+                    200,
+                    {
+                        "account_email": "john.doe@wordcab.com",
+                        "plan": "free",
+                        "monthly_request_limit": 1000000,
+                        "request_count": 100000,
+                        "minutes_summarized": 100000,
+                        "transcripts_summarized": 100000,
+                        "metered_charge": "$100000",
+                        "min_created": "2021-01-01T00:00:00",
+                        "max_created": "2021-01-31T00:00:00",
+                    },
+                )
+            },
+            seen,
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            stats = await client.get_stats(tags=["a", "b"])
+
+        assert isinstance(stats, Stats)
+        assert stats.account_email == "john.doe@wordcab.com"
+        assert seen[0].headers["Authorization"] == "Bearer dummy_api_key"
+        assert seen[0].url.params["tags"] == "a,b"
+
+    @pytest.mark.asyncio
+    async def test_async_start_summary(self, in_memory_source) -> None:
+        """Test the start_summary method with an in-memory source."""
+        seen = []
+        transport = _mock_transport(
+            {("POST", "/api/v1/summarize"): (201, {"job_name": "job_12345"})}, seen
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            job = await client.start_summary(
+                source_object=in_memory_source,
+                display_name="test",
+                summary_type="narrative",
+                summary_lens=1,
+            )
+
+        assert isinstance(job, SummarizeJob)
+        assert job.job_name == "job_12345"
+        assert job.settings == JobSettings(
+            ephemeral_data=False,
+            pipeline="transcribe,summarize",
+            split_long_utterances=False,
+            only_api=True,
+        )
+        assert seen[0].url.params["summary_type"] == "narrative"
+        assert json.loads(seen[0].content) == in_memory_source.obj
+
+    @pytest.mark.asyncio
+    async def test_async_start_extract(self) -> None:
+        """Test the start_extract method with a Wordcab transcript source."""
+        seen = []
+        transport = _mock_transport(
+            {("POST", "/api/v1/extract"): (201, {"job_name": "job_12345"})}, seen
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            job = await client.start_extract(
+                source_object=WordcabTranscriptSource(transcript_id="transcript_123"),
+                display_name="test",
+            )
+
+        assert isinstance(job, ExtractJob)
+        assert job.source == "wordcab_transcript"
+        assert seen[0].url.params["transcript_id"] == "transcript_123"
+
+    @pytest.mark.asyncio
+    async def test_async_start_transcription(self) -> None:
+        """Test the start_transcription method with a Youtube source."""
+        transport = _mock_transport(
+            {("POST", "/api/v1/transcribe"): (200, {"job_name": "job_12345"})}
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            job = await client.start_transcription(
+                source_object=YoutubeSource(
+                    url="https://www.youtube.com/watch?v=9bZkp7q19f0"
+                ),
+                display_name="test",
+                source_lang="en",
+            )
+
+        assert isinstance(job, TranscribeJob)
+        assert job.source == "youtube"
+
+    @pytest.mark.asyncio
+    async def test_async_start_transcription_stream(self) -> None:
+        """Test the start_transcription method streaming a local file."""
+        seen = []
+        transport = _mock_transport(
+            {("POST", "/api/v1/transcribe"): (200, {"job_name": "job_12345"})}, seen
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            job = await client.start_transcription(
+                source_object=AudioSource(filepath="tests/sample_1.mp3", stream=True),
+                display_name="test",
+                source_lang="en",
+            )
+
+        with open("tests/sample_1.mp3", "rb") as f:
+            content = f.read()
+        assert job.source == "audio"
+        assert seen[0].headers["Content-Length"] == str(len(content))
+        assert await seen[0].aread() == content
+
+    @pytest.mark.asyncio
+    async def test_async_jobs_endpoints(self) -> None:
+        """Test the list_jobs, retrieve_job and delete_job methods."""
+        job = {
+            "job_name": "job_12345",
+            "job_status": "SummaryComplete",
+            "display_name": "test",
+            "source": "generic",
+            "summary_details": {"summary_id": "summary_12345"},
+        }
+        transport = _mock_transport(
+            {
+                ("GET", "/api/v1/jobs"): (
+                    200,
+                    {"page_count": 1, "next": None, "results": [job]},
+                ),
+                ("GET", "/api/v1/jobs/job_12345"): (200, job),
+                ("DELETE", "/api/v1/jobs/job_12345"): (200, {"job_name": "job_12345"}),
+            }
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            jobs, retrieved, deleted = await asyncio.gather(
+                client.list_jobs(),
+                client.retrieve_job("job_12345"),
+                client.delete_job("job_12345", warning=False),
+            )
+
+        assert isinstance(jobs, ListJobs)
+        assert isinstance(jobs.results[0], SummarizeJob)
+        assert isinstance(retrieved, SummarizeJob)
+        assert deleted == {"job_name": "job_12345"}
+
+    @pytest.mark.asyncio
+    async def test_async_transcript_and_summary_endpoints(self) -> None:
+        """Test the transcript and summary methods."""
+        transport = _mock_transport(
+            {
+                ("GET", "/api/v1/transcripts/transcript_123"): (
+                    200,
+                    {
+                        "transcript_id": "transcript_123",
+                        "transcript": [{"text": "Hello.", "speaker": "A"}],
+                    },
+                ),
+                ("PATCH", "/api/v1/transcripts/transcript_123"): (
+                    200,
+                    {"transcript_id": "transcript_123", "speaker_map": {"A": "Bob"}},
+                ),
+                ("GET", "/api/v1/summaries/summary_123"): (
+                    200,
+                    {
+                        "job_status": "SummaryComplete",
+                        "summary_id": "summary_123",
+                        "summary_type": "narrative",
+                        "summary": {
+                            "1": {"structured_summary": [{"summary": "Greetings."}]}
+                        },
+                    },
+                ),
+                ("GET", "/api/v1/summaries"): (
+                    200,
+                    {"page_count": 1, "next": None, "results": []},
+                ),
+                ("GET", "/api/v1/transcripts"): (
+                    200,
+                    {"page_count": 1, "next": None, "results": []},
+                ),
+            }
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            transcript = await client.retrieve_transcript("transcript_123")
+            changed = await client.change_speaker_labels(
+                "transcript_123", speaker_map={"A": "Bob"}
+            )
+            summary = await client.retrieve_summary("summary_123")
+            summaries = await client.list_summaries(page_number=1)
+            transcripts = await client.list_transcripts()
+
+        assert isinstance(transcript, BaseTranscript)
+        assert transcript.transcript[0].text == "Hello."
+        assert changed.speaker_map == {"A": "Bob"}
+        assert isinstance(summary, BaseSummary)
+        assert summary.summary["1"]["structured_summary"][0].summary == "Greetings."
+        assert summaries.results == []
+        assert transcripts.results == []
+
+    @pytest.mark.asyncio
+    async def test_async_error(self) -> None:
+        """Test an unexpected status code raises a ValueError."""
+        transport = _mock_transport(
+            {("GET", "/api/v1/jobs/job_12345"): (404, {"detail": "Not found."})}
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            with pytest.raises(ValueError):
+                await client.retrieve_job("job_12345")
+
+    def test_async_client_validation(self) -> None:
+        """Test the arguments are validated before sending anything."""
+        client = AsyncClient(api_key="dummy_api_key")
+        with pytest.raises(ValueError):
+            asyncio.run(
+                client.start_summary(
+                    source_object=InMemorySource(obj=["SPEAKER A: Hello."]),
+                    display_name="test",
+                    summary_type="invalid",
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_async_prepare_off_loop(self, monkeypatch) -> None:
+        """Test the sources are prepared outside of the event loop thread."""
+        threads = []
+        prepare_payload = InMemorySource.prepare_payload
+
+        def record_thread(source):
+            threads.append(threading.current_thread())
+            return prepare_payload(source)
+
+        monkeypatch.setattr(InMemorySource, "prepare_payload", record_thread)
+        transport = _mock_transport(
+            {("POST", "/api/v1/summarize"): (201, {"job_name": "job_1"})}
+        )
+        async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+            job = await client.start_summary(
+                source_object=InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]}),
+                display_name="test",
+                summary_type="narrative",
+            )
+
+        assert job.job_name == "job_1"
+        assert threads and threading.current_thread() not in threads
+
+    @pytest.mark.asyncio
+    async def test_async_retries(self) -> None:
+        """Test transient failures and transport errors are retried."""
+        outcomes = [
+            httpx.ConnectError("reset"),
+            httpx.Response(503),
+            httpx.Response(200, json={"job_name": "job_1"}),
+        ]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        attempts = []
+        async with AsyncClient(
+            api_key="dummy_api_key",
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(base_delay=0),
+            on_attempt=attempts.append,
+        ) as client:
+            deleted = await client.delete_job("job_1", warning=False)
+
+        assert deleted == {"job_name": "job_1"}
+        assert [a.status_code for a in attempts] == [None, 503, 200]
+        assert outcomes == []
@@ -15,7 +15,12 @@
 """Test suite for the Wordcab Client."""
 
 import pytest
+import requests
+import responses
+from requests.adapters import HTTPAdapter
 from wordcab import Client
+from wordcab.core_objects import WordcabTranscriptSource
+from wordcab.retry import RetryPolicy
 
 
 class TestClient:
@@ -36,3 +41,111 @@ class TestClient:
         with pytest.raises(ValueError):
             with Client(api_key="dummy_api_key") as client:
                 client.request(method=None)
+
+    def test_client_session_pool(self) -> None:
+        """Test the client keep-alive session and its connection pool."""
+        client = Client(api_key="dummy_api_key", pool_connections=4, pool_maxsize=32)
+        assert isinstance(client.session, requests.Session)
+
+        adapter = client.session.get_adapter("https://wordcab.com/api/v1/me")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_connections == 4
+        assert adapter._pool_maxsize == 32
+
+        with pytest.raises(ValueError):
+            Client(api_key="dummy_api_key", pool_maxsize=0)
+
+    def test_client_session_closed_on_exit(self, monkeypatch) -> None:
+        """Test the session is closed when leaving the client context."""
+        closed = []
+        with Client(api_key="dummy_api_key") as client:
+            monkeypatch.setattr(client.session, "close", lambda: closed.append(True))
+        assert closed == [True]
+
+    def test_client_session_reused(self, mock_server) -> None:
+        """Test every endpoint call goes through the same session."""
+        mock_server.add(
+            responses.DELETE,
+            "https://wordcab.com/api/v1/jobs/job_1",
+            json={"job_name": "job_1"},
+            status=200,
+        )
+        mock_server.add(
+            responses.DELETE,
+            "https://wordcab.com/api/v1/jobs/job_2",
+            json={"job_name": "job_2"},
+            status=200,
+        )
+        with Client(api_key="dummy_api_key") as client:
+            session = client.session
+            client.delete_job("job_1", warning=False)
+            client.delete_job("job_2", warning=False)
+            assert client.session is session
+
+    def test_client_retries(self, mock_server) -> None:
+        """Test transient failures are retried and every attempt is reported."""
+        url = "https://wordcab.com/api/v1/jobs/job_1"
+        mock_server.add(responses.DELETE, url, status=503)
+        mock_server.add(responses.DELETE, url, status=429, headers={"Retry-After": "0"})
+        mock_server.add(responses.DELETE, url, json={"job_name": "job_1"}, status=200)
+
+        attempts = []
+        with Client(
+            api_key="dummy_api_key",
+            retry_policy=RetryPolicy(base_delay=0),
+            on_attempt=attempts.append,
+        ) as client:
+            assert client.delete_job("job_1", warning=False) == {"job_name": "job_1"}
+
+        assert [a.status_code for a in attempts] == [503, 429, 200]
+        assert [a.attempt for a in attempts] == [1, 2, 3]
+        assert attempts[-1].delay is None
+        assert all(a.endpoint == "delete_job" and a.elapsed >= 0 for a in attempts)
+
+    def test_client_retries_exhausted(self, mock_server) -> None:
+        """Test the API error is raised once the attempts are exhausted."""
+        url = "https://wordcab.com/api/v1/jobs/job_1"
+        mock_server.add(responses.GET, url, status=503, body="Unavailable")
+
+        with Client(
+            api_key="dummy_api_key", retry_policy=RetryPolicy(base_delay=0)
+        ) as client:
+            with pytest.raises(ValueError, match="Unavailable"):
+                client.retrieve_job("job_1")
+        assert len(mock_server.calls) == 3
+
+    def test_client_no_retry_on_post(self, mock_server) -> None:
+        """Test a job creation is never sent twice."""
+        mock_server.add(
+            responses.POST,
+            "https://wordcab.com/api/v1/extract",
+            status=503,
+            body="Unavailable",
+        )
+        with Client(
+            api_key="dummy_api_key", retry_policy=RetryPolicy(base_delay=0)
+        ) as client:
+            with pytest.raises(ValueError):
+                client.start_extract(
+                    source_object=WordcabTranscriptSource(transcript_id="t_1"),
+                    display_name="test",
+                )
+        assert len(mock_server.calls) == 1
+
+    def test_client_retries_connection_errors(self, mock_server) -> None:
+        """Test connection errors are retried, then raised."""
+        url = "https://wordcab.com/api/v1/jobs/job_1"
+        mock_server.add(responses.GET, url, body=requests.ConnectionError("reset"))
+        mock_server.add(responses.GET, url, body=requests.ConnectionError("reset"))
+
+        attempts = []
+        with Client(
+            api_key="dummy_api_key",
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            on_attempt=attempts.append,
+        ) as client:
+            with pytest.raises(requests.ConnectionError):
+                client.retrieve_job("job_1")
+
+        assert [a.status_code for a in attempts] == [None, None]
+        assert "reset" in attempts[0].error
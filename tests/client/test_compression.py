@@ -0,0 +1,136 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the gzip compression of the request bodies."""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from wordcab.async_client import AsyncClient
+from wordcab.client import Client
+from wordcab.core_objects import DeepgramSource, InMemorySource, SummarizeJob
+
+
+class _DecompressingHandler(BaseHTTPRequestHandler):
+    """Stand-in for the API, decompressing the gzip bodies like the real server."""
+
+    def do_POST(self) -> None:
+        """Record the decoded body and answer with a job."""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        encoding = self.headers.get("Content-Encoding")
+        if encoding == "gzip":
+            body = gzip.decompress(body)
+        self.server.received.append(  # type: ignore
+            {"encoding": encoding, "size": len(body), "body": json.loads(body)}
+        )
+
+        response = json.dumps({"job_name": "job_12345"}).encode("utf-8")
+        self.send_response(201)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args: Any) -> None:
+        """Silence the request logs."""
+
+
+@pytest.fixture
+def local_server() -> Iterator[ThreadingHTTPServer]:
+    """Run the stand-in server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _DecompressingHandler)
+    server.received: List[Dict[str, Any]] = []  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _base_url(server: ThreadingHTTPServer) -> str:
+    """Get the API base URL of the stand-in server."""
+    return f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+
+def test_gzip_min_size_validation() -> None:
+    """Test a negative threshold is rejected."""
+    with pytest.raises(ValueError):
+        Client(api_key="dummy_api_key", gzip_min_size=-1)
+
+
+def test_start_summary_gzip(local_server: ThreadingHTTPServer) -> None:
+    """Test the bodies above the threshold are compressed and decoded unchanged."""
+    source = DeepgramSource(filepath=Path("tests/deepgram_sample.json"))
+    small = InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]})
+
+    with Client(
+        api_key="dummy_api_key",
+        base_url=_base_url(local_server),
+        gzip_min_size=1024,
+    ) as client:
+        for source_object in (source, small):
+            job = client.start_summary(
+                source_object=source_object,
+                display_name="test-sdk-gzip",
+                summary_type="narrative",
+                summary_lens=1,
+            )
+            assert isinstance(job, SummarizeJob)
+        job = client.start_extract(source_object=source, display_name="test-sdk-gzip")
+        assert job.job_name == "job_12345"
+
+    large, small_request, extract = local_server.received  # type: ignore
+    assert large["encoding"] == "gzip"
+    assert large["body"] == json.loads(source.prepare_payload())
+    assert small_request["encoding"] is None
+    assert small_request["body"] == {"transcript": ["SPEAKER A: Hi."]}
+    assert extract["encoding"] == "gzip"
+
+
+def test_start_summary_without_gzip(local_server: ThreadingHTTPServer) -> None:
+    """Test the bodies are sent as is by default."""
+    with Client(api_key="dummy_api_key", base_url=_base_url(local_server)) as client:
+        client.start_summary(
+            source_object=DeepgramSource(filepath=Path("tests/deepgram_sample.json")),
+            display_name="test-sdk-gzip",
+            summary_type="narrative",
+            summary_lens=1,
+        )
+
+    assert local_server.received[0]["encoding"] is None  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_start_summary_gzip(local_server: ThreadingHTTPServer) -> None:
+    """Test the async client compresses the bodies in the executor."""
+    source = DeepgramSource(filepath=Path("tests/deepgram_sample.json"))
+    async with AsyncClient(
+        api_key="dummy_api_key", base_url=_base_url(local_server), gzip_min_size=0
+    ) as client:
+        job = await client.start_summary(
+            source_object=source,
+            display_name="test-sdk-gzip",
+            summary_type="narrative",
+            summary_lens=1,
+        )
+        assert job.job_name == "job_12345"
+
+    received = local_server.received[0]  # type: ignore
+    assert received["encoding"] == "gzip"
+    assert received["body"] == json.loads(source.prepare_payload())
@@ -0,0 +1,188 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the idempotency keys of the job creations."""
+
+from typing import List
+
+import httpx
+import pytest
+import requests
+import responses
+from wordcab.async_client import AsyncClient
+from wordcab.client import Client
+from wordcab.core_objects import InMemorySource, YoutubeSource
+from wordcab.retry import RetryPolicy
+
+API_URL = "https://wordcab.com/api/v1"
+
+
+def _source(text: str = "Hello.") -> InMemorySource:
+    """Build an in-memory transcript source."""
+    return InMemorySource(obj={"transcript": [f"SPEAKER A: {text}"]})
+
+
+def test_idempotency_key_retries(mock_server: responses.RequestsMock) -> None:
+    """Test a job creation with a key is retried, and not sent again afterwards."""
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", body=requests.ConnectionError("reset")
+    )
+    mock_server.add(responses.POST, f"{API_URL}/summarize", status=503)
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", json={"job_name": "job_1"}, status=201
+    )
+
+    with Client(
+        api_key="dummy_api_key",
+        retry_policy=RetryPolicy(base_delay=0),
+    ) as client:
+        job = client.start_summary(
+            source_object=_source(),
+            display_name="test",
+            summary_type="narrative",
+            idempotency_key="summary-1",
+        )
+        same_job = client.start_summary(
+            source_object=_source(),
+            display_name="test",
+            summary_type="narrative",
+            idempotency_key="summary-1",
+        )
+
+    assert job.job_name == "job_1"
+    assert same_job is job
+    assert len(mock_server.calls) == 3
+    assert all(
+        call.request.headers["Idempotency-Key"] == "summary-1"
+        for call in mock_server.calls
+    )
+
+
+def test_derived_idempotency_keys(mock_server: responses.RequestsMock) -> None:
+    """Test the keys derived from the content and the parameters of the jobs."""
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", json={"job_name": "job_1"}, status=201
+    )
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", json={"job_name": "job_2"}, status=201
+    )
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", json={"job_name": "job_3"}, status=201
+    )
+
+    with Client(api_key="dummy_api_key", idempotency_keys=True) as client:
+        jobs = [
+            client.start_summary(
+                source_object=_source(text),
+                display_name=display_name,
+                summary_type="narrative",
+            )
+            for text, display_name in [
+                ("Hello.", "test"),
+                ("Hello.", "test"),
+                ("Hello.", "other"),
+                ("Bye.", "test"),
+            ]
+        ]
+
+    assert [job.job_name for job in jobs] == ["job_1", "job_1", "job_2", "job_3"]
+    keys = [call.request.headers["Idempotency-Key"] for call in mock_server.calls]
+    assert len(set(keys)) == 3
+
+    with Client(api_key="dummy_api_key") as client:
+        assert client._derive_idempotency_key("start_summary", None, None, {}) is None
+        assert client._lookup_created_job(None) is None
+        request = client._prepare_start_summary(
+            source_object=_source(), display_name="test", summary_type="narrative"
+        )
+        client._set_idempotency_key(request, None)
+        assert "Idempotency-Key" not in request.headers
+
+
+def test_idempotency_key_no_retry(mock_server: responses.RequestsMock) -> None:
+    """Test a job creation with a key isn't retried when the policy disables it."""
+    mock_server.add(responses.POST, f"{API_URL}/summarize", status=503)
+
+    with Client(
+        api_key="dummy_api_key",
+        retry_policy=RetryPolicy(base_delay=0, retry_idempotency_keys=False),
+    ) as client:
+        with pytest.raises(ValueError):
+            client.start_summary(
+                source_object=_source(),
+                display_name="test",
+                summary_type="narrative",
+                idempotency_key="summary-1",
+            )
+
+    assert len(mock_server.calls) == 1
+
+
+def test_created_job_not_prepared(
+    mock_server: responses.RequestsMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test a job already created is returned before its request is prepared."""
+    mock_server.add(
+        responses.POST, f"{API_URL}/summarize", json={"job_name": "job_1"}, status=201
+    )
+
+    with Client(api_key="dummy_api_key", idempotency_keys=True) as client:
+        job = client.start_summary(
+            source_object=_source(), display_name="test", summary_type="narrative"
+        )
+
+        def prepare(*args, **kwargs):
+            raise AssertionError("The request must not be prepared.")
+
+        monkeypatch.setattr(client, "_prepare_start_summary", prepare)
+        same_job = client.start_summary(
+            source_object=_source(), display_name="test", summary_type="narrative"
+        )
+
+    assert same_job is job
+
+
+@pytest.mark.asyncio
+async def test_async_idempotency_keys() -> None:
+    """Test the async client retries the job creations with a derived key."""
+    seen: List[httpx.Request] = []
+    outcomes = [
+        httpx.ConnectError("reset"),
+        httpx.Response(201, json={"job_name": "job_1"}),
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    async with AsyncClient(
+        api_key="dummy_api_key",
+        transport=httpx.MockTransport(handler),
+        retry_policy=RetryPolicy(base_delay=0),
+        idempotency_keys=True,
+    ) as client:
+        source = YoutubeSource(url="https://youtu.be/dQw4w9WgXcQ")
+        job = await client.start_transcription(
+            source_object=source, display_name="test", source_lang="en"
+        )
+        same_job = await client.start_transcription(
+            source_object=source, display_name="test", source_lang="en"
+        )
+
+    assert job.job_name == "job_1" and same_job is job
+    assert len(seen) == 2
+    assert seen[0].headers["Idempotency-Key"] == seen[1].headers["Idempotency-Key"]
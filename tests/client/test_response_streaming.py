@@ -0,0 +1,205 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the compressed and streamed responses."""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from wordcab.async_client import AsyncClient
+from wordcab.client import Client
+from wordcab.core_objects import (
+    BaseSummary,
+    BaseTranscript,
+    ListTranscripts,
+    StructuredSummary,
+    TranscriptUtterance,
+)
+
+TRANSCRIPT = {
+    "transcript_id": "audio_transcript_12345",
+    "job_id_set": ["job_12345"],
+    "summary_id_set": [],
+    "speaker_map": {"A": "Agent", "B": "Customer"},
+    "transcript": [
+        {
+            "text": f'Utterance {i}, with "quotes" and {{braces}} é.',
+            "speaker": "A" if i % 2 else "B",
+            "start": "00:00:01",
+            "end": "00:00:02",
+            "timestamp_start": i * 1000,
+            "timestamp_end": i * 1000 + 500,
+        }
+        for i in range(500)
+    ],
+}
+SUMMARY = {
+    "job_status": "SummaryComplete",
+    "summary_id": "narrative_summary_12345",
+    "summary_type": "narrative",
+    "summary": {
+        length: {
+            "structured_summary": [
+                {
+                    "summary": f"Summary of length {length}.",
+                    "start": "00:00:00",
+                    "end": "00:01:00",
+                    "transcript_segment": TRANSCRIPT["transcript"][:3],
+                }
+            ]
+        }
+        for length in ("1", "3")
+    },
+}
+ROUTES = {
+    "/api/v1/transcripts/audio_transcript_12345": TRANSCRIPT,
+    "/api/v1/summaries/narrative_summary_12345": SUMMARY,
+    "/api/v1/transcripts": {"page_count": 1, "next": None, "results": [TRANSCRIPT]},
+}
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    """Stand-in for the API, compressing the responses when the client accepts it."""
+
+    def do_GET(self) -> None:
+        """Answer with the JSON of the route."""
+        body = json.dumps(ROUTES[self.path.split("?")[0]]).encode("utf-8")
+        encoding = self.headers.get("Accept-Encoding", "")
+        self.server.encodings.append(encoding)  # type: ignore
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in encoding:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        """Silence the request logs."""
+
+
+@pytest.fixture
+def local_server() -> Iterator[ThreadingHTTPServer]:
+    """Run the stand-in server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _GzipHandler)
+    server.encodings: List[str] = []  # type: ignore
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _base_url(server: ThreadingHTTPServer) -> str:
+    """Get the API base URL of the stand-in server."""
+    return f"http://127.0.0.1:{server.server_address[1]}/api/v1"
+
+
+def _check_results(
+    transcript: BaseTranscript, summary: BaseSummary, transcripts: ListTranscripts
+) -> None:
+    """Check the retrieved objects match the served JSON."""
+    assert isinstance(transcript, BaseTranscript)
+    assert transcript.speaker_map == TRANSCRIPT["speaker_map"]
+    assert transcript.transcript == [
+        TranscriptUtterance(**utterance) for utterance in TRANSCRIPT["transcript"]
+    ]
+
+    assert isinstance(summary, BaseSummary)
+    assert list(summary.summary) == ["1", "3"]  # type: ignore
+    structured = summary.summary["3"]["structured_summary"]  # type: ignore
+    assert isinstance(structured[0], StructuredSummary)
+    assert structured[0].summary == "Summary of length 3."
+
+    assert transcripts.page_count == 1
+    assert [item.transcript_id for item in transcripts.results] == [
+        transcript.transcript_id
+    ]
+    assert transcripts.results[0].transcript == TRANSCRIPT["transcript"]
+
+
+@pytest.mark.parametrize("stream_responses", [False, True])
+def test_compressed_responses(
+    local_server: ThreadingHTTPServer, stream_responses: bool
+) -> None:
+    """Test the compressed responses are decoded, streamed or buffered."""
+    with Client(
+        api_key="dummy_api_key",
+        base_url=_base_url(local_server),
+        stream_responses=stream_responses,
+    ) as client:
+        _check_results(
+            client.retrieve_transcript("audio_transcript_12345"),
+            client.retrieve_summary("narrative_summary_12345"),
+            client.list_transcripts(),
+        )
+
+    assert all("gzip" in encoding for encoding in local_server.encodings)  # type: ignore
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("stream_responses", [False, True])
+async def test_async_compressed_responses(
+    local_server: ThreadingHTTPServer, stream_responses: bool
+) -> None:
+    """Test the async client decodes the compressed responses, streamed or buffered."""
+    async with AsyncClient(
+        api_key="dummy_api_key",
+        base_url=_base_url(local_server),
+        stream_responses=stream_responses,
+    ) as client:
+        _check_results(
+            await client.retrieve_transcript("audio_transcript_12345"),
+            await client.retrieve_summary("narrative_summary_12345"),
+            await client.list_transcripts(),
+        )
+
+    assert all("gzip" in encoding for encoding in local_server.encodings)  # type: ignore
+
+
+def test_streamed_response_error(local_server: ThreadingHTTPServer) -> None:
+    """Test a streamed error response is still reported."""
+    ROUTES["/api/v1/summaries/invalid"] = None  # type: ignore
+    try:
+        with Client(
+            api_key="dummy_api_key",
+            base_url=_base_url(local_server),
+            stream_responses=True,
+        ) as client:
+            with pytest.raises(ValueError, match="root must be an object"):
+                client.retrieve_summary("invalid")
+    finally:
+        del ROUTES["/api/v1/summaries/invalid"]
+
+
+def test_member_parsers_match(local_server: ThreadingHTTPServer) -> None:
+    """Test the streamed and buffered decodings give the same objects."""
+    results: Dict[bool, Any] = {}
+    for stream_responses in (False, True):
+        with Client(
+            api_key="dummy_api_key",
+            base_url=_base_url(local_server),
+            stream_responses=stream_responses,
+        ) as client:
+            results[stream_responses] = client.retrieve_summary(
+                "narrative_summary_12345"
+            )
+
+    assert results[False] == results[True]
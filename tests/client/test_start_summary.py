@@ -14,14 +14,20 @@
 
 """Test suite for the Client start_summary method."""
 
+import json
+from pathlib import Path
+
 import pytest
 import responses
 from wordcab.client import Client
 from wordcab.core_objects import (
     AssemblyAISource,
+    AudioSource,
     DeepgramSource,
+    GenericSource,
     JobSettings,
     RevSource,
+    SRTSource,
     SummarizeJob,
     VTTSource,
     WordcabTranscriptSource,
@@ -271,6 +277,58 @@ class TestClientStartSummary:
                 only_api=True,
             )
 
+    @pytest.mark.usefixtures("api_key", "mock_server")
+    def test_start_summary_lazy_source(self, api_key, mock_server) -> None:
+        """Test client start_summary method loads and releases a lazy source."""
+        with Client(api_key=api_key) as client:
+            mock_server.add(
+                responses.POST,
+                url="https://wordcab.com/api/v1/summarize",
+                json={"job_name": "job_12345"},
+                status=201,
+            )
+            source = GenericSource(filepath=Path("tests/sample_1.txt"), lazy=True)
+            assert source.file_object is None
+
+            client.start_summary(
+                source_object=source,
+                display_name="test-sdk-lazy",
+                summary_type="narrative",
+            )
+
+            assert source.file_object is None
+            sent = json.loads(mock_server.calls[0].request.body)
+            assert sent["transcript"] == (
+                Path("tests/sample_1.txt").read_text().splitlines()
+            )
+
+    @pytest.mark.usefixtures("api_key", "mock_server")
+    def test_start_summary_audio_stream(self, api_key, mock_server) -> None:
+        """Test client start_summary method streaming an open audio file."""
+        with Client(api_key=api_key) as client:
+            mock_server.add(
+                responses.POST,
+                url="https://wordcab.com/api/v1/summarize",
+                json={"job_name": "job_12345"},
+                status=201,
+            )
+            with open("tests/sample_1.mp3", "rb") as f:
+                audio_job = client.start_summary(
+                    source_object=AudioSource(fileobj=f),
+                    display_name="test-sdk-audio",
+                    summary_type="narrative",
+                )
+                request = mock_server.calls[0].request
+                body = b"".join(request.body)
+
+            assert audio_job.source == "audio"
+            assert request.headers["Content-Type"].startswith(
+                "multipart/form-data; boundary="
+            )
+            assert int(request.headers["Content-Length"]) == len(body)
+            assert b'name="audio_file"; filename="sample_1.mp3"' in body
+            assert Path("tests/sample_1.mp3").read_bytes() in body
+
     @pytest.mark.usefixtures("audio_url_source_no_download", "api_key", "mock_server")
     def test_start_summary_audio_url(
         self, audio_url_source_no_download, api_key, mock_server
@@ -423,6 +481,33 @@ class TestClientStartSummary:
                 only_api=True,
             )
 
+    @pytest.mark.usefixtures("api_key", "mock_server")
+    def test_start_summary_parsed_subtitles(self, api_key, mock_server) -> None:
+        """Test client start_summary method with parsed VTT and SRT sources."""
+        with Client(api_key=api_key) as client:
+            for source_object in (
+                VTTSource(filepath="tests/vtt_sample.vtt", parse=True),
+                SRTSource(filepath="tests/srt_sample.srt"),
+            ):
+                mock_server.add(
+                    responses.POST,
+                    url="https://wordcab.com/api/v1/summarize",
+                    json={"job_name": "job_12345"},
+                    status=201,
+                )
+                job = client.start_summary(
+                    source_object=source_object,
+                    display_name="test-sdk-subtitles",
+                    summary_type="narrative",
+                    summary_lens=1,
+                )
+                assert isinstance(job, SummarizeJob)
+                assert job.source == "generic"
+                assert (
+                    mock_server.calls[-1].request.body
+                    == source_object.prepare_payload()
+                )
+
     @pytest.mark.usefixtures("api_key")
     def test_start_summary_vtt_transcript(self, api_key) -> None:
         """Test client start_summary method with VTTSource."""
@@ -14,10 +14,13 @@
 
 """Test suite for the Client start_transcription method."""
 
+from pathlib import Path
+
 import pytest
 import responses
 from wordcab.client import Client
 from wordcab.core_objects import (
+    AudioSource,
     JobSettings,
     TranscribeJob,
 )
@@ -139,3 +142,65 @@ class TestClientStartTranscription:
                 split_long_utterances=False,
                 only_api=True,
             )
+
+    @pytest.mark.usefixtures("api_key", "mock_server")
+    def test_start_transcription_audio_stream(self, api_key, mock_server) -> None:
+        """Test the start_transcription method streaming a local file."""
+        with Client(api_key=api_key) as client:
+            mock_server.add(
+                responses.POST,
+                url="https://wordcab.com/api/v1/transcribe",
+                json={"job_name": "test_job_name"},
+                status=200,
+            )
+            transcribe_job = client.start_transcription(
+                source_object=AudioSource(filepath="tests/sample_1.mp3", stream=True),
+                display_name="test_display_name",
+                source_lang="en",
+            )
+            assert transcribe_job.job_name == "test_job_name"
+
+            request = mock_server.calls[0].request
+            assert "url" not in request.params
+            assert request.headers["Content-Type"] == "audio/.mp3"
+            assert request.headers["Content-Length"] == str(
+                Path("tests/sample_1.mp3").stat().st_size
+            )
+            assert b"".join(request.body) == Path("tests/sample_1.mp3").read_bytes()
+
+    @pytest.mark.usefixtures("api_key", "mock_server")
+    def test_start_transcription_remote_stream_closed(
+        self, api_key, mock_server
+    ) -> None:
+        """Test the spooled download of a streamed remote file is closed."""
+        mock_server.add(
+            responses.GET, "https://example.com/audio.wav", body=b"RIFF" * 10
+        )
+        mock_server.add(
+            responses.POST,
+            url="https://wordcab.com/api/v1/transcribe",
+            json={"job_name": "test_job_name"},
+            status=200,
+        )
+        audio_source = AudioSource(
+            url="https://example.com/audio.wav", download=True, stream=True
+        )
+        streams = []
+
+        def prepare_stream():
+            streams.append(AudioSource.prepare_stream(audio_source))
+            return streams[-1]
+
+        audio_source.prepare_stream = prepare_stream
+
+        with Client(api_key=api_key) as client:
+            transcribe_job = client.start_transcription(
+                source_object=audio_source,
+                display_name="test_display_name",
+                source_lang="en",
+            )
+
+        assert transcribe_job.job_name == "test_job_name"
+        (stream,) = streams
+        assert mock_server.calls[1].request.body is stream
+        assert stream.source.closed
@@ -0,0 +1,299 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the Client submit_* methods."""
+
+import asyncio
+import itertools
+import json
+import re
+import threading
+from concurrent.futures import as_completed
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import pytest
+import responses
+from wordcab.batch import Batch, BatchResult
+from wordcab.client import Client
+from wordcab.core_objects import (
+    BaseSummary,
+    BaseTranscript,
+    InMemorySource,
+    SummarizeJob,
+    YoutubeSource,
+)
+from wordcab.futures import JobFuture
+from wordcab.journal import JobJournal
+from wordcab.polling import PollingPolicy
+
+API_URL = "https://wordcab.com/api/v1"
+FAST_POLLING = PollingPolicy(min_interval=0.01, max_interval=0.01)
+
+
+class _FakeAPI:
+    """Jobs going through `polls` running statuses before their final status."""
+
+    def __init__(self, polls: int = 2, final_status: Dict[int, str] = None) -> None:
+        self.polls = polls
+        self.final_status = final_status or {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.counter = itertools.count(1)
+        self.lock = threading.RLock()
+        self.list_calls = 0
+        self.poll_failures = 0
+
+    def _start(self, job_type: str) -> Dict[str, Any]:
+        with self.lock:
+            number = next(self.counter)
+            name = f"job_{number}"
+            self.jobs[name] = {
+                "job_name": name,
+                "job_status": "Pending",
+                "display_name": "test",
+                "source": "generic",
+                "transcript_id": f"generic_transcript_{number}",
+                "polls": 0,
+                "final_status": self.final_status.get(number, job_type),
+            }
+            if job_type == "SummaryComplete":
+                self.jobs[name]["summary_details"] = {"summary_id": f"summary_{number}"}
+        return {"job_name": name}
+
+    def _poll(self, name: str) -> Dict[str, Any]:
+        job = self.jobs[name]
+        job["polls"] += 1
+        if job["polls"] > self.polls:
+            job["job_status"] = job["final_status"]
+        elif job["job_status"] == "Pending":
+            job["job_status"] = "ItemQueued"
+        return {k: v for k, v in job.items() if k not in ("polls", "final_status")}
+
+    def callback(self, request: Any) -> Tuple[int, Dict[str, str], str]:
+        path = urlparse(request.url).path[len("/api/v1") :]
+        with self.lock:
+            if path == "/summarize":
+                body = self._start("SummaryComplete")
+            elif path == "/transcribe":
+                body = self._start("TranscriptComplete")
+            elif path.startswith("/jobs") and self.poll_failures > 0:
+                self.poll_failures -= 1
+                return 400, {}, json.dumps({"detail": "Bad request"})
+            elif path == "/jobs":
+                self.list_calls += 1
+                body = {
+                    "page_count": 1,
+                    "next": None,
+                    "results": [self._poll(name) for name in reversed(self.jobs)],
+                }
+            elif path.startswith("/jobs/"):
+                body = self._poll(path.rsplit("/", 1)[1])
+            elif path.startswith("/summaries/"):
+                body = {
+                    "summary_id": path.rsplit("/", 1)[1],
+                    "job_status": "SummaryComplete",
+                    "summary_type": "narrative",
+                    "summary": {},
+                }
+            else:
+                body = {
+                    "transcript_id": path.rsplit("/", 1)[1],
+                    "job_id_set": [],
+                    "summary_id_set": [],
+                    "transcript": [],
+                }
+        return 201 if request.method == "POST" else 200, {}, json.dumps(body)
+
+
+@pytest.fixture
+def fake_api(mock_server: responses.RequestsMock) -> _FakeAPI:
+    """Fake jobs API answering all the job endpoints."""
+    api = _FakeAPI(final_status={3: "Error"})
+    for method in (responses.GET, responses.POST):
+        mock_server.add_callback(
+            method, re.compile(f"{API_URL}/.*"), callback=api.callback
+        )
+    mock_server.assert_all_requests_are_fired = False
+    return api
+
+
+def _submit_summaries(client: Client, count: int) -> List[JobFuture]:
+    """Submit summary jobs of in-memory transcripts."""
+    return [
+        client.submit_summary(
+            source_object=InMemorySource(obj={"transcript": [f"SPEAKER A: {i}."]}),
+            display_name=f"test-{i}",
+            summary_type="narrative",
+            summary_lens=1,
+        )
+        for i in range(count)
+    ]
+
+
+def test_submit_summary_as_completed(fake_api: _FakeAPI) -> None:
+    """Test the futures of summary jobs resolve with the summaries, or the errors."""
+    with Client(
+        api_key="dummy_api_key", polling_policy=FAST_POLLING, submit_max_workers=3
+    ) as client:
+        futures = _submit_summaries(client, 6)
+        done = list(as_completed(futures, timeout=10))
+
+    assert len(done) == 6
+    for future in futures:
+        assert isinstance(future.job, SummarizeJob)
+        if future.job.job_name == "job_3":
+            assert isinstance(future.exception(), ValueError)
+            assert "Error" in str(future.exception())
+        else:
+            summary = future.result()
+            assert isinstance(summary, BaseSummary)
+            assert summary.summary_id == f"summary_{future.job.job_name[4:]}"
+    assert fake_api.list_calls > 0
+
+
+def test_submit_transcription_awaitable(fake_api: _FakeAPI) -> None:
+    """Test a future can be awaited in a coroutine."""
+
+    async def transcribe(client: Client) -> BaseTranscript:
+        return await client.submit_transcription(
+            source_object=YoutubeSource(url="https://youtu.be/dQw4w9WgXcQ"),
+            display_name="test",
+            source_lang="en",
+        )
+
+    with Client(api_key="dummy_api_key", polling_policy=FAST_POLLING) as client:
+        transcript = asyncio.run(asyncio.wait_for(transcribe(client), timeout=10))
+
+    assert isinstance(transcript, BaseTranscript)
+    assert transcript.transcript_id == "generic_transcript_1"
+
+
+def test_submit_start_error() -> None:
+    """Test the errors raised when starting the job are set on the future."""
+    with Client(api_key="dummy_api_key") as client:
+        future = client.submit_summary(
+            source_object=InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]}),
+            display_name="test",
+            summary_type="invalid",
+        )
+        assert isinstance(future.exception(timeout=10), ValueError)
+        assert future.job is None
+
+
+def test_close_cancels_futures(fake_api: _FakeAPI) -> None:
+    """Test the futures still running are cancelled when the client is closed."""
+    fake_api.polls = 10_000
+    client = Client(api_key="dummy_api_key", polling_policy=FAST_POLLING)
+    (future,) = _submit_summaries(client, 1)
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.1)
+
+    client.close()
+
+    assert future.cancelled()
+    with pytest.raises(ValueError):
+        client.submit_summary(display_name="test")
+
+
+def test_resume_job_twice(fake_api: _FakeAPI) -> None:
+    """Test several futures of the same job all resolve with its result."""
+    fake_api.polls = 20
+    with Client(api_key="dummy_api_key", polling_policy=FAST_POLLING) as client:
+        (future,) = _submit_summaries(client, 1)
+        resumed = [client.resume_job("job_1") for _ in range(2)]
+        done = list(as_completed([future, *resumed], timeout=10))
+
+    assert len(done) == 3
+    summaries = [f.result() for f in done]
+    assert {summary.summary_id for summary in summaries} == {"summary_1"}
+
+
+def test_submit_poll_error(fake_api: _FakeAPI) -> None:
+    """Test a failed poll delays the next poll instead of failing the future."""
+    fake_api.poll_failures = 3
+    with Client(api_key="dummy_api_key", polling_policy=FAST_POLLING) as client:
+        (future,) = _submit_summaries(client, 1)
+        summary = future.result(timeout=10)
+
+    assert isinstance(summary, BaseSummary)
+    assert fake_api.poll_failures == 0
+
+
+def test_submit_batch(fake_api: _FakeAPI) -> None:
+    """Test a batch of summary jobs, sharing the arguments of `start_summary`."""
+    items = (
+        (
+            InMemorySource(obj={"transcript": [f"SPEAKER A: {i}."]}),
+            {"display_name": f"test-{i}"},
+        )
+        for i in range(5)
+    )
+    with Client(api_key="dummy_api_key", polling_policy=FAST_POLLING) as client:
+        batch = client.submit_batch(
+            items, max_in_flight=2, summary_type="narrative", summary_lens=1
+        )
+        results = list(batch)
+
+        with pytest.raises(ValueError):
+            client.submit_batch([], endpoint="invalid")
+
+    assert sorted(result.index for result in results) == list(range(5))
+    assert [result.ok for result in results].count(False) == 1
+    assert all(
+        isinstance(result.result, BaseSummary) for result in results if result.ok
+    )
+    assert batch.progress.completed == 5
+
+
+def test_submit_batch_journal(fake_api: _FakeAPI, tmp_path: Path) -> None:
+    """Test a restarted batch skips the completed items and resumes the others."""
+    fake_api.final_status = {}
+    path = tmp_path / "journal.sqlite"
+
+    def run(stop_after: Optional[int] = None) -> Tuple[List[BatchResult], Batch]:
+        items = [
+            (
+                InMemorySource(obj={"transcript": [f"SPEAKER A: {i}."]}),
+                {"display_name": f"test-{i}"},
+            )
+            for i in range(3)
+        ]
+        results = []
+        with JobJournal(path) as journal, Client(
+            api_key="dummy_api_key", polling_policy=FAST_POLLING
+        ) as client:
+            batch = client.submit_batch(
+                items, journal=journal, summary_type="narrative", summary_lens=1
+            )
+            for result in batch:
+                results.append(result)
+                if len(results) == stop_after:
+                    break
+        return results, batch
+
+    # The first run stops after the first result, with the other jobs started
+    results, _ = run(stop_after=1)
+    assert len(results) == 1 and results[0].ok
+    assert len(fake_api.jobs) == 3
+
+    results, batch = run()
+    assert len(fake_api.jobs) == 3
+    assert len(results) == 2 and all(result.ok for result in results)
+    assert {result.job.job_name for result in results} < {"job_1", "job_2", "job_3"}
+    assert (batch.progress.skipped, batch.progress.submitted) == (1, 2)
+
+    results, batch = run()
+    assert results == []
+    assert batch.progress.skipped == 3
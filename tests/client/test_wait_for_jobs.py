@@ -0,0 +1,215 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the Client wait_for_job and wait_for_jobs methods."""
+
+import json
+import re
+from typing import Any, Dict, List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+import responses
+from wordcab.async_client import AsyncClient
+from wordcab.client import Client
+from wordcab.core_objects import JobSettings, SummarizeJob, TranscribeJob
+from wordcab.polling import PollingPolicy
+
+JOBS_URL = "https://wordcab.com/api/v1/jobs"
+FAST_POLLING = PollingPolicy(min_interval=0, max_interval=0)
+
+
+def _job(name: str, status: str, **kwargs: Any) -> Dict[str, Any]:
+    """Build the JSON of a job returned by the API."""
+    return {
+        "job_name": name,
+        "job_status": status,
+        "display_name": "test",
+        "source": "generic",
+        "summary_details": {"summary_id": f"summary_{name}"},
+        **kwargs,
+    }
+
+
+class _FakeAPI:
+    """Jobs whose status moves one step forward at every poll."""
+
+    def __init__(self, statuses: Dict[str, List[str]], listed: List[str]) -> None:
+        self.statuses = statuses
+        self.listed = listed
+        self.calls: List[Tuple[str, Any]] = []
+
+    def _poll(self, name: str) -> Dict[str, Any]:
+        statuses = self.statuses[name]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return _job(name, status)
+
+    def list_page(self, page: int) -> Dict[str, Any]:
+        self.calls.append(("list", page))
+        names = self.listed[(page - 1) * 2 : page * 2]
+        return {
+            "page_count": 2,
+            "next": (
+                f"{JOBS_URL}?page={page + 1}" if page * 2 < len(self.listed) else None
+            ),
+            "results": [
+                self._poll(name) if name in self.statuses else _job(name, "Deleted")
+                for name in names
+            ],
+        }
+
+    def retrieve(self, name: str) -> Dict[str, Any]:
+        self.calls.append(("retrieve", name))
+        return self._poll(name)
+
+    def requests_callback(self, request: Any) -> Tuple[int, Dict[str, str], str]:
+        url = urlparse(request.url)
+        if url.path.endswith("/jobs"):
+            page = int(parse_qs(url.query).get("page", ["1"])[0])
+            body = self.list_page(page)
+        else:
+            body = self.retrieve(url.path.rsplit("/", 1)[1])
+        return 200, {}, json.dumps(body)
+
+    def httpx_handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/jobs"):
+            body = self.list_page(int(request.url.params.get("page", 1)))
+        else:
+            body = self.retrieve(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(200, json=body)
+
+
+def _bulk_api() -> _FakeAPI:
+    """Three recent jobs found in the first pages, and an old one retrieved alone."""
+    return _FakeAPI(
+        statuses={
+            "job_1": ["Pending", "Summarizing", "SummaryComplete"],
+            "job_2": ["SummaryComplete"],
+            "job_3": ["Pending", "Pending", "Pending", "Error"],
+            "job_old": ["Summarizing", "SummaryComplete"],
+        },
+        listed=["job_1", "job_2", "job_3", "job_other", "job_5", "job_6"],
+    )
+
+
+def _bulk_api_calls() -> List[Tuple[str, Any]]:
+    """Get the requests sent to `_bulk_api` by the job waiters."""
+    return [
+        ("list", 1),
+        ("list", 2),
+        ("retrieve", "job_old"),
+        ("list", 1),
+        ("list", 2),
+        ("retrieve", "job_old"),
+        ("list", 1),
+        ("retrieve", "job_3"),
+        ("retrieve", "job_3"),
+    ]
+
+
+def test_wait_for_job(client: Client, mock_server: responses.RequestsMock) -> None:
+    """Test a single job is polled until it finishes."""
+    api = _FakeAPI(
+        {"job_12345": ["Pending", "PreparingSummary", "SummaryComplete"]}, []
+    )
+    mock_server.add_callback(
+        responses.GET, f"{JOBS_URL}/job_12345", callback=api.requests_callback
+    )
+
+    job = client.wait_for_job("job_12345", policy=FAST_POLLING)
+
+    assert isinstance(job, SummarizeJob)
+    assert job.job_status == "SummaryComplete"
+    assert api.calls == [("retrieve", "job_12345")] * 3
+
+
+def test_wait_for_transcription_job(
+    client: Client, mock_server: responses.RequestsMock
+) -> None:
+    """Test a transcription job is finished once transcribed."""
+    api = _FakeAPI({"job_12345": ["Transcribing", "TranscriptComplete"]}, [])
+    mock_server.add_callback(
+        responses.GET, f"{JOBS_URL}/job_12345", callback=api.requests_callback
+    )
+    started = TranscribeJob(
+        display_name="test",
+        job_name="job_12345",
+        source="audio",
+        settings=JobSettings(pipeline="transcribe"),
+    )
+
+    job = client.wait_for_job(started, policy=FAST_POLLING)
+
+    assert job.job_status == "TranscriptComplete"
+
+
+def test_wait_for_jobs_bulk(
+    client: Client, mock_server: responses.RequestsMock
+) -> None:
+    """Test the jobs are refreshed with the pages of jobs and yielded as they finish."""
+    api = _bulk_api()
+    mock_server.add_callback(
+        responses.GET, re.compile(f"{JOBS_URL}.*"), callback=api.requests_callback
+    )
+
+    finished = client.wait_for_jobs(
+        ["job_1", "job_2", "job_3", "job_old"], policy=FAST_POLLING, page_size=2
+    )
+
+    assert [(job.job_name, job.job_status) for job in finished] == [
+        ("job_2", "SummaryComplete"),
+        ("job_old", "SummaryComplete"),
+        ("job_1", "SummaryComplete"),
+        ("job_3", "Error"),
+    ]
+    assert api.calls == _bulk_api_calls()
+
+
+def test_wait_for_jobs_timeout(
+    client: Client, mock_server: responses.RequestsMock
+) -> None:
+    """Test a TimeoutError is raised when the jobs don't finish in time."""
+    api = _FakeAPI({"job_12345": ["Summarizing"]}, [])
+    mock_server.add_callback(
+        responses.GET, f"{JOBS_URL}/job_12345", callback=api.requests_callback
+    )
+
+    with pytest.raises(TimeoutError, match="job_12345"):
+        client.wait_for_job(
+            "job_12345", timeout=0.1, policy=PollingPolicy(min_interval=0.02)
+        )
+    assert 1 < len(api.calls) < 5
+
+
+@pytest.mark.asyncio
+async def test_async_wait_for_jobs_bulk() -> None:
+    """Test the async waiter polls the jobs like the sync waiter."""
+    api = _bulk_api()
+    transport = httpx.MockTransport(api.httpx_handler)
+
+    async with AsyncClient(api_key="dummy_api_key", transport=transport) as client:
+        finished = [
+            job.job_name
+            async for job in client.wait_for_jobs(
+                ["job_1", "job_2", "job_3", "job_old"],
+                policy=FAST_POLLING,
+                page_size=2,
+            )
+        ]
+        job = await client.wait_for_job("job_old", policy=FAST_POLLING)
+
+    assert finished == ["job_2", "job_old", "job_1", "job_3"]
+    assert api.calls == _bulk_api_calls() + [("retrieve", "job_old")]
+    assert job.job_status == "SummaryComplete"
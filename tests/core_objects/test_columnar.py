@@ -0,0 +1,153 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the columnar transcript."""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from wordcab.core_objects import (
+    AssemblyAISource,
+    AudioSource,
+    AWSTranscribeSource,
+    DeepgramSource,
+    GenericSource,
+    InMemorySource,
+    RevSource,
+    SRTSource,
+    VTTSource,
+)
+from wordcab.core_objects.columnar import ColumnarTranscript
+from wordcab.serialization import dumps
+from wordcab.utils import format_deepgram_source
+
+
+@pytest.fixture
+def transcript() -> ColumnarTranscript:
+    """Fixture for a columnar transcript."""
+    return ColumnarTranscript.from_utterances(
+        [
+            (0.0, 1.0, "A", "Hello."),
+            (1.0, 2.0, "A", "How are you?"),
+            (2.0, 3.0, "B", "Fine."),
+            (3.0, 4.0, "A", "Good."),
+            (4.0, 5.0, None, "Bye."),
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        AssemblyAISource(filepath=Path("tests/assembly_sample.json")),
+        AWSTranscribeSource(filepath=Path("tests/aws_transcribe_sample.json")),
+        DeepgramSource(filepath=Path("tests/deepgram_sample.json")),
+        DeepgramSource(filepath=Path("tests/deepgram_sample.json"), incremental=True),
+        RevSource(filepath=Path("tests/rev_sample.json")),
+        VTTSource(filepath=Path("tests/vtt_sample.vtt")),
+        VTTSource(filepath=Path("tests/vtt_sample.vtt"), parse=True),
+        SRTSource(filepath=Path("tests/srt_sample.srt")),
+        GenericSource(filepath=Path("tests/sample_1.txt")),
+        GenericSource(filepath=Path("tests/sample_1.json")),
+    ],
+)
+def test_from_source(source) -> None:
+    """Test all the transcript sources convert to a columnar transcript."""
+    transcript = ColumnarTranscript.from_source(source)
+
+    assert len(transcript) > 0
+    assert (transcript.speaker >= 0).all() or isinstance(source, SRTSource)
+    assert all(line.startswith("SPEAKER ") for line in transcript.to_lines()) or (
+        isinstance(source, SRTSource)
+    )
+    if source.source != "generic" or isinstance(
+        source, (AWSTranscribeSource, SRTSource, VTTSource)
+    ):
+        assert (transcript.start <= transcript.end).all()
+
+
+def test_from_source_formats() -> None:
+    """Test the conversions match the existing formatting."""
+    transcript = ColumnarTranscript.from_source(
+        DeepgramSource(filepath=Path("tests/deepgram_sample.json"))
+    )
+    with open("tests/deepgram_sample.json") as f:
+        expected = format_deepgram_source(json.load(f))
+    assert transcript.merge_speakers().to_lines() == expected
+
+    with open("tests/sample_1.txt") as f:
+        lines = f.read().splitlines()
+    transcript = ColumnarTranscript.from_source(InMemorySource(obj=lines))
+    assert transcript.to_lines() == lines
+    assert transcript.to_payload() == InMemorySource(obj=lines).prepare_payload()
+
+    vtt = ColumnarTranscript.from_vtt(
+        "WEBVTT\n\n1\n00:01.000 --> 01:00:02.500 align:start\n<v Ann>Hello\nthere.\n"
+    )
+    assert vtt.start.tolist() == [1.0] and vtt.end.tolist() == [3602.5]
+    assert vtt.to_lines() == ["SPEAKER Ann: Hello there."]
+
+    with pytest.raises(ValueError):
+        ColumnarTranscript.from_source(AudioSource(filepath=Path("tests/sample_1.mp3")))
+    with pytest.raises(ValueError, match="No utterances key found"):
+        ColumnarTranscript.from_deepgram({"results": {}})
+
+
+def test_merge_speakers(transcript: ColumnarTranscript) -> None:
+    """Test the consecutive utterances of a speaker are merged."""
+    merged = transcript.merge_speakers()
+
+    assert merged.to_lines() == [
+        "SPEAKER A: Hello. How are you?",
+        "SPEAKER B: Fine.",
+        "SPEAKER A: Good.",
+        "Bye.",
+    ]
+    assert merged.start.tolist() == [0.0, 2.0, 3.0, 4.0]
+    assert merged.end.tolist() == [2.0, 3.0, 4.0, 5.0]
+    assert merged.text is transcript.text
+    assert merged.to_payload() == dumps({"transcript": merged.to_lines()})
+
+
+def test_slice_time(transcript: ColumnarTranscript) -> None:
+    """Test the utterances overlapping a time range are selected."""
+    assert transcript.slice_time(1.5, 3.5).texts() == ["How are you?", "Fine.", "Good."]
+    assert transcript.slice_time(end=1.0).texts() == ["Hello."]
+    assert len(transcript.slice_time(10)) == 0
+    assert len(transcript.slice_time(10).merge_speakers()) == 0
+
+    # Utterances that are not consecutive in the text are not merged
+    selection = transcript._take(np.array([0, 3]))
+    assert selection.merge_speakers().texts() == ["Hello.", "Good."]
+    assert len(ColumnarTranscript.from_lines(["Hello."]).slice_time(0)) == 0
+
+
+@pytest.mark.parametrize(
+    "source",
+    [
+        AWSTranscribeSource(filepath=Path("tests/aws_transcribe_sample.json")),
+        VTTSource(filepath=Path("tests/vtt_sample.vtt"), parse=True),
+        SRTSource(filepath=Path("tests/srt_sample.srt")),
+    ],
+)
+def test_payload_without_numpy(source, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the payloads built in columns match the payloads built without NumPy."""
+    payload = source._build_payload()
+    assert payload == ColumnarTranscript.from_source(source).to_payload()
+
+    monkeypatch.setitem(sys.modules, "wordcab.core_objects.columnar", None)
+    assert source._build_payload() == payload
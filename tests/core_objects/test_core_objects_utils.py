@@ -14,15 +14,21 @@
 
 """Test suite for the core objects utils functions."""
 
+import io
+import json
 import textwrap
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, List, Optional, Union
 
 import pytest
 from wordcab.core_objects.utils import (
+    _extract_json_subtree,
     _get_assembly_utterances,
+    _get_aws_transcribe_utterances,
     _get_context_items,
     _get_deepgram_utterances,
     _get_rev_monologues,
+    _iter_subtitle_cues,
+    _load_json_stream,
     _textwrap,
 )
 
@@ -121,6 +127,58 @@ def test_get_assembly_utterances_missing_utterances() -> None:
         _get_assembly_utterances(assembly_json)
 
 
+def test_get_aws_transcribe_utterances_valid() -> None:
+    """Test that _get_aws_transcribe_utterances merges the items in speaker turns."""
+
+    def word(
+        content: str, start: float, speaker: Optional[str] = None
+    ) -> Dict[str, Any]:
+        item = {
+            "start_time": str(start),
+            "end_time": str(start + 0.5),
+            "alternatives": [{"content": content}],
+            "type": "pronunciation",
+        }
+        if speaker:
+            item["speaker_label"] = speaker
+        return item
+
+    comma = {"alternatives": [{"content": ","}], "type": "punctuation"}
+    items = [
+        word("Hello", 0, "spk_1"),
+        comma,
+        word("you", 1, "spk_1"),
+        word("Hi", 2, "spk_0"),
+        word("Bye", 3, "spk_1"),
+    ]
+    expected_output = [
+        (0.0, 1.5, "A", "Hello, you"),
+        (2.0, 2.5, "B", "Hi"),
+        (3.0, 3.5, "A", "Bye"),
+    ]
+    assert list(_get_aws_transcribe_utterances({"results": {"items": items}})) == (
+        expected_output
+    )
+
+    # Without speaker_label on the items, the speakers are read from the segments
+    segments = [
+        {"items": [{"start_time": str(i), "speaker_label": spk}]}
+        for i, spk in enumerate(["spk_1", "spk_1", "spk_0", "spk_1"])
+    ]
+    items = [word("Hello", 0), comma, word("you", 1), word("Hi", 2), word("Bye", 3)]
+    aws_json = {"items": items, "speaker_labels": {"segments": segments}}
+    assert list(_get_aws_transcribe_utterances(aws_json)) == expected_output
+
+
+def test_get_aws_transcribe_utterances_missing_items() -> None:
+    """Test that _get_aws_transcribe_utterances raises a ValueError without items."""
+    with pytest.raises(
+        ValueError,
+        match="No items key found. Verify the AWS Transcribe json file you are using.",
+    ):
+        list(_get_aws_transcribe_utterances({"results": {}}))
+
+
 def test_get_deepgram_utterances_valid() -> None:
     """Test that _get_deepgram_utterances returns the utterances from a valid Deepgram json file."""
     deepgram_json: Dict[str, Dict[str, List[Dict[str, Union[int, str]]]]] = {
@@ -176,3 +234,101 @@ def test_get_rev_monologues_missing_monologues() -> None:
         match="No monologues key found. Verify the Rev.ai json file you are using.",
     ):
         _get_rev_monologues(rev_json)
+
+
+def test_iter_subtitle_cues() -> None:
+    """Test that _iter_subtitle_cues parses the VTT and SRT cues in one pass."""
+    vtt = """WEBVTT
+
+NOTE a comment --> not a cue
+
+intro
+00:01.000 --> 01:00:02.500 align:start
+<v.loud Ann>Hello
+<b>there</b>.</v>
+
+00:00:03.000 --> 00:00:04.000
+SPEAKER B: Hi <00:00:03.500>you.
+"""
+    assert list(_iter_subtitle_cues(vtt.splitlines())) == [
+        (1.0, 3602.5, "Ann", "Hello there."),
+        (3.0, 4.0, "B", "Hi you."),
+    ]
+
+    srt = (
+        "1\n00:00:01,250 --> 00:00:02,000\na < b\n\n\n2\n00:00:02,000 --> 00:00:03,000"
+    )
+    assert list(_iter_subtitle_cues(iter(srt.splitlines()))) == [
+        (1.25, 2.0, None, "a < b"),
+        (2.0, 3.0, None, ""),
+    ]
+    assert list(_iter_subtitle_cues([])) == []
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_extract_json_subtree(chunk_size: int) -> None:
+    """Test that _extract_json_subtree returns the raw value at a path of keys."""
+    document = {
+        "metadata": {"words": [{"word": '}]\\"[{', "start": 1.5}], "k\u00e9y": None},
+        "results": {
+            "channels": [[], {"alternatives": [True, False, -1e3]}],
+            "utterances": [{"transcript": "Hello [world]."}, {"speaker": 1}],
+        },
+    }
+    for raw in (json.dumps(document), json.dumps(document, indent=2)):
+        f = io.BytesIO(raw.encode())
+        value = _extract_json_subtree(f, ("results", "utterances"), chunk_size)
+        assert json.loads(value) == document["results"]["utterances"]
+
+    f = io.BytesIO(json.dumps(document).encode())
+    assert _extract_json_subtree(f, ("results", "start"), chunk_size) is None
+    f = io.BytesIO(b'{"a": 1, "b": -2.5}')
+    assert _extract_json_subtree(f, ("b",), chunk_size) == b"-2.5"
+
+
+def test_extract_json_subtree_invalid() -> None:
+    """Test that _extract_json_subtree raises a ValueError on invalid documents."""
+    with pytest.raises(ValueError):
+        _extract_json_subtree(io.BytesIO(b"[1, 2]"), ("a",))
+    with pytest.raises(ValueError):
+        _extract_json_subtree(io.BytesIO(b'{"a": [1, 2'), ("b",))
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1024])
+def test_load_json_stream(chunk_size: int) -> None:
+    """Test that _load_json_stream converts the members item by item."""
+    document = {
+        "page_count": 2,
+        "results": [
+            {"id": i, "text": '}]\\"[{' * i, "tags": [[], {}]} for i in range(5)
+        ],
+        "summary": {"1": {"text": "Short."}, "3": {"text": "Longer [summary]."}},
+        "next": None,
+    }
+    member_parsers = {
+        "results": lambda item: item["id"],
+        "summary": lambda value: value["text"],
+        "missing": lambda value: value,
+    }
+    for raw in (json.dumps(document), json.dumps(document, indent=2)):
+        f = io.BytesIO(raw.encode())
+        assert _load_json_stream(f, member_parsers, chunk_size) == {
+            "page_count": 2,
+            "results": [0, 1, 2, 3, 4],
+            "summary": {"1": "Short.", "3": "Longer [summary]."},
+            "next": None,
+        }
+
+    f = io.BytesIO(b'{"results": null, "summary": []}')
+    assert _load_json_stream(f, member_parsers, chunk_size) == {
+        "results": None,
+        "summary": [],
+    }
+
+
+def test_load_json_stream_invalid() -> None:
+    """Test that _load_json_stream raises a ValueError on invalid documents."""
+    with pytest.raises(ValueError):
+        _load_json_stream(io.BytesIO(b"null"), {})
+    with pytest.raises(ValueError):
+        _load_json_stream(io.BytesIO(b'{"results": [1, 2'), {"results": int})
@@ -18,15 +18,18 @@ import json
 from pathlib import Path
 
 import pytest
+import requests
 from wordcab.config import AVAILABLE_AUDIO_FORMATS
 from wordcab.core_objects import (
     AssemblyAISource,
     AudioSource,
+    AWSTranscribeSource,
     BaseSource,
     DeepgramSource,
     GenericSource,
     InMemorySource,
     RevSource,
+    SRTSource,
     VTTSource,
     WordcabTranscriptSource,
 )
@@ -37,6 +40,11 @@ from wordcab.core_objects.utils import (
 )
 
 
+def _json_payload(obj) -> bytes:
+    """Serialize an object with the stdlib, in the compact UTF-8 payload format."""
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
 def test_available_audio_formats() -> None:
     """Test the AVAILABLE_AUDIO_FORMATS object."""
     assert AVAILABLE_AUDIO_FORMATS == [".flac", ".m4a", ".mp3", ".mpga", ".ogg", ".wav"]
@@ -114,7 +122,7 @@ def test_generic_source_with_filepath(tmp_path: Path) -> None:
     assert hasattr(generic_source, "prepare_payload") and callable(
         generic_source.prepare_payload
     )
-    assert generic_source.prepare_payload() == json.dumps(
+    assert generic_source.prepare_payload() == _json_payload(
         {"transcript": generic_source.file_object.decode("utf-8").splitlines()}
     )
     assert hasattr(generic_source, "prepare_headers") and callable(
@@ -136,7 +144,7 @@ def test_generic_source_with_filepath(tmp_path: Path) -> None:
     assert hasattr(generic_source, "prepare_payload") and callable(
         generic_source.prepare_payload
     )
-    assert generic_source.prepare_payload() == json.dumps(
+    assert generic_source.prepare_payload() == _json_payload(
         {"transcript": json.loads(generic_source.file_object)}
     )
     assert hasattr(generic_source, "prepare_headers") and callable(
@@ -177,7 +185,7 @@ def test_generic_source_with_url() -> None:
     assert hasattr(generic_source, "prepare_payload") and callable(
         generic_source.prepare_payload
     )
-    assert generic_source.prepare_payload() == json.dumps(
+    assert generic_source.prepare_payload() == _json_payload(
         {"transcript": generic_source.file_object.decode("utf-8").splitlines()}
     )
     assert hasattr(generic_source, "prepare_headers") and callable(
@@ -203,7 +211,7 @@ def test_generic_source_with_url() -> None:
     assert hasattr(generic_source, "prepare_payload") and callable(
         generic_source.prepare_payload
     )
-    assert generic_source.prepare_payload() == json.dumps(
+    assert generic_source.prepare_payload() == _json_payload(
         {"transcript": json.loads(generic_source.file_object)}
     )
     assert hasattr(generic_source, "prepare_headers") and callable(
@@ -242,6 +250,28 @@ def test_audio_source(tmp_path: Path) -> None:
     with pytest.raises(ValueError):
         AudioSource(filepath=Path(aac_path))
 
+    # Test stream is True
+    audio_source = AudioSource(filepath=Path(path), stream=True)
+    assert audio_source.source_type == "local"
+    assert audio_source.file_object is None
+    with open(path, "rb") as f:
+        assert b"".join(audio_source.prepare_stream()) == f.read()
+
+    with open(path, "rb") as f:
+        audio_source = AudioSource(fileobj=f)
+        assert audio_source.stream is True
+        assert audio_source._stem == "sample_1"
+        assert audio_source.prepare_stream().length == Path(path).stat().st_size
+
+    audio_source = AudioSource(fileobj=iter([b"abc"]), filename="live.wav")
+    assert audio_source._suffix == ".wav"
+    with pytest.raises(ValueError):
+        AudioSource(fileobj=iter([b"abc"]))
+    with pytest.raises(ValueError):
+        AudioSource(fileobj=iter([b"abc"]), filename="live.aac")
+    with pytest.raises(ValueError):
+        AudioSource(filepath=Path(path)).prepare_stream()
+
     # Test download is False
     url = "https://github.com/Wordcab/wordcab-python/blob/main/tests/sample_1.mp3?raw=true"
     headers = {"Accept": "application/json", "Content-Type": "application/json"}
@@ -302,6 +332,86 @@ def test_audio_source(tmp_path: Path) -> None:
     assert audio_source.prepare_headers() == {}
 
 
+def test_lazy_source(tmp_path: Path, monkeypatch) -> None:
+    """Test a lazy source only loads its content when needed."""
+    path = tmp_path / "sample.txt"
+    path.write_text("SPEAKER A: Hello.")
+
+    generic_source = GenericSource(filepath=path, lazy=True)
+    assert generic_source.file_object is None
+
+    generic_source.load()
+    assert generic_source.prepare_payload() == b'{"transcript":["SPEAKER A: Hello."]}'
+    generic_source.release()
+    assert generic_source.file_object is None
+    assert not hasattr(generic_source, "payload")
+
+    eager_source = GenericSource(filepath=path)
+    eager_source.release()
+    assert eager_source.file_object == b"SPEAKER A: Hello."
+
+    def fail(*args, **kwargs):
+        raise AssertionError("The file must not be downloaded.")
+
+    monkeypatch.setattr(requests, "get", fail)
+    deepgram_source = DeepgramSource(url="https://example.com/file.json", lazy=True)
+    assert deepgram_source.file_object is None
+
+    audio_source = AudioSource(url="https://example.com/file.mp3", lazy=True)
+    audio_source.load()
+    assert audio_source.file_object is None
+
+
+def test_payload_memoization(monkeypatch) -> None:
+    """Test the payload is built once per loaded content."""
+    deepgram_source = DeepgramSource(filepath=Path("tests/deepgram_sample.json"))
+    calls = []
+    build_payload = deepgram_source._build_payload
+
+    def counting_build_payload():
+        calls.append(1)
+        return build_payload()
+
+    monkeypatch.setattr(deepgram_source, "_build_payload", counting_build_payload)
+
+    payload = deepgram_source.prepare_payload()
+    assert deepgram_source.prepare_payload() is payload
+    assert len(calls) == 1
+
+    deepgram_source.file_object = deepgram_source.file_object + b" "
+    assert deepgram_source.prepare_payload() == payload
+    assert len(calls) == 2
+
+    headers = deepgram_source.prepare_headers()
+    headers["Authorization"] = "Bearer dummy_api_key"
+    assert "Authorization" not in deepgram_source.prepare_headers()
+
+
+@pytest.mark.parametrize(
+    "source_class, path",
+    [
+        (AssemblyAISource, "tests/assembly_sample.json"),
+        (DeepgramSource, "tests/deepgram_sample.json"),
+        (RevSource, "tests/rev_sample.json"),
+    ],
+)
+def test_incremental_source(source_class, path: str, tmp_path: Path) -> None:
+    """Test the incremental sources only read the utterances of the file."""
+    source = source_class(filepath=Path(path), incremental=True)
+    assert source.file_object is None
+
+    source.load()
+    assert source.file_object is None
+    assert (
+        source.prepare_payload() == source_class(filepath=Path(path)).prepare_payload()
+    )
+
+    empty_file = tmp_path / "empty.json"
+    empty_file.write_text('{"results": {}}')
+    with pytest.raises(ValueError, match="key found"):
+        source_class(filepath=empty_file, incremental=True).prepare_payload()
+
+
 def test_in_memory_source() -> None:
     """Test the InMemorySource object."""
     with pytest.raises(TypeError):
@@ -318,7 +428,7 @@ def test_in_memory_source() -> None:
     assert hasattr(in_memory_source, "prepare_payload") and callable(
         in_memory_source.prepare_payload
     )
-    assert in_memory_source.prepare_payload() == json.dumps({"transcript": ["test"]})
+    assert in_memory_source.prepare_payload() == _json_payload({"transcript": ["test"]})
     assert hasattr(in_memory_source, "prepare_headers") and callable(
         in_memory_source.prepare_headers
     )
@@ -351,7 +461,7 @@ def test_rev_source() -> None:
     assert hasattr(rev_source, "prepare_payload") and callable(
         rev_source.prepare_payload
     )
-    assert rev_source.prepare_payload() == json.dumps(
+    assert rev_source.prepare_payload() == _json_payload(
         _get_rev_monologues(json.loads(rev_source.file_object))
     )
     assert hasattr(rev_source, "prepare_headers") and callable(
@@ -386,6 +496,69 @@ def test_vtt_source() -> None:
     }
 
 
+def test_parsed_vtt_source() -> None:
+    """Test the VTTSource object parsing its cues."""
+    vtt_source = VTTSource(filepath=Path("tests/vtt_sample.vtt"), parse=True)
+
+    assert vtt_source.source == "generic"
+    assert vtt_source.file_object is None
+    utterances = list(vtt_source.iter_utterances())
+    assert utterances[0] == (
+        0.0,
+        5.0,
+        "A",
+        "Thank you for calling Marcus Flores. How may I assist you?",
+    )
+    assert vtt_source.prepare_payload() == _json_payload(
+        {"transcript": [f"SPEAKER {utt[2]}: {utt[3]}" for utt in utterances]}
+    )
+    assert vtt_source.prepare_headers() == {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    remote_source = VTTSource(url="https://example.com/files/sample.vtt?v=1", lazy=True)
+    assert remote_source.prepare_headers() == {
+        "Content-Disposition": "attachment; filename=sample.vtt",
+    }
+
+
+def test_srt_source() -> None:
+    """Test the SRTSource object."""
+    srt_source = SRTSource(filepath=Path("tests/srt_sample.srt"))
+
+    assert srt_source.source == "generic"
+    assert srt_source.source_type == "local"
+    assert srt_source.file_object is None
+    assert list(srt_source.iter_utterances()) == [
+        (
+            0.0,
+            5.0,
+            "Agent",
+            "Thank you for calling Marcus Flores. How may I assist you?",
+        ),
+        (5.0, 9.5, "B", "Hello. I'd like to order flowers."),
+        (9.5, 14.0, None, "I'll be happy to take care of your order."),
+    ]
+    assert srt_source.prepare_payload() == _json_payload(
+        {
+            "transcript": [
+                "SPEAKER Agent: Thank you for calling Marcus Flores. How may I assist"
+                " you?",
+                "SPEAKER B: Hello. I'd like to order flowers.",
+                "I'll be happy to take care of your order.",
+            ]
+        }
+    )
+    assert srt_source.prepare_headers() == {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    with pytest.raises(ValueError):
+        SRTSource(filepath=Path("tests/vtt_sample.vtt"))
+
+
 def test_assembly_ai_source() -> None:
     """Test the AssemblySource object."""
     path = "tests/assembly_sample.json"
@@ -398,7 +571,7 @@ def test_assembly_ai_source() -> None:
     assert a_source._suffix == Path(path).suffix
     assert a_source.file_object is not None
     assert hasattr(a_source, "prepare_payload") and callable(a_source.prepare_payload)
-    assert a_source.prepare_payload() == json.dumps(
+    assert a_source.prepare_payload() == _json_payload(
         _get_assembly_utterances(json.loads(a_source.file_object))
     )
     assert hasattr(a_source, "prepare_headers") and callable(a_source.prepare_headers)
@@ -420,7 +593,7 @@ def test_deepgram_source() -> None:
     assert dg_source._suffix == Path(path).suffix
     assert dg_source.file_object is not None
     assert hasattr(dg_source, "prepare_payload") and callable(dg_source.prepare_payload)
-    assert dg_source.prepare_payload() == json.dumps(
+    assert dg_source.prepare_payload() == _json_payload(
         _get_deepgram_utterances(json.loads(dg_source.file_object))
     )
     assert hasattr(dg_source, "prepare_headers") and callable(dg_source.prepare_headers)
@@ -428,3 +601,31 @@ def test_deepgram_source() -> None:
         "Accept": "application/json",
         "Content-Type": "application/json",
     }
+
+
+def test_aws_transcribe_source() -> None:
+    """Test the AWSTranscribeSource object."""
+    path = "tests/aws_transcribe_sample.json"
+    aws_source = AWSTranscribeSource(filepath=Path(path))
+
+    assert aws_source.source == "generic"
+    assert aws_source.source_type == "local"
+    assert aws_source.file_object is not None
+    assert aws_source.prepare_payload() == _json_payload(
+        {
+            "transcript": [
+                "SPEAKER A: Hello, and welcome to the call.",
+                "SPEAKER B: Thanks for having me.",
+                "SPEAKER A: Let's get started with the agenda.",
+                "SPEAKER B: Sure, first item is the budget.",
+                "SPEAKER C: I have a question about that.",
+            ]
+        }
+    )
+    assert aws_source.prepare_headers() == {
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+
+    with pytest.raises(ValueError):
+        AWSTranscribeSource(filepath=Path("tests/sample_1.txt"))
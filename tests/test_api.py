@@ -0,0 +1,104 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the api.py mapping functions."""
+
+import threading
+
+import pytest
+import responses
+from wordcab import api
+from wordcab.client import Client
+
+
+@pytest.fixture(autouse=True)
+def reset_default_clients():
+    """Start and end every test without any shared client."""
+    api.close_default_clients()
+    yield
+    api.close_default_clients()
+
+
+def test_default_client_is_shared() -> None:
+    """Test the same client is returned for the same API key."""
+    client = api._get_default_client("key_1")
+    assert isinstance(client, Client)
+    assert api._get_default_client("key_1") is client
+    assert api._get_default_client("key_2") is not client
+
+
+def test_default_client_thread_safe() -> None:
+    """Test concurrent first calls create a single client."""
+    clients = []
+    barrier = threading.Barrier(8)
+
+    def worker() -> None:
+        barrier.wait()
+        clients.append(api._get_default_client("key_1"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 8
+    assert all(client is clients[0] for client in clients)
+
+
+def test_default_client_reads_token_once(monkeypatch) -> None:
+    """Test the token is resolved only when the shared client is created."""
+    calls = []
+
+    def fake_get_token() -> str:
+        calls.append(True)
+        return "token_from_disk"
+
+    monkeypatch.setattr("wordcab.client.get_token", fake_get_token)
+    client = api._get_default_client()
+    assert client.api_key == "token_from_disk"
+    api._get_default_client()
+    api._get_default_client()
+    assert len(calls) == 1
+
+
+def test_close_default_clients() -> None:
+    """Test closing the shared clients resets them."""
+    client = api._get_default_client("key_1")
+    api.close_default_clients()
+    assert api._get_default_client("key_1") is not client
+
+
+def test_functions_reuse_default_client(mock_server) -> None:
+    """Test the module-level functions go through the shared client."""
+    mock_server.add(
+        responses.DELETE,
+        "https://wordcab.com/api/v1/jobs/job_1",
+        json={"job_name": "job_1"},
+        status=200,
+    )
+    mock_server.add(
+        responses.DELETE,
+        "https://wordcab.com/api/v1/jobs/job_2",
+        json={"job_name": "job_2"},
+        status=200,
+    )
+    assert api.delete_job("job_1", warning=False, api_key="key_1") == {
+        "job_name": "job_1"
+    }
+    client = api._default_clients["key_1"]
+    assert api.delete_job("job_2", warning=False, api_key="key_1") == {
+        "job_name": "job_2"
+    }
+    assert api._default_clients["key_1"] is client
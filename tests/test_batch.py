@@ -0,0 +1,131 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the bulk submission."""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
+
+import pytest
+from wordcab.batch import Batch, BatchProgress
+from wordcab.core_objects import InMemorySource
+
+
+class _FakeSubmitter:
+    """Submit function resolving the futures in a pool of threads."""
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(max_workers=8)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def _run(self, source_object: InMemorySource, delay: float, fail: bool) -> str:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(delay)
+        with self.lock:
+            self.running -= 1
+        if fail:
+            raise ValueError("Invalid source.")
+        return source_object.obj["transcript"][0]
+
+    def __call__(self, source_object: InMemorySource, **params: Any) -> Future:
+        if params.get("reject"):
+            raise ValueError("Rejected.")
+        return self.executor.submit(
+            self._run, source_object, params["delay"], params.get("fail", False)
+        )
+
+
+def _items(
+    count: int, pulled: List[int], **params: Any
+) -> Iterator[Tuple[InMemorySource, Dict[str, Any]]]:
+    """Generate the items of a batch, recording how many were read."""
+    for i in range(count):
+        pulled.append(i)
+        source = InMemorySource(obj={"transcript": [f"SPEAKER A: {i}."]})
+        yield source, {"delay": 0.02 * (count - i), **params}
+
+
+def test_batch_completion_order() -> None:
+    """Test the results are yielded as they complete, with bounded concurrency."""
+    submitter, pulled = _FakeSubmitter(), []
+    batch = Batch(submitter, _items(12, pulled), max_in_flight=4)
+    assert batch.progress == BatchProgress()
+
+    results = []
+    for result in batch:
+        assert len(pulled) <= len(results) + 4
+        results.append(result)
+
+    assert sorted(result.index for result in results) == list(range(12))
+    assert [result.index for result in results[:4]] == [3, 2, 1, 0]
+    assert all(result.ok for result in results)
+    assert results[0].result == "SPEAKER A: 3."
+    assert submitter.max_running <= 4
+
+    progress = batch.progress
+    assert (progress.submitted, progress.succeeded, progress.failed) == (12, 12, 0)
+    assert progress.in_flight == 0
+    assert progress.throughput == pytest.approx(12 / progress.elapsed)
+    assert batch.progress.elapsed == progress.elapsed
+
+
+def test_batch_failures() -> None:
+    """Test the failures are recorded without stopping the batch."""
+    items = [
+        (InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]}), params)
+        for params in (
+            {"delay": 0},
+            {"delay": 0, "fail": True},
+            {"delay": 0, "reject": True},
+            {"delay": 0},
+        )
+    ]
+
+    results = sorted(Batch(_FakeSubmitter(), items), key=lambda r: r.index)
+
+    assert [result.ok for result in results] == [True, False, False, True]
+    assert str(results[1].error) == "Invalid source."
+    assert str(results[2].error) == "Rejected."
+    assert results[2].params == {"delay": 0, "reject": True}
+
+
+def test_batch_stop_iteration() -> None:
+    """Test stopping the iteration cancels the items in flight."""
+    pending: List[Future] = []
+
+    def submit(source_object: InMemorySource, **params: Any) -> Future:
+        future: Future = Future()
+        if not pending:
+            future.set_result("first")
+        pending.append(future)
+        return future
+
+    batch = Batch(submit, _items(100, []), max_in_flight=3)
+    for result in batch:
+        assert result.result == "first"
+        break
+    batch_iterator = iter(batch)
+
+    assert len(pending) == 3
+    assert all(future.cancelled() for future in pending[1:])
+    with pytest.raises(ValueError):
+        next(batch_iterator)
+    with pytest.raises(ValueError):
+        Batch(submit, [], max_in_flight=0)
@@ -0,0 +1,149 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the local transcript cache."""
+
+from pathlib import Path
+
+import pytest
+import responses
+from wordcab.cache import TranscriptCache, hash_source
+from wordcab.client import Client
+from wordcab.core_objects import (
+    AudioSource,
+    GenericSource,
+    InMemorySource,
+    SummarizeJob,
+    WordcabTranscriptSource,
+)
+
+
+@pytest.fixture
+def cache() -> TranscriptCache:
+    """Fixture for an in-memory transcript cache."""
+    cache = TranscriptCache(":memory:")
+    yield cache
+    cache.close()
+
+
+def _job(job_name: str, job_status: str, transcript_id=None) -> SummarizeJob:
+    """Build a retrieved Summary job."""
+    return SummarizeJob(
+        display_name="test",
+        job_name=job_name,
+        source="audio",
+        job_status=job_status,
+        transcript_id=transcript_id,
+    )
+
+
+def test_hash_source() -> None:
+    """Test the content hashes of the sources."""
+    audio = AudioSource(filepath=Path("tests/sample_1.mp3"))
+    streamed = AudioSource(filepath=Path("tests/sample_1.mp3"), stream=True)
+    lazy = AudioSource(filepath=Path("tests/sample_1.mp3"), lazy=True)
+
+    assert hash_source(audio) == hash_source(streamed) == hash_source(lazy)
+    assert lazy.file_object is None
+
+    generic = GenericSource(filepath=Path("tests/sample_1.txt"))
+    in_memory = InMemorySource(obj=["SPEAKER A: Hello.", "SPEAKER B: Hi."])
+    lazy_generic = GenericSource(filepath=Path("tests/sample_1.txt"), lazy=True)
+    assert hash_source(generic) != hash_source(audio)
+    assert hash_source(lazy_generic) == hash_source(generic)
+    assert lazy_generic.file_object is None and "payload" not in vars(lazy_generic)
+    assert generic.file_object is not None
+    assert hash_source(in_memory) == hash_source(
+        InMemorySource(obj=["SPEAKER A: Hello.", "SPEAKER B: Hi."])
+    )
+    assert hash_source(in_memory) != hash_source(InMemorySource(obj=["Hello."]))
+
+    with open("tests/sample_1.mp3", "rb") as f:
+        assert hash_source(AudioSource(fileobj=f)) is None
+    assert hash_source(WordcabTranscriptSource(transcript_id="transcript_1")) is None
+
+
+def test_record_job(cache: TranscriptCache) -> None:
+    """Test that only the finished pending jobs are cached."""
+    cache.add_pending("job_1", "hash_1")
+    cache.add_pending("job_2", "hash_2")
+
+    cache.record_job(_job("job_1", "Pending"))
+    assert cache.lookup("hash_1") is None
+
+    cache.record_job(_job("job_1", "SummaryComplete", "transcript_1"))
+    cache.record_job(_job("job_2", "Error", "transcript_2"))
+    cache.record_job(_job("job_3", "SummaryComplete", "transcript_3"))
+    assert cache.lookup("hash_1") == "transcript_1"
+    assert cache.lookup("hash_2") is None
+
+    cache.clear()
+    assert cache.lookup("hash_1") is None
+
+
+def test_persistence(tmp_path: Path) -> None:
+    """Test that the cache is persisted to the database file."""
+    path = tmp_path / "cache" / "transcripts.sqlite"
+    cache = TranscriptCache(path)
+    cache.store("hash_1", "transcript_1")
+    cache.close()
+
+    cache = TranscriptCache(path)
+    assert cache.lookup("hash_1") == "transcript_1"
+    cache.close()
+
+
+def test_client_deduplication(
+    mock_server: responses.RequestsMock, cache: TranscriptCache
+) -> None:
+    """Test that a source already transcribed is summarized from its transcript."""
+    client = Client(api_key="dummy_api_key", transcript_cache=cache)
+    mock_server.add(
+        responses.POST,
+        "https://wordcab.com/api/v1/summarize",
+        json={"job_name": "job_1"},
+        status=201,
+    )
+    mock_server.add(
+        responses.GET,
+        "https://wordcab.com/api/v1/jobs/job_1",
+        json={
+            "job_name": "job_1",
+            "job_status": "SummaryComplete",
+            "display_name": "test",
+            "source": "audio",
+            "transcript_id": "audio_transcript_1",
+            "summary_details": {},
+        },
+    )
+    mock_server.add(
+        responses.POST,
+        "https://wordcab.com/api/v1/summarize",
+        json={"job_name": "job_2"},
+        status=201,
+    )
+
+    job = client.start_summary(
+        AudioSource(filepath=Path("tests/sample_1.mp3")), "test", "brief"
+    )
+    assert job.source == "audio"
+    client.retrieve_job(job.job_name)
+
+    job = client.start_summary(
+        AudioSource(filepath=Path("tests/sample_1.mp3")), "test", "narrative"
+    )
+    assert job.source == "wordcab_transcript"
+    request = mock_server.calls[-1].request
+    assert "transcript_id=audio_transcript_1" in request.url
+    assert request.body is None
@@ -0,0 +1,147 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the adaptive concurrency limiter."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+from wordcab import Client
+from wordcab.concurrency import AdaptiveConcurrencyLimiter
+from wordcab.core_objects import WordcabTranscriptSource
+
+
+def test_limiter_validation() -> None:
+    """Test the limiter arguments are validated."""
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(decrease_factor=1)
+    with pytest.raises(ValueError):
+        AdaptiveConcurrencyLimiter(latency_threshold=0.5)
+
+
+def test_limiter_additive_increase() -> None:
+    """Test the limit grows by about one per window of successful requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+
+    for _ in range(4):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+
+    assert limiter.limit == 3
+    assert limiter.latency == pytest.approx(0.1)
+    assert limiter.in_flight == 0
+
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.limit == 3
+
+
+def test_limiter_multiplicative_decrease() -> None:
+    """Test the limit is cut on overload and on latency spikes."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+    limiter.acquire()
+    limiter.release(overloaded=True)
+    assert limiter.limit == 8
+
+    limiter.acquire()
+    limiter.release(latency=0.01)
+    time.sleep(0.02)
+    limiter.acquire()
+    limiter.release(latency=1.0)
+    assert limiter.limit == 4
+
+    time.sleep(limiter.latency)
+    for _ in range(10):
+        limiter.acquire()
+        limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+
+def test_limiter_bounds_threads() -> None:
+    """Test the number of concurrent threads never exceeds the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    lock = threading.Lock()
+    active, peak = [0], [0]
+
+    def task() -> None:
+        limiter.acquire()
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        limiter.release(latency=0.01)
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(lambda _: task(), range(30)))
+
+    assert peak[0] == 3
+
+
+def test_limiter_bounds_coroutines() -> None:
+    """Test the number of concurrent coroutines never exceeds the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    active, peak = [0], [0]
+
+    async def task() -> None:
+        await limiter.acquire_async()
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        limiter.release(latency=0.01)
+
+    async def main() -> None:
+        await asyncio.gather(*[task() for _ in range(10)])
+
+    asyncio.run(main())
+    assert peak[0] == 2
+
+
+def test_client_concurrency_limiter(mock_server) -> None:
+    """Test the job submissions go through the limiter and report the API load."""
+    mock_server.add(
+        responses.POST,
+        "https://wordcab.com/api/v1/extract",
+        json={"job_name": "job_12345"},
+        status=201,
+    )
+    mock_server.add(
+        responses.DELETE,
+        "https://wordcab.com/api/v1/jobs/job_12345",
+        json={"job_name": "job_12345"},
+        status=200,
+    )
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+
+    with Client(api_key="dummy_api_key", concurrency_limiter=limiter) as client:
+        client.start_extract(
+            source_object=WordcabTranscriptSource(transcript_id="transcript_123"),
+            display_name="test",
+        )
+        assert limiter.latency is not None
+        assert limiter.limit == 2
+
+        client.delete_job("job_12345", warning=False)
+        assert limiter.limit == 2
+        assert limiter.in_flight == 0
@@ -24,7 +24,13 @@ from wordcab.config import (
     EXTRACT_AVAILABLE_STATUS,
     EXTRACT_PIPELINES,
     LIST_JOBS_ORDER_BY,
+    POOL_CONNECTIONS,
+    POOL_MAXSIZE,
     REQUEST_TIMEOUT,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_METHODS,
+    RETRY_STATUS_CODES,
     SOURCE_LANG,
     SOURCE_OBJECT_MAPPING,
     SUMMARIZE_AVAILABLE_STATUS,
@@ -120,6 +126,14 @@ def test_list_jobs_order_by() -> None:
     ]
 
 
+def test_pool_sizes() -> None:
+    """Test the POOL_CONNECTIONS and POOL_MAXSIZE constants."""
+    assert isinstance(POOL_CONNECTIONS, int)
+    assert POOL_CONNECTIONS > 0
+    assert isinstance(POOL_MAXSIZE, int)
+    assert POOL_MAXSIZE > 0
+
+
 def test_request_timeout() -> None:
     """Test the REQUEST_TIMEOUT constant."""
     assert isinstance(REQUEST_TIMEOUT, int)
@@ -127,6 +141,14 @@ def test_request_timeout() -> None:
     assert REQUEST_TIMEOUT == 30
 
 
+def test_retry_settings() -> None:
+    """Test the RETRY_* constants."""
+    assert RETRY_MAX_ATTEMPTS >= 1
+    assert RETRY_BASE_DELAY > 0
+    assert "POST" not in RETRY_METHODS
+    assert RETRY_STATUS_CODES == [429, 502, 503, 504]
+
+
 def test_source_lang() -> None:
     """Test the SOURCE_LANG constant."""
     assert isinstance(SOURCE_LANG, list)
@@ -0,0 +1,89 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the local job journal."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from wordcab.core_objects import InMemorySource, YoutubeSource
+from wordcab.journal import JobJournal, hash_item
+
+
+def _count_rows(path: Path) -> int:
+    """Count the rows written to a journal, from another connection."""
+    connection = sqlite3.connect(str(path))
+    try:
+        return connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def test_journal_buffered_writes(tmp_path: Path) -> None:
+    """Test the records are buffered until the flush size is reached."""
+    path = tmp_path / "journal.sqlite"
+    journal = JobJournal(path, flush_size=3, flush_interval=60)
+    assert journal._connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    journal.record("item_1", "started", "job_1")
+    journal.record("item_2", "started", "job_2")
+    assert journal.lookup("item_1") == ("started", "job_1")
+    assert _count_rows(path) == 0
+
+    journal.record("item_3", "failed")
+    assert _count_rows(path) == 3
+
+    journal.record("item_1", "completed")
+    assert journal.lookup("item_1") == ("completed", "job_1")
+    journal.close()
+
+    journal = JobJournal(path)
+    assert journal.lookup("item_1") == ("completed", "job_1")
+    assert journal.lookup("item_3") == ("failed", None)
+    assert journal.lookup("item_4") is None
+    journal.clear()
+    assert journal.lookup("item_1") is None
+    journal.close()
+
+
+def test_journal_validation() -> None:
+    """Test the arguments of the journal are validated."""
+    with pytest.raises(ValueError):
+        JobJournal(":memory:", flush_size=0)
+    with pytest.raises(ValueError):
+        JobJournal(":memory:", flush_interval=0)
+    with JobJournal(":memory:") as journal:
+        with pytest.raises(ValueError):
+            journal.record("item_1", "invalid")
+
+
+def test_hash_item() -> None:
+    """Test the items are hashed from their content and parameters."""
+    source = InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]})
+    same_source = InMemorySource(obj={"transcript": ["SPEAKER A: Hi."]})
+    youtube_source = YoutubeSource(url="https://youtu.be/dQw4w9WgXcQ")
+
+    assert hash_item(source, {"display_name": "a"}) == hash_item(
+        same_source, {"display_name": "a"}
+    )
+    assert hash_item(source, {"display_name": "a"}) != hash_item(
+        source, {"display_name": "b"}
+    )
+    assert hash_item(youtube_source, {}) == hash_item(
+        YoutubeSource(url="https://youtu.be/dQw4w9WgXcQ"), {}
+    )
+    assert hash_item(youtube_source, {}) != hash_item(
+        YoutubeSource(url="https://youtu.be/12345"), {}
+    )
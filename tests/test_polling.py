@@ -0,0 +1,142 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the job polling policy."""
+
+import time
+
+import pytest
+from wordcab.config import (
+    EXTRACT_AVAILABLE_STATUS,
+    SUMMARIZE_AVAILABLE_STATUS,
+)
+from wordcab.core_objects import ExtractJob, SummarizeJob
+from wordcab.polling import (
+    FAILED_STATUS,
+    STATUS_PROGRESSIONS,
+    JobWaiter,
+    PollingPolicy,
+    is_finished,
+)
+
+
+def _summarize_job(status: str, audio_duration: int = 0) -> SummarizeJob:
+    """Build a summary job in the given status."""
+    return SummarizeJob(
+        display_name="test",
+        job_name="job_12345",
+        source="audio",
+        job_status=status,
+        audio_duration=audio_duration,
+    )
+
+
+def test_status_progressions() -> None:
+    """Test the progressions cover all the statuses of the jobs."""
+    assert set(STATUS_PROGRESSIONS["SummarizeJob"]) | set(FAILED_STATUS) == set(
+        SUMMARIZE_AVAILABLE_STATUS
+    )
+    assert set(STATUS_PROGRESSIONS["ExtractJob"]) | set(FAILED_STATUS) == set(
+        EXTRACT_AVAILABLE_STATUS
+    )
+    assert STATUS_PROGRESSIONS["TranscribeJob"][-1] == "TranscriptComplete"
+
+
+def test_polling_policy_validation() -> None:
+    """Test the policy arguments are validated."""
+    with pytest.raises(ValueError):
+        PollingPolicy(min_interval=-1)
+    with pytest.raises(ValueError):
+        PollingPolicy(min_interval=10, max_interval=5)
+    with pytest.raises(ValueError):
+        PollingPolicy(backoff_factor=0.5)
+    with pytest.raises(ValueError):
+        PollingPolicy(processing_ratio=-0.1)
+
+
+def test_next_delay_backoff() -> None:
+    """Test the delay grows while the status doesn't change and is capped."""
+    policy = PollingPolicy(min_interval=1, max_interval=5, backoff_factor=2)
+    job = _summarize_job("Summarizing")
+
+    assert [policy.next_delay(job, polls) for polls in range(5)] == [1, 2, 4, 5, 5]
+
+
+def test_next_delay_audio_duration() -> None:
+    """Test the long recordings are polled less often at the early statuses."""
+    policy = PollingPolicy(min_interval=1, max_interval=600, processing_ratio=0.2)
+
+    assert policy.expected_remaining(_summarize_job("Pending", 3600)) == 720
+    assert policy.next_delay(_summarize_job("Pending", 3600), 0) == 180
+    assert policy.next_delay(_summarize_job("Summarizing", 3600), 0) < 60
+    assert policy.next_delay(_summarize_job("Transcribing"), 0) == 1
+
+
+def test_is_finished() -> None:
+    """Test the last status of each type of job."""
+    assert is_finished(_summarize_job("SummaryComplete"))
+    assert is_finished(_summarize_job("Error"))
+    assert not is_finished(_summarize_job("TranscriptComplete"))
+    assert is_finished(_summarize_job("TranscriptComplete"), "TranscribeJob")
+
+    extract_job = ExtractJob(
+        display_name="test", job_name="job_12345", source="generic"
+    )
+    for status, finished in [
+        ("Extracting", False),
+        ("ExtractionComplete", True),
+        ("TranscriptComplete", True),
+    ]:
+        extract_job.job_status = status
+        assert is_finished(extract_job) is finished
+    assert not is_finished(extract_job, "ExtractJob")
+
+
+def test_job_waiter() -> None:
+    """Test the waiter schedules the polls of the pending jobs."""
+    waiter = JobWaiter(["job_12345"], PollingPolicy(min_interval=10))
+    assert waiter.delay() == 0
+    assert waiter.due_jobs() == ["job_12345"]
+
+    assert not waiter.update(_summarize_job("Summarizing"))
+    assert waiter.due_jobs() == []
+    assert 9 < waiter.delay() <= 10
+    assert waiter.scan([_summarize_job("SummaryComplete")]) == [
+        _summarize_job("SummaryComplete")
+    ]
+    assert waiter.pending == []
+
+
+def test_job_waiter_backoff() -> None:
+    """Test the failed polls delay the next polls more and more."""
+    policy = PollingPolicy(min_interval=10, max_interval=30, backoff_factor=2)
+    waiter = JobWaiter(["job_12345"], policy)
+    assert [policy.backoff_delay(polls) for polls in range(3)] == [10, 20, 30]
+
+    waiter.backoff("job_12345")
+    assert 9 < waiter.delay() <= 10
+    waiter.backoff("job_12345")
+    assert 19 < waiter.delay() <= 20
+    assert waiter.pending == ["job_12345"]
+
+
+def test_job_waiter_timeout() -> None:
+    """Test the waiter raises a TimeoutError at the deadline."""
+    waiter = JobWaiter(["job_12345"], PollingPolicy(), timeout=0.01)
+    waiter.update(_summarize_job("Summarizing"))
+    assert waiter.delay() <= 0.01
+
+    time.sleep(0.02)
+    with pytest.raises(TimeoutError):
+        waiter.delay()
@@ -0,0 +1,104 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the client-side rate limiter."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+import responses
+from wordcab import Client
+from wordcab.rate_limit import RateLimiter, TokenBucket
+
+
+def test_token_bucket_validation() -> None:
+    """Test the bucket arguments are validated."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0.5)
+
+
+def test_token_bucket_spacing() -> None:
+    """Test the reservations beyond the burst are spaced at 1 / rate."""
+    bucket = TokenBucket(rate=10, burst=2)
+
+    delays = [bucket.reserve() for _ in range(5)]
+
+    assert delays[:2] == [0, 0]
+    assert delays[2:] == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+
+
+def test_rate_limiter_budgets() -> None:
+    """Test the endpoint budgets apply on top of the global budget."""
+    limiter = RateLimiter(rate=100, endpoint_rates={"start_summary": 10})
+
+    assert limiter.reserve("start_summary") == 0
+    assert limiter.reserve("start_summary") == pytest.approx(0.1, abs=0.01)
+    assert limiter.reserve("list_jobs") == pytest.approx(0.02, abs=0.01)
+    assert RateLimiter().reserve("list_jobs") == 0
+
+
+def test_rate_limiter_threads() -> None:
+    """Test a limiter shared by threads keeps the total rate under the budget."""
+    limiter = RateLimiter(rate=50)
+    sent = []
+
+    def worker() -> None:
+        for _ in range(5):
+            limiter.acquire("retrieve_job")
+            sent.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sent) == 20
+    assert max(sent) - min(sent) >= 19 / 50 - 0.02
+
+
+def test_rate_limiter_coroutines() -> None:
+    """Test a limiter shared by coroutines doesn't block the event loop."""
+    limiter = RateLimiter(rate=50)
+
+    async def main() -> float:
+        start = time.monotonic()
+        await asyncio.gather(
+            *[limiter.acquire_async("retrieve_job") for _ in range(10)]
+        )
+        return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 9 / 50 - 0.02
+
+
+def test_client_rate_limiter(mock_server) -> None:
+    """Test the client waits for the limiter before every request."""
+    mock_server.add(
+        responses.DELETE,
+        "https://wordcab.com/api/v1/jobs/job_1",
+        json={"job_name": "job_1"},
+        status=200,
+    )
+    limiter = RateLimiter(endpoint_rates={"delete_job": 20})
+
+    with Client(api_key="dummy_api_key", rate_limiter=limiter) as client:
+        start = time.monotonic()
+        for _ in range(3):
+            client.delete_job("job_1", warning=False)
+
+    assert time.monotonic() - start >= 2 / 20 - 0.01
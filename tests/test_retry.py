@@ -0,0 +1,99 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the retry policy."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from wordcab.retry import RetryPolicy, _parse_retry_after
+
+
+def test_retry_policy_validation() -> None:
+    """Test the policy arguments are validated."""
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(base_delay=-1)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+
+    assert RetryPolicy(retry_methods=("get",)).retry_methods == ("GET",)
+
+
+def test_next_delay_backoff() -> None:
+    """Test the delay doubles after each attempt and is capped."""
+    policy = RetryPolicy(max_attempts=10, base_delay=1, max_delay=5, jitter=0)
+
+    delays = [
+        policy.next_delay("GET", attempt, status_code=503) for attempt in (1, 2, 3, 4)
+    ]
+    assert delays == [1, 2, 4, 5]
+
+
+def test_next_delay_jitter() -> None:
+    """Test the jitter only shortens the delay."""
+    policy = RetryPolicy(base_delay=2, jitter=0.5)
+
+    for _ in range(100):
+        assert 1 <= policy.next_delay("GET", 1, status_code=429) <= 2
+
+
+def test_next_delay_no_retry() -> None:
+    """Test the failures that must not be retried."""
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.next_delay("GET", 3, status_code=503) is None
+    assert policy.next_delay("POST", 1, status_code=503) is None
+    assert policy.next_delay("POST", 1, status_code=503, idempotent=True) is not None
+    assert policy.next_delay("POST", 1, status_code=404, idempotent=True) is None
+    unkeyed_policy = RetryPolicy(retry_idempotency_keys=False)
+    assert (
+        unkeyed_policy.next_delay("POST", 1, status_code=503, idempotent=True) is None
+    )
+    assert policy.next_delay("GET", 1, status_code=404) is None
+    assert policy.next_delay("GET", 1, connection_error=True) is not None
+    assert (
+        RetryPolicy(retry_connection_errors=False).next_delay(
+            "GET", 1, connection_error=True
+        )
+        is None
+    )
+
+
+def test_next_delay_retry_after() -> None:
+    """Test the Retry-After header replaces the backoff."""
+    policy = RetryPolicy(max_delay=10, jitter=0)
+
+    assert policy.next_delay("GET", 1, status_code=429, retry_after="7") == 7
+    assert policy.next_delay("GET", 1, status_code=429, retry_after="120") == 10
+    assert policy.next_delay("GET", 1, status_code=429, retry_after="soon") == 0.5
+    assert (
+        RetryPolicy(respect_retry_after=False, jitter=0).next_delay(
+            "GET", 1, status_code=429, retry_after="7"
+        )
+        == 0.5
+    )
+
+
+def test_parse_retry_after() -> None:
+    """Test the Retry-After header parsing."""
+    assert _parse_retry_after("3") == 3
+    assert _parse_retry_after("-3") == 0
+    assert _parse_retry_after("invalid") is None
+
+    date = datetime.now(timezone.utc) + timedelta(seconds=60)
+    assert 50 < _parse_retry_after(format_datetime(date, usegmt=True)) <= 60
+    assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
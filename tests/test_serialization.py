@@ -0,0 +1,89 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the JSON serialization backends."""
+
+import json
+
+import pytest
+from wordcab import serialization
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "tests/assembly_sample.json",
+        "tests/deepgram_sample.json",
+        "tests/rev_sample.json",
+        "tests/sample_1.json",
+    ],
+)
+def test_backends_output(path: str, monkeypatch) -> None:
+    """Test the backends produce the same JSON."""
+    with open(path, "rb") as f:
+        content = f.read()
+
+    obj = serialization.loads(content)
+    assert obj == json.loads(content)
+    payload = serialization.dumps(obj)
+
+    monkeypatch.setattr(serialization, "orjson", None)
+    assert serialization.loads(content) == obj
+    assert serialization.dumps(obj) == payload
+    assert json.loads(payload) == obj
+
+
+def test_dumps() -> None:
+    """Test the serialization of the edge cases."""
+    assert serialization.dumps({"text": "Héllo", "words": [1, 2.5, None]}) == (
+        '{"text":"Héllo","words":[1,2.5,null]}'.encode("utf-8")
+    )
+    assert serialization.dumps({1: "a"}) == b'{"1":"a"}'
+    assert serialization.dumps(2**70) == str(2**70).encode()
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_format(use_orjson: bool, monkeypatch) -> None:
+    """Test both backends write the same compact UTF-8 JSON bytes."""
+    if not use_orjson:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    obj = {"transcript": ["SPEAKER A: 你好, Ünïcode ✓"], "score": 0.5}
+    payload = serialization.dumps(obj)
+    assert isinstance(payload, bytes)
+    assert payload == json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+        "utf-8"
+    )
+    assert json.loads(payload) == obj
+
+    nan = float("nan")
+    assert serialization.dumps({"start": nan, "end": [float("inf"), 1.0]}) == (
+        b'{"start":null,"end":[null,1.0]}'
+    )
+    assert serialization.dumps((nan, {1: -float("inf")})) == b'[null,{"1":null}]'
+
+    circular: list = []
+    circular.append(circular)
+    with pytest.raises((TypeError, ValueError)):
+        serialization.dumps(circular)
+
+
+def test_loads() -> None:
+    """Test the deserialization of the input types."""
+    assert serialization.loads('{"a": 1}') == {"a": 1}
+    assert serialization.loads(b'{"a": 1}') == {"a": 1}
+    assert serialization.loads(memoryview(b"[1]")) == [1]
+
+    with pytest.raises(ValueError):
+        serialization.loads(b"{")
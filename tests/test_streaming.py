@@ -0,0 +1,182 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the streaming request bodies."""
+
+import asyncio
+import io
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import responses
+from wordcab.core_objects import AudioSource
+from wordcab.streaming import (
+    MultipartStream,
+    UploadStream,
+    download_to_spooled_file,
+    stream_headers,
+)
+
+
+def test_upload_stream_path(tmp_path: Path) -> None:
+    """Test a file is read in chunks and can be replayed."""
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"0123456789")
+
+    body = UploadStream(str(path), chunk_size=4)
+
+    assert body.length == body.len == 10
+    assert list(body) == [b"0123", b"4567", b"89"]
+    assert b"".join(body) == b"0123456789"
+    assert stream_headers(body) == {"Content-Length": "10"}
+
+
+def test_upload_stream_fileobj() -> None:
+    """Test a seekable file object is rewound before each iteration."""
+    fileobj = io.BytesIO(b"headerpayload")
+    fileobj.seek(6)
+
+    body = UploadStream(fileobj, chunk_size=3)
+
+    assert body.length == 7
+    assert b"".join(body) == b"payload"
+    assert b"".join(body) == b"payload"
+
+
+def test_upload_stream_iterator() -> None:
+    """Test an iterator is streamed once, with an unknown length."""
+    body = UploadStream(iter([b"ab", b"cd"]))
+
+    assert body.length is None
+    assert not hasattr(body, "len")
+    assert stream_headers(body) == {}
+    assert list(body) == [b"ab", b"cd"]
+    with pytest.raises(ValueError):
+        list(body)
+
+    with pytest.raises(TypeError):
+        UploadStream(b"not a stream")
+    with pytest.raises(ValueError):
+        UploadStream(iter([]), chunk_size=0)
+
+
+def test_upload_stream_async(tmp_path: Path) -> None:
+    """Test the chunks can be read from a coroutine."""
+    path = tmp_path / "audio.wav"
+    path.write_bytes(b"0123456789")
+    body = UploadStream(path, chunk_size=4)
+
+    async def main() -> list:
+        return [chunk async for chunk in body.aiter_chunks()]
+
+    assert asyncio.run(main()) == [b"0123", b"4567", b"89"]
+
+
+def test_upload_stream_constant_memory(tmp_path: Path) -> None:
+    """Test the memory used to stream a file doesn't grow with its size."""
+    path = tmp_path / "audio.wav"
+    with open(path, "wb") as f:
+        for _ in range(64):
+            f.write(b"\0" * 256 * 1024)
+
+    tracemalloc.start()
+    size = sum(len(chunk) for chunk in UploadStream(path))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert size == 16 * 1024 * 1024
+    assert peak < 1024 * 1024
+
+
+def test_multipart_stream() -> None:
+    """Test the multipart encoding of a streamed file."""
+    body = MultipartStream(
+        "audio_file", "audio.wav", UploadStream(io.BytesIO(b"RIFF")), boundary="xyz"
+    )
+    content = b"".join(body)
+
+    assert body.content_type == "multipart/form-data; boundary=xyz"
+    assert body.length == len(content)
+    assert content == (
+        b'--xyz\r\nContent-Disposition: form-data; name="audio_file";'
+        b' filename="audio.wav"\r\nContent-Type: application/octet-stream\r\n\r\n'
+        b"RIFF\r\n--xyz--\r\n"
+    )
+
+
+def test_download_to_spooled_file(mock_server) -> None:
+    """Test a download is spooled to disk above the spool size."""
+    mock_server.add(
+        responses.GET,
+        "https://example.com/audio.wav",
+        body=b"x" * 1000,
+        headers={"Content-Length": "1000"},
+        status=200,
+    )
+    progress = []
+
+    spooled = download_to_spooled_file(
+        "https://example.com/audio.wav",
+        progress=lambda done, total: progress.append((done, total)),
+        spool_size=100,
+        chunk_size=256,
+    )
+
+    assert spooled._rolled
+    assert spooled.read() == b"x" * 1000
+    assert progress == [(256, 1000), (512, 1000), (768, 1000), (1000, 1000)]
+    spooled.seek(0)
+    assert UploadStream(spooled).length == 1000
+    spooled.close()
+
+
+def test_download_to_spooled_file_errors(mock_server) -> None:
+    """Test the size limit and the HTTP errors."""
+    mock_server.add(
+        responses.GET, "https://example.com/large.wav", body=b"x" * 1000, status=200
+    )
+    mock_server.add(
+        responses.GET,
+        "https://example.com/announced.wav",
+        headers={"Content-Length": "1000"},
+        status=200,
+    )
+    mock_server.add(responses.GET, "https://example.com/missing.wav", status=404)
+
+    with pytest.raises(ValueError, match="limit"):
+        download_to_spooled_file("https://example.com/large.wav", max_size=999)
+    with pytest.raises(ValueError, match="limit"):
+        download_to_spooled_file("https://example.com/announced.wav", max_size=999)
+    with pytest.raises(ValueError, match="404"):
+        download_to_spooled_file("https://example.com/missing.wav")
+
+
+def test_audio_source_remote_stream(mock_server) -> None:
+    """Test a remote audio file is downloaded then streamed."""
+    mock_server.add(
+        responses.GET, "https://example.com/audio.wav", body=b"RIFF" * 10, status=200
+    )
+
+    with pytest.raises(ValueError):
+        AudioSource(url="https://example.com/audio.wav", stream=True)
+
+    audio_source = AudioSource(
+        url="https://example.com/audio.wav", download=True, stream=True
+    )
+    assert audio_source.file_object is None
+    body = audio_source.prepare_stream()
+    assert b"".join(body) == b"RIFF" * 10
+    body.close()
+    assert body.source.closed
@@ -0,0 +1,164 @@
+# Copyright 2022-2023 The Wordcab Team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test suite for the resumable chunked uploads."""
+
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+import responses
+from wordcab import Client
+from wordcab.async_client import AsyncClient
+from wordcab.core_objects import AudioSource, TranscribeJob
+from wordcab.retry import RetryPolicy
+from wordcab.testing import LocalUploadServer
+from wordcab.upload import plan_parts, read_part
+
+
+@pytest.fixture
+def audio_file(tmp_path: Path) -> Path:
+    """Fixture for a local audio file of 10 parts of 1 KiB."""
+    path = tmp_path / "long.wav"
+    path.write_bytes(os.urandom(10 * 1024))
+    return path
+
+
+@pytest.fixture
+def upload_server():
+    """Fixture for a local upload server."""
+    with LocalUploadServer() as server:
+        yield server
+
+
+def test_plan_parts(audio_file: Path) -> None:
+    """Test a file is split into parts covering it entirely."""
+    parts = plan_parts(2500, part_size=1000)
+    assert [(p.number, p.offset, p.size) for p in parts] == [
+        (1, 0, 1000),
+        (2, 1000, 1000),
+        (3, 2000, 500),
+    ]
+    assert len(plan_parts(0)) == 1
+    with pytest.raises(ValueError):
+        plan_parts(10, part_size=0)
+
+    part = plan_parts(10 * 1024, part_size=1024)[3]
+    assert read_part(audio_file, part) == audio_file.read_bytes()[3072:4096]
+    assert len(part.checksum) == 64
+
+
+def test_chunked_source_validation(audio_file: Path) -> None:
+    """Test only local files can be uploaded in chunks."""
+    assert AudioSource(filepath=audio_file, chunked=True).stream is True
+    with pytest.raises(ValueError):
+        AudioSource(url="https://example.com/audio.wav", chunked=True)
+
+    with pytest.raises(ValueError):
+        Client(api_key="dummy_api_key").upload_audio(AudioSource(filepath=audio_file))
+
+
+def test_upload_audio(audio_file: Path, upload_server: LocalUploadServer) -> None:
+    """Test a file is uploaded in parts and assembled."""
+    source = AudioSource(filepath=audio_file, chunked=True)
+
+    with Client(api_key="dummy_api_key", base_url=upload_server.base_url) as client:
+        upload = client.upload_audio(source, part_size=1024, max_workers=4)
+
+    assert upload.upload_id == source.upload_id
+    assert upload.size == 10 * 1024
+    assert upload.uploaded_parts == 10
+    assert upload.url.endswith(f"/uploads/{upload.upload_id}/file")
+    assert upload_server.files[upload.upload_id] == audio_file.read_bytes()
+
+
+def test_upload_audio_resume(audio_file: Path) -> None:
+    """Test a failed upload resumes from the parts already received."""
+    source = AudioSource(filepath=audio_file, chunked=True)
+
+    with LocalUploadServer(fail_parts={7: 1}) as server:
+        with Client(
+            api_key="dummy_api_key",
+            base_url=server.base_url,
+            retry_policy=RetryPolicy(max_attempts=1),
+        ) as client:
+            with pytest.raises(ValueError, match="resume"):
+                client.upload_audio(source, part_size=1024)
+            assert source.upload_id is not None
+            assert len(server.received) == 9
+
+            upload = client.upload_audio(source, part_size=1024)
+
+        assert upload.uploaded_parts == 1
+        assert server.received[-1] == (source.upload_id, 7)
+        assert server.files[source.upload_id] == audio_file.read_bytes()
+
+
+def test_upload_audio_retries_parts(audio_file: Path) -> None:
+    """Test a rejected part is retried by the retry policy."""
+    source = AudioSource(filepath=audio_file, chunked=True)
+
+    with LocalUploadServer(fail_parts={2: 1, 5: 1}) as server:
+        with Client(
+            api_key="dummy_api_key",
+            base_url=server.base_url,
+            retry_policy=RetryPolicy(base_delay=0),
+        ) as client:
+            upload = client.upload_audio(source, part_size=1024)
+
+        assert upload.uploaded_parts == 10
+        assert server.files[upload.upload_id] == audio_file.read_bytes()
+
+
+def test_start_transcription_chunked(
+    audio_file: Path, upload_server: LocalUploadServer, mock_server
+) -> None:
+    """Test start_transcription sends the URL of a chunked upload."""
+    mock_server.add_passthru(upload_server.base_url)
+    mock_server.add(
+        responses.POST,
+        f"{upload_server.base_url}/transcribe",
+        json={"job_name": "job_12345"},
+        status=201,
+    )
+    source = AudioSource(filepath=audio_file, chunked=True)
+
+    with Client(api_key="dummy_api_key", base_url=upload_server.base_url) as client:
+        job = client.start_transcription(
+            source_object=source, display_name="test", source_lang="en"
+        )
+
+    assert isinstance(job, TranscribeJob)
+    request = mock_server.calls[-1].request
+    assert request.body is None
+    assert request.params["url_type"] == "audio_url"
+    assert request.params["url"] == (
+        f"{upload_server.base_url}/uploads/{source.upload_id}/file"
+    )
+
+
+def test_async_upload_audio(audio_file: Path, upload_server: LocalUploadServer) -> None:
+    """Test the async client uploads the parts concurrently."""
+    source = AudioSource(filepath=audio_file, chunked=True)
+
+    async def main():
+        async with AsyncClient(
+            api_key="dummy_api_key", base_url=upload_server.base_url
+        ) as client:
+            return await client.upload_audio(source, part_size=1024, max_workers=3)
+
+    upload = asyncio.run(main())
+    assert upload.uploaded_parts == 10
+    assert upload_server.files[upload.upload_id] == audio_file.read_bytes()
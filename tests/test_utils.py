@@ -28,6 +28,7 @@ from wordcab.utils import (
     _format_tags,
     _is_youtube_link,
     format_deepgram_source,
+    iter_deepgram_source,
 )
 
 
@@ -153,6 +154,43 @@ def test_format_deepgram_source_valid() -> None:
     assert format_deepgram_source(deepgram_json) == expected_output
 
 
+def test_format_deepgram_source_merge() -> None:
+    """Test the consecutive utterances of a speaker are merged."""
+    utterances = [
+        {"speaker": 0, "transcript": "Hello."},
+        {"speaker": 0, "transcript": "Hi."},
+        {"speaker": 1, "transcript": "Hello."},
+        {"speaker": 0, "transcript": "Hello."},
+        {"speaker": 1, "transcript": "Hello."},
+    ]
+    deepgram_json = {"results": {"utterances": utterances}}
+    assert format_deepgram_source(deepgram_json) == [
+        "SPEAKER A: Hello. Hi.",
+        "SPEAKER B: Hello.",
+        "SPEAKER A: Hello.",
+        "SPEAKER B: Hello.",
+    ]
+    assert format_deepgram_source({"results": {"utterances": []}}) == []
+
+
+def test_iter_deepgram_source() -> None:
+    """Test the merged utterances are yielded lazily."""
+    deepgram_json = {
+        "results": {
+            "utterances": [
+                {"speaker": 0, "transcript": "Hello."},
+                {"speaker": 1, "transcript": "Hi."},
+                {"speaker": 2},
+            ]
+        }
+    }
+    lines = iter_deepgram_source(deepgram_json)
+    assert next(lines) == "SPEAKER A: Hello."
+    assert next(lines) == "SPEAKER B: Hi."
+    with pytest.raises(KeyError):
+        next(lines)
+
+
 @pytest.mark.parametrize(
     "youtube_url",
     [